@@ -1,45 +1,65 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, BooleanVar
 import os
-import yt_dlp
 import threading
+from functools import lru_cache
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
 import pyperclip
-import pystray
-from pystray import MenuItem as item
-from PIL import Image, ImageTk, ImageSequence, ImageDraw
+from PIL import Image, ImageTk, ImageDraw
 import sys
 import platform
 import re
 from pathlib import Path
 from urllib.parse import urlparse
-import validators
-import yt_dlp.postprocessor.ffmpeg
 import queue
+from collections import deque
 import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import zipfile
-import tempfile
+import mmap
 import subprocess
 import time
 import ssl
 import certifi
-import io
 import traceback
+import importlib.util
 
 # Platform detection
+# yt-dlp takes a noticeable time to import, so load it in the background while
+# the window is built; code that needs it calls wait_for_yt_dlp() first
+yt_dlp = None
+_yt_dlp_ready = threading.Event()
+
+def _preload_yt_dlp():
+    """Import yt-dlp (including the FFmpeg postprocessor) off the main thread."""
+    global yt_dlp
+    try:
+        import yt_dlp.postprocessor.ffmpeg
+    finally:
+        _yt_dlp_ready.set()
+
+def wait_for_yt_dlp():
+    """Block until the background yt-dlp import has finished."""
+    _yt_dlp_ready.wait()
+    if yt_dlp is None:
+        raise ImportError("yt-dlp could not be imported")
+
+threading.Thread(target=_preload_yt_dlp, daemon=True).start()
+
 IS_WINDOWS = platform.system() == "Windows"
 IS_LINUX = platform.system() == "Linux"
 IS_MAC = platform.system() == "Darwin"
 
 # Windows-specific imports (optional)
 if IS_WINDOWS:
-    try:
-        import win32com.client
-        WIN32COM_AVAILABLE = True
-    except ImportError:
-        WIN32COM_AVAILABLE = False
+    # win32com is only probed here, not loaded; import it where it is used
+    WIN32COM_AVAILABLE = importlib.util.find_spec("win32com") is not None
     try:
         import winreg
         WINREG_AVAILABLE = True
@@ -55,43 +75,48 @@ else:
     WINREG_AVAILABLE = False
     CTYPES_AVAILABLE = False
 
-# Debug mode - set to True to enable detailed console output
-DEBUG_MODE = True
+# Debug mode - set the MDL_DEBUG environment variable to enable detailed console output
+DEBUG_MODE = bool(os.environ.get("MDL_DEBUG"))
+
+def dprint(msg, *args):
+    """Print a debug message; arguments are %-formatted only when DEBUG_MODE is on."""
+    if DEBUG_MODE:
+        print(msg % args if args else msg)
 
 # Set up debugging and error handling
 def setup_debugging():
     """Configure debugging and error handling"""
     # Print system information
-    print("\n=== SYSTEM INFORMATION ===")
-    print(f"Python version: {sys.version}")
-    print(f"Operating system: {sys.platform}")
-    print(f"Current directory: {os.getcwd()}")
+    dprint("\n=== SYSTEM INFORMATION ===")
+    dprint("Python version: %s", sys.version)
+    dprint("Operating system: %s", sys.platform)
+    dprint("Current directory: %s", os.getcwd())
     
     try:
-        print(f"yt-dlp version: {yt_dlp.version.__version__}")
+        if DEBUG_MODE:
+            wait_for_yt_dlp()
+            dprint("yt-dlp version: %s", yt_dlp.version.__version__)
     except Exception as e:
-        print(f"Error getting yt-dlp version: {e}")
+        dprint("Error getting yt-dlp version: %s", e)
     
     # Check for required modules (platform-specific)
     required_modules = [
         "tkinter", "PIL", "yt_dlp", "pyperclip", "pystray", 
-        "validators", "requests"
+        "requests"
     ]
     if IS_WINDOWS:
         required_modules.append("win32com")
     
-    print("\n=== MODULE CHECKS ===")
+    dprint("\n=== MODULE CHECKS ===")
     for module_name in required_modules:
+        # find_spec only locates the module, so checking doesn't import it
         try:
-            module = __import__(module_name)
-            if hasattr(module, "__version__"):
-                print(f"{module_name}: OK (version {module.__version__})")
+            if importlib.util.find_spec(module_name) is not None:
+                dprint("%s: OK", module_name)
             else:
-                print(f"{module_name}: OK")
-        except ImportError as e:
-            print(f"{module_name}: MISSING - {e}")
+                dprint("%s: MISSING", module_name)
         except Exception as e:
-            print(f"{module_name}: ERROR - {e}")
+            dprint("%s: ERROR - %s", module_name, e)
     
     # Set up global exception handler
     def global_exception_handler(exc_type, exc_value, exc_traceback):
@@ -113,7 +138,7 @@ def setup_debugging():
     
     # Install the exception handler
     sys.excepthook = global_exception_handler
-    print("\n=== DEBUG SETUP COMPLETE ===\n")
+    dprint("\n=== DEBUG SETUP COMPLETE ===\n")
 
 # Run debugging setup
 setup_debugging()
@@ -150,7 +175,8 @@ elif IS_LINUX:
     INSTALL_DIR = Path.home() / ".local" / "share" / "Media Downloader"
 else:  # macOS
     INSTALL_DIR = Path.home() / "Library" / "Application Support" / "Media Downloader"
-INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+if not INSTALL_DIR.exists():
+    INSTALL_DIR.mkdir(parents=True, exist_ok=True)
 
 # Cross-platform output directories
 if IS_WINDOWS:
@@ -166,6 +192,11 @@ video_output_dir.mkdir(parents=True, exist_ok=True)
 audio_output_dir.mkdir(parents=True, exist_ok=True)
 playlist_output_dir.mkdir(parents=True, exist_ok=True)
 
+# yt-dlp output templates; the directories are fixed for the life of the process
+OUTTMPL_PLAYLIST = str(playlist_output_dir / '%(playlist_index)s_%(title)s.%(ext)s')
+OUTTMPL_AUDIO = str(audio_output_dir / '%(title)s.%(ext)s')
+OUTTMPL_VIDEO = str(video_output_dir / '%(title)s.%(ext)s')
+
 # Auto-update configuration
 REPO_OWNER = "needyamin"
 REPO_NAME = "media-downloader"
@@ -173,90 +204,241 @@ CURRENT_VERSION = "1.0.15"
 GITHUB_API_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/releases/latest"
 UPDATE_CHECK_FILE = INSTALL_DIR / "last_update_check.txt"
 
+# Release asset types per platform, in order of preference
+if IS_WINDOWS:
+    UPDATE_ASSET_EXTENSIONS = ('.exe',)
+elif IS_LINUX:
+    UPDATE_ASSET_EXTENSIONS = ('.appimage', '.deb')
+else:  # macOS
+    UPDATE_ASSET_EXTENSIONS = ('.dmg', '.app')
+
+@dataclass(slots=True)
+class Release:
+    """A GitHub release, parsed once: normalized version and this platform's asset."""
+    version: str
+    asset: dict | None
+    raw: dict
+
+    @classmethod
+    def from_json(cls, release):
+        # Index assets by extension in one pass, then pick the platform's preferred type
+        assets_by_ext = {}
+        for asset in release.get('assets', []):
+            name_lower = asset.get('name', '').lower()
+            if DEBUG_MODE:
+                dprint("Asset: %s (%s)", asset.get('name'), asset.get('content_type'))
+            if '.' in name_lower:
+                assets_by_ext.setdefault('.' + name_lower.rpartition('.')[2], asset)
+        asset = next((assets_by_ext[ext] for ext in UPDATE_ASSET_EXTENSIONS if ext in assets_by_ext), None)
+        return cls(version=release.get('tag_name', '').lstrip('v'), asset=asset, raw=release)
+
+# Shared HTTP session so GitHub API calls and FFmpeg downloads reuse pooled
+# keep-alive connections instead of a fresh TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+_SESSION.verify = certifi.where()
+_SESSION.headers['User-Agent'] = f'Yamin-media-downloader/{CURRENT_VERSION}'
+# Sent on GitHub API calls only; asset/zip downloads keep the default Accept
+GITHUB_API_HEADERS = {'Accept': 'application/vnd.github.v3+json'}
+
+# Release metadata is revalidated with ETag/Last-Modified so an unchanged
+# release costs a 304 header exchange instead of the full JSON payload
+RELEASE_CACHE_FILE = INSTALL_DIR / "release_cache.json"
+_RELEASE_CACHE_LOCK = threading.Lock()
+
+def _load_release_cache():
+    """Load cached release metadata, keyed by API URL."""
+    try:
+        with open(RELEASE_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_release_cache(cache):
+    """Persist cached release metadata."""
+    try:
+        with open(RELEASE_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def fetch_release(url, headers=None):
+    """Fetch release JSON with a conditional request.
+
+    Returns (response, release). On HTTP 304 the release is the cached body;
+    on any other non-200 status it is None.
+    """
+    headers = {**GITHUB_API_HEADERS, **(headers or {})}
+    with _RELEASE_CACHE_LOCK:
+        cached = _load_release_cache().get(url)
+    if cached and cached.get('body') is not None:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    response = _SESSION.get(url, headers=headers, timeout=(5, 10))
+    if response.status_code == 304 and cached:
+        return response, cached['body']
+    if response.status_code != 200:
+        return response, None
+    
+    release = response.json()
+    with _RELEASE_CACHE_LOCK:
+        cache = _load_release_cache()
+        cache[url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': release,
+        }
+        _save_release_cache(cache)
+    return response, release
+
 # Add a force check flag to check for updates regardless of the time since last check
 FORCE_UPDATE_CHECK = False
 
+# Last update-check result, reused for UPDATE_CACHE_TTL seconds so repeated
+# menu clicks don't hit the GitHub API again
+UPDATE_CACHE_TTL = 60
+_UPDATE_CACHE = {'ts': 0, 'result': None}
+_UPDATE_CACHE_LOCK = threading.Lock()
+
+# Lazily imported modules (only needed once the tray icon is created)
+_pystray = None
+
+def _get_pystray():
+    """Import pystray on first use."""
+    global _pystray
+    if _pystray is None:
+        import pystray as _pystray
+    return _pystray
+
 # Global variables
 ffmpeg_path = None
+_ffmpeg_present = False  # ffmpeg_path known to exist; reset when download_ffmpeg runs
 early_log_queue = queue.Queue()
-loading_gif = None
+loading_frames = None  # Pre-rendered PhotoImage frames of the loading spinner
+loading_frame_index = 0
+loading_thread = None
 loading_label = None
 quality_settings = {
     'video_quality': 'best',  # best, 1080p, 720p, 480p, 360p
     'audio_quality': '320',   # 320, 256, 192, 128, 96
-    'format': 'mp4'          # mp4, webm, mkv
+    'format': 'mp4',         # mp4, webm, mkv
+    'fragment_workers': 4    # parallel fragment downloads for DASH/HLS
 }
 
+FFMPEG_VERIFIED_FILE = INSTALL_DIR / "ffmpeg_verified.json"
+
+def _ffmpeg_fingerprint(path):
+    """Return a cheap (mtime_ns, size) fingerprint for a binary."""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def _load_ffmpeg_verified():
+    """Load the cached fingerprints of the last verified FFmpeg binaries."""
+    try:
+        with open(FFMPEG_VERIFIED_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_ffmpeg_verified(ffmpeg_path, ffprobe_path):
+    """Remember the fingerprints of binaries that passed verification."""
+    try:
+        with open(FFMPEG_VERIFIED_FILE, 'w') as f:
+            json.dump({
+                'ffmpeg_path': str(ffmpeg_path),
+                'ffmpeg': _ffmpeg_fingerprint(ffmpeg_path),
+                'ffprobe_path': str(ffprobe_path),
+                'ffprobe': _ffmpeg_fingerprint(ffprobe_path),
+            }, f)
+    except OSError:
+        pass
+
+# Subprocess flags for the FFmpeg probes, computed once (no console window on Windows)
+SUBPROCESS_FLAGS = {'creationflags': subprocess.CREATE_NO_WINDOW} if IS_WINDOWS else {}
+_VERSION_PROBE_ARGS = ('-hide_banner', '-loglevel', 'quiet', '-version')
+
+def _probe_version(binary_path):
+    """Run `<binary> -version` quietly and return its exit code."""
+    return subprocess.call([binary_path, *_VERSION_PROBE_ARGS],
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL,
+                           **SUBPROCESS_FLAGS)
+
 def verify_ffmpeg(ffmpeg_path, ffprobe_path):
     """Verify that FFmpeg and FFprobe are working."""
     try:
-        print(f"\n=== FFMPEG VERIFICATION ===")
-        print(f"FFmpeg path: {ffmpeg_path}")
-        print(f"FFprobe path: {ffprobe_path}")
+        dprint("\n=== FFMPEG VERIFICATION ===")
+        dprint("FFmpeg path: %s", ffmpeg_path)
+        dprint("FFprobe path: %s", ffprobe_path)
         
         if not ffmpeg_path or not ffprobe_path:
             log("FFmpeg path or FFprobe path is empty")
-            print("FFmpeg or FFprobe path is empty")
+            dprint("FFmpeg or FFprobe path is empty")
             return False
             
         if not os.path.exists(ffmpeg_path) or not os.path.exists(ffprobe_path):
             log(f"FFmpeg or FFprobe executable not found at: {ffmpeg_path} or {ffprobe_path}")
-            print(f"FFmpeg file exists: {os.path.exists(ffmpeg_path)}")
-            print(f"FFprobe file exists: {os.path.exists(ffprobe_path)}")
+            dprint("FFmpeg file exists: %s", os.path.exists(ffmpeg_path))
+            dprint("FFprobe file exists: %s", os.path.exists(ffprobe_path))
             return False
-            
-        # Cross-platform subprocess flags
-        subprocess_kwargs = {}
-        if IS_WINDOWS:
-            subprocess_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-        else:
-            subprocess_kwargs['stdout'] = subprocess.DEVNULL
-            subprocess_kwargs['stderr'] = subprocess.DEVNULL
         
+        # Skip spawning the binaries if they are unchanged since the last successful check
+        cached = _load_ffmpeg_verified()
+        if (cached.get('ffmpeg_path') == str(ffmpeg_path)
+                and cached.get('ffprobe_path') == str(ffprobe_path)
+                and cached.get('ffmpeg') == _ffmpeg_fingerprint(ffmpeg_path)
+                and cached.get('ffprobe') == _ffmpeg_fingerprint(ffprobe_path)):
+            log("FFmpeg verified (cached)")
+            dprint("FFmpeg binaries unchanged since last verification, skipping probe")
+            return True
+            
         # Check FFmpeg
         log(f"Testing FFmpeg at: {ffmpeg_path}")
-        print(f"Testing FFmpeg execution...")
-        result = subprocess.run([ffmpeg_path, '-version'], 
-                              capture_output=True, 
-                              text=True,
-                              **subprocess_kwargs)
-        if result.returncode != 0:
-            log(f"FFmpeg test failed with return code: {result.returncode}")
-            log(f"Error: {result.stderr}")
-            print(f"FFmpeg test failed with return code: {result.returncode}")
-            print(f"Error: {result.stderr}")
+        dprint("Testing FFmpeg execution...")
+        returncode = _probe_version(ffmpeg_path)
+        if returncode != 0:
+            log(f"FFmpeg test failed with return code: {returncode}")
+            dprint("FFmpeg test failed with return code: %s", returncode)
             return False
         else:
             log("FFmpeg test successful")
-            print(f"FFmpeg version: {result.stdout.splitlines()[0] if result.stdout else 'Unknown'}")
             
         # Check FFprobe
         log(f"Testing FFprobe at: {ffprobe_path}")
-        print(f"Testing FFprobe execution...")
-        result = subprocess.run([ffprobe_path, '-version'], 
-                              capture_output=True, 
-                              text=True,
-                              **subprocess_kwargs)
-        if result.returncode != 0:
-            log(f"FFprobe test failed with return code: {result.returncode}")
-            log(f"Error: {result.stderr}")
-            print(f"FFprobe test failed with return code: {result.returncode}")
-            print(f"Error: {result.stderr}")
+        dprint("Testing FFprobe execution...")
+        returncode = _probe_version(ffprobe_path)
+        if returncode != 0:
+            log(f"FFprobe test failed with return code: {returncode}")
+            dprint("FFprobe test failed with return code: %s", returncode)
             return False
         else:
             log("FFprobe test successful")
-            print(f"FFprobe version: {result.stdout.splitlines()[0] if result.stdout else 'Unknown'}")
             
-        print("FFmpeg verification passed successfully")
+        _save_ffmpeg_verified(ffmpeg_path, ffprobe_path)
+        dprint("FFmpeg verification passed successfully")
         return True
     except Exception as e:
         log(f"Error verifying FFmpeg: {str(e)}")
-        print(f"Exception during FFmpeg verification: {str(e)}")
-        print(traceback.format_exc())
+        dprint("Exception during FFmpeg verification: %s", str(e))
+        dprint(traceback.format_exc())
         return False
 
+class _SeekableMmap(mmap.mmap):
+    """mmap that zipfile accepts as a file object (mmap.seekable only exists on 3.13+)."""
+    def seekable(self):
+        return True
+
 def download_ffmpeg():
     """Download and install FFmpeg."""
+    global _ffmpeg_present
+    _ffmpeg_present = False
     message_label = None
     try:
         # Create FFmpeg directory (cross-platform)
@@ -271,6 +453,19 @@ def download_ffmpeg():
             ffmpeg_exe = "ffmpeg"
             ffprobe_exe = "ffprobe"
         
+        # Prefer an explicit FFMPEG_BINARY override, then binaries already on PATH
+        # (they get system security updates and need no download at all)
+        override = os.environ.get("FFMPEG_BINARY")
+        if override:
+            sys_ffmpeg = override
+            sys_ffprobe = str(Path(override).parent / ffprobe_exe)
+        else:
+            sys_ffmpeg = shutil.which("ffmpeg")
+            sys_ffprobe = shutil.which("ffprobe")
+        if sys_ffmpeg and sys_ffprobe and verify_ffmpeg(sys_ffmpeg, sys_ffprobe):
+            log(f"Using system FFmpeg at {sys_ffmpeg}")
+            return sys_ffmpeg
+        
         # Check if FFmpeg is already installed and working
         ffmpeg_path = ffmpeg_dir / ffmpeg_exe
         ffprobe_path = ffmpeg_dir / ffprobe_exe
@@ -316,7 +511,8 @@ def download_ffmpeg():
                 log(f"Attempting to download FFmpeg from: {download_url}")
                 
                 # Download FFmpeg from GitHub
-                response = requests.get(download_url, stream=True, timeout=30)
+                response = _SESSION.get(download_url, stream=True, timeout=(5, 30),
+                                        headers={'Accept-Encoding': 'identity'})
                 response.raise_for_status()
                 
                 # Get total file size
@@ -342,42 +538,50 @@ def download_ffmpeg():
                 if message_label:
                     message_label.config(text="Extracting FFmpeg files...")
                 
-                # Extract the zip file
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(ffmpeg_dir)
-                
-                # Find the bin directory with ffmpeg and ffprobe executables
-                ffmpeg_exe_paths = list(ffmpeg_dir.glob(f"**/{ffmpeg_exe}"))
-                ffprobe_exe_paths = list(ffmpeg_dir.glob(f"**/{ffprobe_exe}"))
-                
-                if not ffmpeg_exe_paths or not ffprobe_exe_paths:
-                    log("FFmpeg executables not found in zip file")
-                    continue  # Try next URL
-                
-                # Get the first found executables
-                source_ffmpeg = ffmpeg_exe_paths[0]
-                source_ffprobe = ffprobe_exe_paths[0]
-                
-                log(f"Moving FFmpeg from {source_ffmpeg} to {ffmpeg_path}")
-                log(f"Moving FFprobe from {source_ffprobe} to {ffprobe_path}")
-                
-                # Move FFmpeg and FFprobe to the main directory
-                if ffmpeg_path.exists():
-                    ffmpeg_path.unlink()
-                if ffprobe_path.exists():
-                    ffprobe_path.unlink()
-                    
-                shutil.copy2(str(source_ffmpeg), str(ffmpeg_path))
-                shutil.copy2(str(source_ffprobe), str(ffprobe_path))
-                
-                # Clean up
+                # Extract only the executables (plus shared-build DLLs on Windows)
+                # instead of unpacking docs, presets and everything else
+                wanted = {ffmpeg_exe, ffprobe_exe}
+                extracted = set()
+                bin_dir = None
+                # Map the archive so zipfile's central-directory seeks hit the page cache
+                with open(zip_path, 'rb') as zip_file, \
+                        _SeekableMmap(zip_file.fileno(), 0, access=mmap.ACCESS_READ) as zip_map, \
+                        zipfile.ZipFile(zip_map, 'r') as zip_ref:
+                    for info in zip_ref.infolist():
+                        if info.is_dir():
+                            continue
+                        entry_dir, _, base = info.filename.rpartition('/')
+                        # Stop at the first hit: once both executables are out and
+                        # we've left their bin directory, nothing else is needed
+                        if wanted <= extracted and entry_dir != bin_dir:
+                            break
+                        if base in wanted and base not in extracted:
+                            bin_dir = entry_dir
+                        elif not (IS_WINDOWS and base.lower().endswith('.dll')
+                                  and (bin_dir is None or entry_dir == bin_dir)):
+                            continue
+                        # Write next to the target and rename into place so an
+                        # interrupted install never leaves a torn binary behind
+                        part_path = ffmpeg_dir / (base + '.part')
+                        with zip_ref.open(info) as src, open(part_path, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, 1 << 20)
+                        if not IS_WINDOWS:
+                            os.chmod(part_path, 0o755)
+                        os.replace(part_path, ffmpeg_dir / base)
+                        extracted.add(base)
+
+                # Drop the archive as soon as the binaries are out
                 try:
                     zip_path.unlink()
-                    for item in ffmpeg_dir.glob("*"):
-                        if item.is_dir() and item.name != "bin" and item != ffmpeg_path.parent and item != ffprobe_path.parent:
-                            shutil.rmtree(item)
-                except:
+                except OSError:
                     pass  # Ignore cleanup errors
+
+                if not wanted <= extracted:
+                    log("FFmpeg executables not found in zip file")
+                    continue  # Try next URL
+
+                log(f"Extracted FFmpeg to {ffmpeg_path}")
+                log(f"Extracted FFprobe to {ffprobe_path}")
                 
                 # Verify installation
                 if verify_ffmpeg(str(ffmpeg_path), str(ffprobe_path)):
@@ -405,17 +609,20 @@ def download_ffmpeg():
 
 def show_loading(message="Loading..."):
     """Show a loading animation with a message."""
-    global loading_gif, loading_label
+    global loading_label, loading_thread
     try:
-        if loading_gif is None:
-            loading_gif = create_loading_icon()
-        
         if loading_label is None:
-            loading_label = tk.Label(root, bg=THEME['bg'])
+            loading_label = tk.Label(root, bg=THEME['bg'], compound='left')
             loading_label.place(relx=0.5, rely=0.5, anchor='center')
         
         loading_label.config(text=message)
-        update_loading_animation()
+        if loading_frames is None:
+            # Render the spinner frames with PIL off the Tk thread (only once)
+            if loading_thread is None:
+                loading_thread = threading.Thread(target=build_loading_frames, daemon=True)
+                loading_thread.start()
+        else:
+            queue_ui(update_loading_animation)
         return loading_label
     except:
         return None
@@ -432,15 +639,38 @@ def hide_loading(label=None):
     except:
         pass
 
-def create_progress_hook():
-    """Create a progress hook for yt-dlp."""
-    def progress_hook(d):
-        if download_cancelled:
-            # Raise an exception to stop the download
-            raise yt_dlp.utils.DownloadError("Download cancelled by user")
+def create_progress_hook(cancel_event):
+    """Create a progress hook for yt-dlp that stops once cancel_event is set."""
+    # yt-dlp calls the hook for every received chunk; only push a UI update
+    # every 100 ms and only log when the integer percentage changes
+    last_ts = [0.0]
+    last_logged = [-1]
+    last_title = [None]
+    wait_for_yt_dlp()
+
+    # Bind the names used on every callback as locals (LOAD_FAST)
+    def progress_hook(d, _cancelled=cancel_event.is_set, _post=post_ui,
+                      _log=log, _update=update_progress, _monotonic=time.monotonic,
+                      _DownloadCancelled=yt_dlp.utils.DownloadCancelled):
+        if _cancelled():
+            # yt-dlp calls the hook between chunks and re-raises this, so
+            # cancellation stops the download cooperatively
+            raise _DownloadCancelled("Download cancelled by user")
+        
+        # The title comes from the info_dict of the first callback per item
+        title = d.get('info_dict', {}).get('title')
+        if title and title != last_title[0]:
+            last_title[0] = title
+            _log(f"? Downloading: {title}")
             
-        if d['status'] == 'downloading':
+        status = d['status']
+        if status == 'downloading':
             try:
+                now = _monotonic()
+                if now - last_ts[0] < 0.1:
+                    return
+                last_ts[0] = now
+
                 # Calculate download progress
                 total = d.get('total_bytes', 0) or d.get('total_bytes_estimate', 0)
                 downloaded = d.get('downloaded_bytes', 0)
@@ -456,25 +686,39 @@ def create_progress_hook():
                     else:
                         message = f"Downloading: {percent:.1f}%"
                     
-                    # Update progress bar and label through the UI queue
-                    ui_queue.put(lambda: update_progress(percent, message))
-                    log(message)
+                    # Update progress bar and label on the Tk thread
+                    _post(_update, percent, message)
+                    if int(percent) != last_logged[0]:
+                        last_logged[0] = int(percent)
+                        _log(message)
             except Exception as e:
-                log(f"Progress error: {str(e)}")
+                _log(f"Progress error: {str(e)}")
         
-        elif d['status'] == 'finished':
-            if not download_cancelled:
-                ui_queue.put(lambda: update_progress(100, "Download complete! Processing..."))
-                log("Download complete! Processing video...")
+        elif status == 'finished':
+            if not _cancelled():
+                _post(_update, 100, "Download complete! Processing...")
+                _log("Download complete! Processing video...")
         
-        elif d['status'] == 'error':
-            if not download_cancelled:
+        elif status == 'error':
+            if not _cancelled():
                 error_msg = d.get('error', 'Unknown error')
-                ui_queue.put(lambda: update_progress(0, f"Error occurred: {error_msg}"))
-                log(f"Download error: {error_msg}")
+                _post(_update, 0, f"Error occurred: {error_msg}")
+                _log(f"Download error: {error_msg}")
     
     return progress_hook
 
+def create_postprocessor_hook(cancel_event):
+    """Create a yt-dlp postprocessor hook that stops once cancel_event is set."""
+    wait_for_yt_dlp()
+
+    # Called as each FFmpeg step starts and finishes, so a cancel lands
+    # before the next conversion instead of after all of them
+    def postprocessor_hook(d):
+        if cancel_event.is_set():
+            raise yt_dlp.utils.DownloadCancelled("Download cancelled by user")
+
+    return postprocessor_hook
+
 def is_auto_start_enabled():
     """Check if the application is set to start automatically"""
     if IS_WINDOWS and WINREG_AVAILABLE:
@@ -584,11 +828,7 @@ def debug_update_check():
         # Test GitHub API connection
         log(f"\nTesting GitHub API Connection:")
         try:
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'Yamin-media-downloader'
-            }
-            response = requests.get(GITHUB_API_URL, headers=headers)
+            response = _SESSION.get(GITHUB_API_URL, headers=GITHUB_API_HEADERS, timeout=(5, 10))
             log(f"API Response Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -632,50 +872,57 @@ root.update()  # Force window to appear
 video_quality_var = tk.StringVar(value='best')
 audio_quality_var = tk.StringVar(value='320')
 format_var = tk.StringVar(value='mp4')
+fragment_workers_var = tk.IntVar(value=quality_settings['fragment_workers'])
 
 # Create auto-start variable
 auto_start_var = tk.BooleanVar(value=is_auto_start_enabled())
 
-def update_quality_settings(quality_type, value):
-    """Update quality settings and log the change."""
-    global quality_settings
-    if quality_type in quality_settings:
-        quality_settings[quality_type] = value
-        log(f"Updated {quality_type} to: {value}")
+def _make_quality_trace(key, var):
+    """Build a variable trace that stores the new value of a quality setting."""
+    def _on_change(*args):
+        value = var.get()
+        quality_settings[key] = value
+        log(f"Updated {key} to: {value}")
         # Update status label to show current settings
         if 'status_label' in globals():
-            status_label.config(text=f"Quality settings updated: {quality_type}={value}")
-
-def on_video_quality_change(*args):
-    value = video_quality_var.get()
-    quality_settings['video_quality'] = value
-    log(f"Video quality changed to: {value}")
-    update_quality_settings('video_quality', value)
-
-def on_audio_quality_change(*args):
-    value = audio_quality_var.get()
-    quality_settings['audio_quality'] = value
-    log(f"Audio quality changed to: {value}")
-    update_quality_settings('audio_quality', value)
-
-def on_format_change(*args):
-    value = format_var.get()
-    quality_settings['format'] = value
-    log(f"Format changed to: {value}")
-    update_quality_settings('format', value)
+            status_label.config(text=f"Quality settings updated: {key}={value}")
+    return _on_change
+
+video_quality_var.trace_add('write', _make_quality_trace('video_quality', video_quality_var))
+audio_quality_var.trace_add('write', _make_quality_trace('audio_quality', audio_quality_var))
+format_var.trace_add('write', _make_quality_trace('format', format_var))
+fragment_workers_var.trace_add('write', _make_quality_trace('fragment_workers', fragment_workers_var))
 
 def threaded_download(is_audio):
     """Start download in a separate thread."""
-    global current_download_thread
+    global current_download_thread, current_cancel_event
+    # One download at a time: a cancelled one keeps running until it notices
+    if current_download_thread is not None and current_download_thread.is_alive():
+        log("A download is still running")
+        return
+    # Settle the playlist question here on the Tk thread, before the worker starts
+    is_playlist = is_playlist_url(url_entry.get().strip())
+    if is_playlist and not download_playlist.get():
+        is_playlist = messagebox.askyesno("Playlist Detected", 
+            "This appears to be a playlist URL. Would you like to download the entire playlist?\n\n"
+            "If not, only the first video will be downloaded.")
+
+    cancel_event = threading.Event()
+
     def download_thread():
+        global current_download_thread
         try:
-            disable_buttons()
-            download_media(is_audio)
+            download_media(is_audio, is_playlist, cancel_event)
         finally:
-            enable_buttons()
+            # The buttons only come back once this download has really stopped
             current_download_thread = None
+            if cancel_event.is_set():
+                queue_ui(lambda: update_progress(0, "Download cancelled"))
+            queue_ui(enable_buttons)
     
     # Start the download in a new thread
+    disable_buttons()
+    current_cancel_event = cancel_event
     current_download_thread = threading.Thread(target=download_thread, daemon=True)
     current_download_thread.start()
 
@@ -737,19 +984,27 @@ def should_check_for_updates():
         log(f"Error checking update timestamp: {e}")
         return True
 
+_UPDATE_DIR_READY = False
+
 def update_check_timestamp():
     """Update the timestamp of last update check."""
+    global _UPDATE_DIR_READY
     try:
-        UPDATE_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(UPDATE_CHECK_FILE, 'w') as f:
-            f.write(str(time.time()))
+        if not _UPDATE_DIR_READY:
+            UPDATE_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _UPDATE_DIR_READY = True
+        # Write a temp file and rename it over the old one so the timestamp is never torn
+        tmp_file = UPDATE_CHECK_FILE.with_suffix('.tmp')
+        tmp_file.write_text(str(time.time()))
+        os.replace(tmp_file, UPDATE_CHECK_FILE)
     except:
         pass
 
+@lru_cache(maxsize=32)
 def compare_versions(v1, v2):
     """Compare two version strings and return True if v1 > v2."""
     try:
-        print(f"Comparing versions: '{v1}' > '{v2}'")
+        dprint("Comparing versions: '%s' > '%s'", v1, v2)
         # Ensure we have strings
         v1 = str(v1).strip()
         v2 = str(v2).strip()
@@ -791,55 +1046,71 @@ def compare_versions(v1, v2):
         v1_parts.extend([0] * (max_len - len(v1_parts)))
         v2_parts.extend([0] * (max_len - len(v2_parts)))
         
-        print(f"Parsed versions: {v1_parts} > {v2_parts}")
+        dprint("Parsed versions: %s > %s", v1_parts, v2_parts)
         
         # Do the comparison
         for i in range(max_len):
             if v1_parts[i] > v2_parts[i]:
-                print(f"Result: {v1} is newer than {v2}")
+                dprint("Result: %s is newer than %s", v1, v2)
                 return True
             elif v1_parts[i] < v2_parts[i]:
-                print(f"Result: {v1} is older than {v2}")
+                dprint("Result: %s is older than %s", v1, v2)
                 return False
                 
         # They're equal
-        print(f"Result: {v1} is the same as {v2}")
+        dprint("Result: %s is the same as %s", v1, v2)
         return False
     except Exception as e:
-        print(f"Error comparing versions: {e}")
+        dprint("Error comparing versions: %s", e)
         # If there's an error, assume the versions are the same
         return False
 
+# Worker pool for the startup update probes (app release + FFmpeg build)
+def _bring_to_front():
+    """Raise and focus the main window before showing a dialog."""
+    try:
+        root.deiconify()
+        root.lift()
+        root.focus_force()
+    except Exception:
+        pass
+
+update_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="update-check")
+background_futures = []
+
 def check_updates_on_startup():
     """Check for updates when the application starts"""
-    global FORCE_UPDATE_CHECK
     try:
-        # Ensure window is visible before showing any dialogs
-        try:
-            root.deiconify()
-            root.lift()
-            root.focus_force()
-        except:
-            pass
-        
         log("\n=== Update Check Process Started ===")
-        print("\n=== UPDATE CHECK PROCESS STARTED ===")
+        dprint("\n=== UPDATE CHECK PROCESS STARTED ===")
         
-        # Always check for application updates when manually initiated
+        # Run both GitHub probes concurrently so neither blocks the Tk thread
         log("Starting application update check...")
-        latest_release = check_for_updates()
+        app_future = update_executor.submit(check_for_updates)
+        log("Starting FFmpeg update check...")
+        ffmpeg_future = update_executor.submit(check_ffmpeg_update)
+        
+        # The FFmpeg check finishes on its own; keep a reference until it does
+        background_futures.append(ffmpeg_future)
+        ffmpeg_future.add_done_callback(background_futures.remove)
+        
+        # Hand the app-release result back to the Tk thread for the dialogs
+        app_future.add_done_callback(lambda future: queue_ui(lambda: handle_update_result(future)))
+    except Exception as e:
+        handle_update_error(e)
+
+def handle_update_result(future):
+    """Show the outcome of the application update check (Tk thread)."""
+    global FORCE_UPDATE_CHECK
+    try:
+        latest_release = future.result()
         
         if latest_release:
-            latest_version = latest_release.get('tag_name', '').lstrip('v')
+            latest_version = latest_release.version
             log(f"New version {latest_version} available!")
             
             # Ensure window is visible before showing dialog
-            try:
-                root.deiconify()
-                root.lift()
-                root.focus_force()
-            except:
-                pass
+            _bring_to_front()
             
             if messagebox.askyesno("Update Available", 
                                  f"Version {latest_version} is available. Would you like to update now?"):
@@ -851,258 +1122,396 @@ def check_updates_on_startup():
             if FORCE_UPDATE_CHECK:
                 # Only show the "no updates" message if the user manually checked
                 # Ensure window is visible
-                try:
-                    root.deiconify()
-                    root.lift()
-                    root.focus_force()
-                except:
-                    pass
+                _bring_to_front()
                 messagebox.showinfo("No Updates", "You have the latest version.")
             log("No updates available")
         
         # Always update the timestamp
         update_check_timestamp()
-            
-        # Check for FFmpeg updates (non-blocking)
-        def check_ffmpeg_async():
-            try:
-                log("Starting FFmpeg update check...")
-                check_ffmpeg_update()
-            except Exception as e:
-                log(f"Error checking FFmpeg updates: {e}")
-        
-        # Run FFmpeg check in background thread to avoid blocking
-        threading.Thread(target=check_ffmpeg_async, daemon=True).start()
         
         log("=== Update Check Process Completed ===\n")
-        print("=== UPDATE CHECK PROCESS COMPLETED ===\n")
+        dprint("=== UPDATE CHECK PROCESS COMPLETED ===\n")
         
     except Exception as e:
-        log(f"Error in update check process: {str(e)}")
-        print(f"Error in update check process: {str(e)}")
-        print(traceback.format_exc())
-        
-        if FORCE_UPDATE_CHECK:
-            # Show error message if user manually checked
-            try:
-                root.deiconify()
-                root.lift()
-                root.focus_force()
-            except:
-                pass
-            messagebox.showerror("Update Check Failed", 
-                               f"Failed to check for updates: {str(e)}\n\n"
-                               "Please check your internet connection.")
+        handle_update_error(e)
     
     # Reset force flag after check
     FORCE_UPDATE_CHECK = False
 
+def handle_update_error(e):
+    """Report a failed update check (Tk thread)."""
+    global FORCE_UPDATE_CHECK
+    log(f"Error in update check process: {str(e)}")
+    dprint("".join(traceback.format_exception(e)))
+    
+    if FORCE_UPDATE_CHECK:
+        # Show error message if user manually checked
+        _bring_to_front()
+        messagebox.showerror("Update Check Failed", 
+                           f"Failed to check for updates: {str(e)}\n\n"
+                           "Please check your internet connection.")
+    FORCE_UPDATE_CHECK = False
+
 def check_for_updates():
     """Check for updates on GitHub and return the latest version if available."""
+    requested_at = time.time()
+    with _UPDATE_CACHE_LOCK:
+        cached_at = _UPDATE_CACHE['ts']
+        # A check that finished while we waited for the lock answers this call too
+        if cached_at >= requested_at or (
+                not FORCE_UPDATE_CHECK and requested_at - cached_at < UPDATE_CACHE_TTL):
+            dprint("Using cached update check result")
+            return _UPDATE_CACHE['result']
+        result = _fetch_latest_update()
+        _UPDATE_CACHE.update(ts=time.time(), result=result)
+        return result
+
+def _fetch_latest_update():
+    """Ask GitHub for the latest release; return it if newer than this version."""
     try:
         log("=== Starting Update Check ===")
-        print("\n=== CHECKING FOR UPDATES ===")
-        print(f"Current version: {CURRENT_VERSION}")
-        print(f"GitHub API URL: {GITHUB_API_URL}")
-        print(f"Repository: {REPO_OWNER}/{REPO_NAME}")
-        
-        # Make the request with headers to avoid rate limiting
-        headers = {
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': f'Yamin-media-downloader/{CURRENT_VERSION}'
-        }
+        dprint("\n=== CHECKING FOR UPDATES ===")
+        dprint("Current version: %s", CURRENT_VERSION)
+        dprint("GitHub API URL: %s", GITHUB_API_URL)
+        dprint("Repository: %s/%s", REPO_OWNER, REPO_NAME)
         
-        print("Sending request to GitHub API...")
-        response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
+        dprint("Sending request to GitHub API...")
+        response, latest_release = fetch_release(GITHUB_API_URL)
         log(f"GitHub API Response Status: {response.status_code}")
-        print(f"GitHub API Response Status: {response.status_code}")
         
-        if response.status_code != 200:
+        if latest_release is None:
             log(f"GitHub API Error: {response.text}")
-            print(f"GitHub API Error: {response.text}")
             return None
-            
-        latest_release = response.json()
         
         # Check if there's a valid release
         if 'tag_name' not in latest_release:
             log("No tag_name found in release")
-            print("No tag_name found in GitHub response")
+            dprint("No tag_name found in GitHub response")
             return None
             
-        # Get the latest version number (strip v prefix if present)
-        latest_version = latest_release.get('tag_name', '').lstrip('v')
+        # Parse once: normalized version number and this platform's asset
+        release = Release.from_json(latest_release)
+        latest_version = release.version
         log(f"Latest version on GitHub: {latest_version}")
-        print(f"Latest version on GitHub: {latest_version}")
         
         if not latest_version:
             log("Empty version tag found in release")
-            print("Empty version tag found in release")
             return None
             
         # Compare versions with detailed logging
-        print(f"\n=== VERSION COMPARISON DETAILS ===")
-        print(f"Current version: {CURRENT_VERSION}")
-        print(f"Latest version: {latest_version}")
-        print(f"Comparison result: {compare_versions(latest_version, CURRENT_VERSION)}")
+        dprint("\n=== VERSION COMPARISON DETAILS ===")
+        dprint("Current version: %s", CURRENT_VERSION)
+        dprint("Latest version: %s", latest_version)
+        is_newer = compare_versions(latest_version, CURRENT_VERSION)
+        dprint("Comparison result: %s", is_newer)
         
-        if compare_versions(latest_version, CURRENT_VERSION):
+        if is_newer:
             log(f"New version {latest_version} is available!")
-            print(f"✅ New version {latest_version} is available!")
-            # Return the entire release data for use in download_and_install_update
-            return latest_release
+            dprint("✅ New version %s is available!", latest_version)
+            # Return the parsed release for use in download_and_install_update
+            return release
         else:
             log("You have the latest version")
-            print("✓ You have the latest version")
+            dprint("✓ You have the latest version")
             return None
     except requests.exceptions.RequestException as e:
         log(f"Network error checking for updates: {e}")
-        print(f"Network error checking for updates: {e}")
         return None
     except Exception as e:
         log(f"Unexpected error checking for updates: {e}")
-        print(f"Unexpected error checking for updates: {e}")
-        print(traceback.format_exc())
+        dprint(traceback.format_exc())
         return None
 
 def download_and_install_update(release):
     """Download and install the latest release."""
     try:
-        print("\n=== DOWNLOADING UPDATE ===")
+        dprint("\n=== DOWNLOADING UPDATE ===")
         
         # If release is a string (legacy calls), convert to new format
         if isinstance(release, str):
-            print(f"Converting legacy version string: {release}")
-            latest_version = release
-            # We need to fetch the release data
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': f'Yamin-media-downloader/{CURRENT_VERSION}'
-            }
-            response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
-            if response.status_code != 200:
-                raise Exception(f"Could not fetch release data: {response.status_code}")
-            release = response.json()
-        else:
-            latest_version = release.get('tag_name', '').lstrip('v')
-        
-        print(f"Preparing to download version {latest_version}")
+            dprint("Converting legacy version string: %s", release)
+            # Reuse the release check_for_updates just fetched when it matches
+            cached = _UPDATE_CACHE.get('result')
+            if cached and cached.version == release:
+                release = cached
+            else:
+                response = _SESSION.get(GITHUB_API_URL, headers=GITHUB_API_HEADERS, timeout=(5, 10))
+                if response.status_code != 200:
+                    raise Exception(f"Could not fetch release data: {response.status_code}")
+                release = Release.from_json(response.json())
+        latest_version = release.version
         
-        # Find the asset with appropriate extension (Windows: .exe, Linux: .AppImage or .deb, Mac: .dmg)
-        assets = release.get('assets', [])
-        print(f"Release has {len(assets)} assets")
+        dprint("Preparing to download version %s", latest_version)
+        dprint("Release has %s assets", len(release.raw.get('assets', [])))
         
-        exe_asset = None
-        if IS_WINDOWS:
-            # Windows: look for .exe
-            for asset in assets:
-                print(f"Asset: {asset.get('name')} ({asset.get('content_type')})")
-                if asset.get('name', '').lower().endswith('.exe'):
-                    exe_asset = asset
-                    break
-        elif IS_LINUX:
-            # Linux: look for .AppImage or .deb
-            for asset in assets:
-                print(f"Asset: {asset.get('name')} ({asset.get('content_type')})")
-                name_lower = asset.get('name', '').lower()
-                if name_lower.endswith('.appimage') or name_lower.endswith('.deb'):
-                    exe_asset = asset
-                    break
-        else:  # macOS
-            # macOS: look for .dmg or .app
-            for asset in assets:
-                print(f"Asset: {asset.get('name')} ({asset.get('content_type')})")
-                name_lower = asset.get('name', '').lower()
-                if name_lower.endswith('.dmg') or name_lower.endswith('.app'):
-                    exe_asset = asset
-                    break
-                
+        # The platform's asset (Windows: .exe, Linux: .AppImage or .deb, Mac: .dmg)
+        exe_asset = release.asset
         if not exe_asset:
             raise Exception(f"No suitable executable found in release assets for {platform.system()}")
         
-        # Create temporary directory for download
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            exe_path = temp_path / exe_asset['name']
-            
-            # Download the new version
-            download_url = exe_asset['browser_download_url']
-            print(f"Downloading from: {download_url}")
-            log("Downloading update...")
-            
-            # Show a message to inform the user that download is in progress
-            messagebox.showinfo("Downloading Update", 
-                               f"Downloading version {latest_version}...\n\n"
-                               "The application will restart automatically when the update is complete.")
-            
-            # Download with progress tracking
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(exe_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    downloaded += len(chunk)
-                    f.write(chunk)
-                    # Calculate and print progress
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        if percent % 10 < 1:  # Print every ~10%
-                            print(f"Download progress: {percent:.1f}% ({downloaded}/{total_size} bytes)")
-            
-            print(f"Download complete: {exe_path}")
-            
-            # Create update script that will:
-            # 1. Wait for this process to exit
-            # 2. Delete the current executable
-            # 3. Move the new executable in place
-            # 4. Start the new version
-            update_script = temp_path / "update.bat"
-            current_exe = sys.executable
-            
-            print(f"Creating update script at: {update_script}")
-            print(f"Current executable: {current_exe}")
-            
-            with open(update_script, 'w') as f:
-                f.write(f"""@echo off
-echo Waiting for application to close...
-timeout /t 2 /nobreak
-echo Updating Media Downloader...
-del "{current_exe}"
-if exist "{current_exe}" (
-    echo Retrying with force delete...
-    taskkill /f /im "{os.path.basename(current_exe)}" 2>nul
-    timeout /t 1 /nobreak
-    del /f "{current_exe}"
-)
-echo Copying new version...
-copy "{exe_path}" "{current_exe}"
-if exist "{current_exe}" (
-    echo Starting new version...
-    start "" "{current_exe}"
-) else (
-    echo ERROR: Failed to copy new version.
-    pause
-)
-""")
-            
-            print("Running update script...")
-            # Run update script and exit
-            subprocess.Popen([str(update_script)], shell=True)
-            time.sleep(1)  # Give it a moment to start
-            print("Exiting for update...")
-            sys.exit(0)
+        # Download into a directory that outlives this process (the updater
+        # script copies from it after exit) and keeps partial files for resuming
+        updates_dir = INSTALL_DIR / "updates"
+        updates_dir.mkdir(parents=True, exist_ok=True)
+        exe_path = updates_dir / exe_asset['name']
+        
+        # Download the new version in the background with a progress window
+        download_url = exe_asset['browser_download_url']
+        dprint("Downloading from: %s", download_url)
+        log("Downloading update...")
+        show_update_progress(latest_version, download_url, exe_path)
+        return True
             
     except Exception as e:
-        error_msg = str(e)
-        log(f"Error installing update: {error_msg}")
-        print(f"Error installing update: {error_msg}")
-        print(traceback.format_exc())
-        messagebox.showerror("Update Error", f"Failed to install update: {error_msg}")
+        report_update_error(e)
         return False
 
+def report_update_error(e):
+    """Log and show a failed update installation."""
+    error_msg = str(e)
+    log(f"Error installing update: {error_msg}")
+    dprint("".join(traceback.format_exception(e)))
+    messagebox.showerror("Update Error", f"Failed to install update: {error_msg}")
+
+def _stream_download(download_url, exe_path, progress_q, cancel_event):
+    """Worker: stream the update to exe_path, reporting progress on progress_q."""
+    try:
+        # Learn the size up front so an interrupted .part file can be resumed
+        head = _SESSION.head(download_url, allow_redirects=True, timeout=(5, 10))
+        total_size = int(head.headers.get('content-length', 0)) if head.ok else 0
+        
+        part_path = exe_path.with_name(exe_path.name + '.part')
+        resume_from = part_path.stat().st_size if part_path.exists() else 0
+        headers = {}
+        if 0 < resume_from < total_size:
+            headers['Range'] = f'bytes={resume_from}-'
+        else:
+            resume_from = 0
+        
+        response = _SESSION.get(download_url, stream=True, headers=headers, timeout=(5, 30))
+        response.raise_for_status()
+        if resume_from and response.status_code != 206:
+            resume_from = 0  # Server ignored the Range header, start over
+        if not total_size:
+            total_size = int(response.headers.get('content-length', 0))
+        progress_q.put(('total', total_size))
+        if resume_from:
+            log(f"Resuming update download at {resume_from} bytes")
+            progress_q.put(('bytes', resume_from))
+        
+        # Read 1 MiB at a time
+        response.raw.decode_content = True
+        with open(part_path, 'ab' if resume_from else 'wb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while True:
+                if cancel_event.is_set():
+                    return  # The .part file is kept so the next attempt resumes
+                chunk = response.raw.read(1 << 20)
+                if not chunk:
+                    break
+                f.write(chunk)
+                progress_q.put(('bytes', len(chunk)))
+        os.replace(part_path, exe_path)
+        progress_q.put(('done', None))
+    except Exception as e:
+        progress_q.put(('error', e))
+
+def show_update_progress(latest_version, download_url, exe_path):
+    """Show a non-blocking progress window while the update downloads."""
+    window = tk.Toplevel(root)
+    window.title("Downloading Update")
+    window.configure(bg=THEME['bg'])
+    window.resizable(False, False)
+    window.transient(root)
+    
+    tk.Label(
+        window,
+        text=f"Downloading version {latest_version}...\n"
+             "The application will restart automatically when the update is complete.",
+        font=('Segoe UI', 10),
+        bg=THEME['bg'],
+        fg=THEME['fg'],
+        justify='left'
+    ).pack(padx=20, pady=(20, 10), anchor='w')
+    
+    bar = ttk.Progressbar(window, orient="horizontal", length=360, mode="determinate")
+    bar.pack(padx=20, fill='x')
+    
+    status = tk.Label(window, text="Connecting...", font=('Segoe UI', 9), bg=THEME['bg'], fg=THEME['gray'])
+    status.pack(padx=20, pady=(5, 20), anchor='w')
+    
+    progress_q = queue.Queue()
+    cancel_event = threading.Event()
+    threading.Thread(target=_stream_download, args=(download_url, exe_path, progress_q, cancel_event),
+                     daemon=True).start()
+    
+    def _on_close():
+        cancel_event.set()
+        log("Update download cancelled")
+        window.destroy()
+    
+    window.protocol("WM_DELETE_WINDOW", _on_close)
+    
+    state = {'total': 0, 'downloaded': 0, 'started': time.monotonic()}
+    
+    def _poll():
+        if not window.winfo_exists():
+            return
+        try:
+            while True:
+                kind, value = progress_q.get_nowait()
+                if kind == 'total':
+                    state['total'] = value
+                    if value:
+                        bar.config(maximum=value)
+                    else:
+                        bar.config(mode="indeterminate")
+                        bar.start(20)
+                elif kind == 'bytes':
+                    state['downloaded'] += value
+                    if state['total']:
+                        bar['value'] = state['downloaded']
+                elif kind == 'done':
+                    window.destroy()
+                    dprint("Download complete: %s", exe_path)
+                    run_update_script(exe_path)
+                    return
+                elif kind == 'error':
+                    window.destroy()
+                    report_update_error(value)
+                    return
+        except queue.Empty:
+            pass
+        
+        elapsed = max(time.monotonic() - state['started'], 1e-6)
+        downloaded_mb = state['downloaded'] / 1024 / 1024
+        speed = downloaded_mb / elapsed
+        if state['total']:
+            status.config(text=f"{downloaded_mb:.1f} / {state['total'] / 1024 / 1024:.1f} MB ({speed:.1f} MB/s)")
+        else:
+            status.config(text=f"{downloaded_mb:.1f} MB ({speed:.1f} MB/s)")
+        window.after(100, _poll)
+    
+    window.after(100, _poll)
+
+# Marker the updater leaves behind when it cannot swap the executable in;
+# reported (and removed) by report_failed_update on the next start
+UPDATE_FAILED_FILE = INSTALL_DIR / "updates" / "update_failed.txt"
+
+_UPDATE_APPLY_SCRIPT = """import errno, os, shutil, subprocess, sys, time
+new, current, failed = {new!r}, {current!r}, {failed!r}
+error = None
+for _ in range(20):
+    time.sleep(0.5)
+    try:
+        os.replace(new, current)
+        break
+    except OSError as e:
+        error = e
+        # The update lives on another volume (EXDEV / ERROR_NOT_SAME_DEVICE):
+        # a rename can never succeed there, so copy it across instead
+        if e.errno != errno.EXDEV and getattr(e, 'winerror', None) != 17:
+            continue
+    try:
+        shutil.move(new, current)
+        break
+    except OSError as e:
+        error = e
+else:
+    with open(failed, 'w', encoding='utf-8') as f:
+        f.write("Could not replace %s with %s: %s" % (current, new, error))
+    sys.exit(1)
+if os.name != 'nt':
+    # The download was written without the execute bit
+    os.chmod(current, os.stat(current).st_mode | 0o111)
+subprocess.Popen([current])
+"""
+
+def _in_place_update_target(exe_path):
+    """Return the file the downloaded update can directly replace, or None."""
+    # From source, sys.executable is the Python interpreter, not the app
+    if not getattr(sys, 'frozen', False):
+        return None
+    suffix = exe_path.suffix.lower()
+    if IS_WINDOWS and suffix == '.exe':
+        return sys.executable
+    if IS_LINUX and suffix == '.appimage':
+        # Inside an AppImage sys.executable lives in the temporary mount
+        return os.environ.get('APPIMAGE')
+    return None
+
+def _updater_interpreter():
+    """Return a Python interpreter able to run the updater script, or None."""
+    # Only frozen builds update in place, and their sys.executable is the app
+    # itself, so look for a system Python
+    for name in ("pythonw", "python3", "python"):
+        found = shutil.which(name)
+        if found:
+            return found
+    return None
+
+def run_update_script(exe_path):
+    """Replace the running executable with the downloaded one and exit."""
+    current_exe = _in_place_update_target(exe_path)
+    if not current_exe:
+        # Installers (.deb, .dmg) and source checkouts are updated by the user
+        log(f"Update downloaded to: {exe_path}")
+        threading.Thread(target=open_result_folder, args=(exe_path.parent,), daemon=True).start()
+        messagebox.showinfo("Update Downloaded",
+            f"The new version was downloaded to:\n{exe_path}\n\n"
+            "Install it, then restart Media Downloader.")
+        return
+
+    # The updater waits for this process to exit, swaps the new executable in
+    # with a single os.replace (atomic on the same volume) and starts it.
+    try:
+        interpreter = _updater_interpreter()
+        dprint("Current executable: %s", current_exe)
+
+        if interpreter:
+            update_script = exe_path.parent / "update_apply.py"
+            update_script.write_text(
+                _UPDATE_APPLY_SCRIPT.format(new=str(exe_path), current=current_exe,
+                                            failed=str(UPDATE_FAILED_FILE)),
+                encoding='utf-8')
+            command = [interpreter, str(update_script)]
+        elif IS_WINDOWS:
+            # No Python next to a frozen build: fall back to a minimal batch
+            # file; "move /y" is still a rename rather than del + copy
+            update_script = exe_path.parent / "update.bat"
+            update_script.write_text(
+                f'@echo off\r\ntimeout /t 2 /nobreak >nul\r\n'
+                f'move /y "{exe_path}" "{current_exe}" >nul && start "" "{current_exe}"'
+                f' || echo Could not replace {current_exe} with {exe_path}> "{UPDATE_FAILED_FILE}"\r\n')
+            command = ["cmd", "/c", str(update_script)]
+        else:
+            raise RuntimeError("No Python interpreter found to apply the update")
+        dprint("Created update script at: %s", update_script)
+    except Exception as e:
+        report_update_error(e)
+        return
+
+    popen_kwargs = {}
+    if IS_WINDOWS:
+        popen_kwargs['creationflags'] = (subprocess.DETACHED_PROCESS
+                                         | subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        popen_kwargs['start_new_session'] = True
+    subprocess.Popen(command, close_fds=True, **popen_kwargs)
+    dprint("Exiting for update...")
+    sys.exit(0)
+
+def report_failed_update():
+    """Show the error left by an updater run that could not install the update."""
+    try:
+        error_msg = UPDATE_FAILED_FILE.read_text(encoding='utf-8').strip()
+    except OSError:
+        return
+    UPDATE_FAILED_FILE.unlink(missing_ok=True)
+    log(f"Previous update failed: {error_msg}")
+    messagebox.showerror("Update Error", f"The last update could not be installed:\n{error_msg}")
+
 def check_ffmpeg_update():
     """Check for FFmpeg updates."""
     try:
@@ -1117,25 +1526,17 @@ def check_ffmpeg_update():
         if not ffmpeg_path.exists():
             return
             
-        subprocess_kwargs = {}
-        if IS_WINDOWS:
-            subprocess_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-        else:
-            subprocess_kwargs['stdout'] = subprocess.DEVNULL
-            subprocess_kwargs['stderr'] = subprocess.DEVNULL
-        
-        result = subprocess.run([str(ffmpeg_path), '-version'], 
-                              capture_output=True, 
-                              text=True,
-                              **subprocess_kwargs)
-        if result.returncode != 0:
+        # Only the exit code matters here, so the output is discarded
+        if _probe_version(str(ffmpeg_path)) != 0:
             return
             
         # Check GitHub for latest FFmpeg version
         log("Checking for FFmpeg updates...")
-        response = requests.get("https://api.github.com/repos/BtbN/FFmpeg-Builds/releases/latest")
+        response, latest_release = fetch_release("https://api.github.com/repos/BtbN/FFmpeg-Builds/releases/latest")
+        if response.status_code == 304:
+            log("FFmpeg release unchanged since last check")
+            return
         response.raise_for_status()
-        latest_release = response.json()
         
         # If there's a new version, download it
         if latest_release.get('tag_name'):
@@ -1153,18 +1554,32 @@ root.config(menu=menubar)
 # File Menu
 file_menu = tk.Menu(menubar, tearoff=0)
 menubar.add_cascade(label="File", menu=file_menu)
+def open_folder(folder_path):
+    """Open a folder in the platform's file manager without waiting for it."""
+    if IS_WINDOWS:
+        # Unlike os.startfile, Popen returns before the shell association resolves
+        subprocess.Popen(['explorer', folder_path])
+    elif IS_LINUX:
+        subprocess.Popen(['xdg-open', folder_path])
+    elif IS_MAC:
+        subprocess.Popen(['open', folder_path])
+    else:
+        webbrowser.open(f"file://{folder_path}")
+
+def open_result_folder(folder):
+    """Open the folder a finished download was saved to (background thread)."""
+    try:
+        if folder.exists():
+            folder_path = str(folder.resolve())
+            log(f"Opening folder: {folder_path}")
+            open_folder(folder_path)
+    except Exception as e:
+        log(f"Error opening folder: {str(e)}")
+
 def open_download_folder():
     """Open download folder (cross-platform)"""
     try:
-        folder_path = str(downloads_path.resolve())
-        if IS_WINDOWS:
-            os.startfile(folder_path)
-        elif IS_LINUX:
-            subprocess.Popen(['xdg-open', folder_path])
-        elif IS_MAC:
-            subprocess.Popen(['open', folder_path])
-        else:
-            webbrowser.open(f"file://{folder_path}")
+        open_folder(str(downloads_path.resolve()))
     except Exception as e:
         log(f"Error opening folder: {str(e)}")
         messagebox.showerror("Error", f"Could not open folder: {str(e)}")
@@ -1178,30 +1593,25 @@ file_menu.add_command(label="Exit", command=root.quit)
 settings_menu = tk.Menu(menubar, tearoff=0)
 menubar.add_cascade(label="Settings", menu=settings_menu)
 
-# Video Quality Submenu
-video_quality_menu = tk.Menu(settings_menu, tearoff=0)
-settings_menu.add_cascade(label="Video Quality", menu=video_quality_menu)
-video_quality_menu.add_radiobutton(label="Best Quality", variable=video_quality_var, value='best', command=lambda: on_video_quality_change())
-video_quality_menu.add_radiobutton(label="1080p", variable=video_quality_var, value='1080', command=lambda: on_video_quality_change())
-video_quality_menu.add_radiobutton(label="720p", variable=video_quality_var, value='720', command=lambda: on_video_quality_change())
-video_quality_menu.add_radiobutton(label="480p", variable=video_quality_var, value='480', command=lambda: on_video_quality_change())
-video_quality_menu.add_radiobutton(label="360p", variable=video_quality_var, value='360', command=lambda: on_video_quality_change())
-
-# Audio Quality Submenu
-audio_quality_menu = tk.Menu(settings_menu, tearoff=0)
-settings_menu.add_cascade(label="Audio Quality", menu=audio_quality_menu)
-audio_quality_menu.add_radiobutton(label="320 kbps", variable=audio_quality_var, value='320', command=lambda: on_audio_quality_change())
-audio_quality_menu.add_radiobutton(label="256 kbps", variable=audio_quality_var, value='256', command=lambda: on_audio_quality_change())
-audio_quality_menu.add_radiobutton(label="192 kbps", variable=audio_quality_var, value='192', command=lambda: on_audio_quality_change())
-audio_quality_menu.add_radiobutton(label="128 kbps", variable=audio_quality_var, value='128', command=lambda: on_audio_quality_change())
-audio_quality_menu.add_radiobutton(label="96 kbps", variable=audio_quality_var, value='96', command=lambda: on_audio_quality_change())
-
-# Format Submenu
-format_menu = tk.Menu(settings_menu, tearoff=0)
-settings_menu.add_cascade(label="Format", menu=format_menu)
-format_menu.add_radiobutton(label="MP4", variable=format_var, value='mp4', command=lambda: on_format_change())
-format_menu.add_radiobutton(label="WebM", variable=format_var, value='webm', command=lambda: on_format_change())
-format_menu.add_radiobutton(label="MKV", variable=format_var, value='mkv', command=lambda: on_format_change())
+# Video Quality, Audio Quality and Format Submenus
+QUALITY_MENUS = [
+    ("Video Quality", video_quality_var, [("Best Quality", 'best'), ("1080p", '1080'), ("720p", '720'),
+                                          ("480p", '480'), ("360p", '360')]),
+    ("Audio Quality", audio_quality_var, [("320 kbps", '320'), ("256 kbps", '256'), ("192 kbps", '192'),
+                                          ("128 kbps", '128'), ("96 kbps", '96')]),
+    ("Format", format_var, [("MP4", 'mp4'), ("WebM", 'webm'), ("MKV", 'mkv')]),
+]
+for menu_label, menu_var, choices in QUALITY_MENUS:
+    submenu = tk.Menu(settings_menu, tearoff=0)
+    settings_menu.add_cascade(label=menu_label, menu=submenu)
+    for label, value in choices:
+        submenu.add_radiobutton(label=label, variable=menu_var, value=value)
+
+# Parallel Fragments Submenu
+fragment_workers_menu = tk.Menu(settings_menu, tearoff=0)
+settings_menu.add_cascade(label="Parallel Fragments", menu=fragment_workers_menu)
+for workers in (1, 2, 4, 8, 16):
+    fragment_workers_menu.add_radiobutton(label=str(workers), variable=fragment_workers_var, value=workers)
 
 # Help Menu
 help_menu = tk.Menu(menubar, tearoff=0)
@@ -1225,8 +1635,9 @@ def force_check_updates():
     """Force check for updates when user clicks menu item"""
     global FORCE_UPDATE_CHECK
     FORCE_UPDATE_CHECK = True
+    _UPDATE_CACHE['ts'] = 0
     log("Forcing update check...")
-    print("\n=== FORCING UPDATE CHECK ===")
+    dprint("\n=== FORCING UPDATE CHECK ===")
     check_updates_on_startup()
 
 # Custom Widget Classes
@@ -1266,22 +1677,66 @@ class ModernCheckbutton(tk.Checkbutton):
             font=('Segoe UI', 10)
         )
 
-# Create a queue for thread-safe UI updates
-ui_queue = queue.Queue()
+# Buffer of thread-safe UI updates; append/popleft are atomic, so a deque
+# needs no extra lock with many producers and the Tk thread as sole consumer
+ui_queue = deque()
+
+def queue_ui(task):
+    """Queue task for the Tk thread and wake the mainloop to run it."""
+    ui_queue.append(task)
+    try:
+        root.event_generate('<<UIQueue>>', when='tail')
+    except (tk.TclError, RuntimeError):
+        pass  # The fallback poll in poll_ui_queue picks it up
 
-def log(message, show_console=True):
+def post_ui(func, *args):
+    """Run func(*args) on the Tk thread as soon as it is idle, falling back to ui_queue."""
+    try:
+        root.after_idle(func, *args)
+    except (tk.TclError, RuntimeError):
+        ui_queue.append(lambda: func(*args))
+
+# Messages logged since the last flush; written to the output box in one insert
+# at most every LOG_FLUSH_MS (append/popleft on a deque need no lock)
+LOG_FLUSH_MS = 200
+_log_pending = deque()
+_log_flush_scheduled = False
+
+def _show_log_messages(messages):
+    """Prepend a batch of messages (oldest first) to the output box."""
+    output_box.config(state='normal')
+    # Newest message on top, as if each had been inserted at index 1.0
+    output_box.insert('1.0', '\n'.join(reversed(messages)) + '\n')
+    # Auto-scroll to the top
+    output_box.see('1.0')
+    output_box.config(state='disabled')
+    status_label.config(text=messages[-1])
+
+def flush_log_messages():
+    """Write all pending log messages to the output box (Tk thread)."""
+    global _log_flush_scheduled
+    # Clear the flag first so a message appended during the drain schedules a new flush
+    _log_flush_scheduled = False
+    messages = []
+    while _log_pending:
+        messages.append(_log_pending.popleft())
+    if messages:
+        _show_log_messages(messages)
+
+def log(message, show_console=None):
     """Log a message to the output box and status label if available, or queue it for later."""
+    global _log_flush_scheduled
+    if show_console is None:
+        show_console = DEBUG_MODE
     try:
         if show_console:
-            print(f"[Yamin Downloader] {message}")  # Always show in console
+            print(f"[Yamin Downloader] {message}")
         if 'output_box' in globals() and 'status_label' in globals():
-            output_box.config(state='normal')
-            # Insert at the beginning (index 1.0) instead of the end
-            output_box.insert('1.0', message + '\n')
-            # Auto-scroll to the top
-            output_box.see('1.0')
-            output_box.config(state='disabled')
-            status_label.config(text=message)
+            # Bursts of messages are coalesced into one flush per LOG_FLUSH_MS
+            _log_pending.append(message)
+            if not _log_flush_scheduled:
+                _log_flush_scheduled = True
+                post_ui(root.after, LOG_FLUSH_MS, flush_log_messages)
         else:
             early_log_queue.put(message)
     except:
@@ -1289,19 +1744,14 @@ def log(message, show_console=True):
 
 def process_early_logs():
     """Process any queued log messages once the GUI is ready."""
+    messages = []
     while not early_log_queue.empty():
         try:
-            message = early_log_queue.get_nowait()
-            if 'output_box' in globals() and 'status_label' in globals():
-                output_box.config(state='normal')
-                # Insert at the beginning (index 1.0) instead of the end
-                output_box.insert('1.0', message + '\n')
-                # Auto-scroll to the top
-                output_box.see('1.0')
-                output_box.config(state='disabled')
-                status_label.config(text=message)
+            messages.append(early_log_queue.get_nowait())
         except queue.Empty:
             break
+    if messages and 'output_box' in globals() and 'status_label' in globals():
+        _show_log_messages(messages)
 
 # Set window icon
 if ICON_PATH.exists():
@@ -1328,15 +1778,26 @@ header_frame = tk.Frame(main_container, bg=THEME['bg'])
 header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
 
 # Logo and Title
-try:
-    logo = Image.open(ICON_PATH)
-    logo = logo.resize((48, 48), Image.Resampling.LANCZOS)
+# The logo is decoded off the Tk thread so the window can paint first
+logo_label = tk.Label(header_frame, bg=THEME['bg'])
+logo_label.pack(side='left', padx=(0, 10))
+
+def set_logo(logo):
+    """Attach the decoded logo to its placeholder label (Tk thread)."""
     logo_photo = ImageTk.PhotoImage(logo)
-    logo_label = tk.Label(header_frame, image=logo_photo, bg=THEME['bg'])
+    logo_label.config(image=logo_photo)
     logo_label.image = logo_photo
-    logo_label.pack(side='left', padx=(0, 10))
-except:
-    pass
+
+def load_logo():
+    """Decode and resize the header logo in the background."""
+    try:
+        logo = Image.open(ICON_PATH)
+        logo = logo.resize((48, 48), Image.Resampling.LANCZOS)
+        post_ui(set_logo, logo)
+    except Exception:
+        pass
+
+threading.Thread(target=load_logo, daemon=True).start()
 
 title_label = tk.Label(
     header_frame,
@@ -1392,14 +1853,44 @@ status_label.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 10))
 # Process any early logs
 process_early_logs()
 
+FFMPEG_PATHS_FILE = INSTALL_DIR / "ffmpeg_paths.json"
+
+def _load_ffmpeg_paths():
+    """Load the FFmpeg/FFprobe locations resolved on a previous run."""
+    try:
+        with open(FFMPEG_PATHS_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_ffmpeg_paths(ffmpeg_path, ffprobe_path):
+    """Remember the resolved FFmpeg/FFprobe locations for the next startup."""
+    try:
+        with open(FFMPEG_PATHS_FILE, 'w') as f:
+            json.dump({'ffmpeg': str(ffmpeg_path), 'ffprobe': str(ffprobe_path)}, f)
+    except OSError:
+        pass
+
 # Initialize FFmpeg in a separate thread
 def initialize_ffmpeg():
+    """Start FFmpeg initialization on a background thread."""
+    threading.Thread(target=_initialize_ffmpeg_worker, daemon=True).start()
+
+def _initialize_ffmpeg_worker():
     """Initialize FFmpeg and FFprobe."""
-    global ffmpeg_path, ffprobe_path
+    global ffmpeg_path, ffprobe_path, _ffmpeg_present
     try:
         # Debug the FFmpeg initialization
-        print("\n=== INITIALIZING FFMPEG ===")
-        print(f"Current ffmpeg_path: {ffmpeg_path}")
+        dprint("\n=== INITIALIZING FFMPEG ===")
+        dprint("Current ffmpeg_path: %s", ffmpeg_path)
+        
+        # Reuse the location found on a previous run before scanning candidates
+        if not ffmpeg_path:
+            cached = _load_ffmpeg_paths()
+            if cached.get('ffmpeg') and verify_ffmpeg(cached['ffmpeg'], cached.get('ffprobe')):
+                dprint("Using cached FFmpeg location: %s", cached['ffmpeg'])
+                ffmpeg_path = cached['ffmpeg']
+                ffprobe_path = cached['ffprobe']
         
         # Try to find FFmpeg in expected locations first
         if not ffmpeg_path or not os.path.exists(ffmpeg_path):
@@ -1427,11 +1918,11 @@ def initialize_ffmpeg():
                     Path(APP_DIR) / "ffmpeg" / "ffmpeg"
                 ]
             
-            print("Searching for existing FFmpeg installation...")
+            dprint("Searching for existing FFmpeg installation...")
             for path in potential_paths:
-                print(f"Checking: {path}")
+                dprint("Checking: %s", path)
                 if path.exists():
-                    print(f"Found existing FFmpeg at: {path}")
+                    dprint("Found existing FFmpeg at: %s", path)
                     ffmpeg_path = str(path)
                     # Find ffprobe in same directory
                     if IS_WINDOWS:
@@ -1452,7 +1943,7 @@ def initialize_ffmpeg():
                     ffmpeg_path = None
             
             if not ffmpeg_path:
-                print("No working FFmpeg found, attempting to download...")
+                dprint("No working FFmpeg found, attempting to download...")
                 ffmpeg_path = download_ffmpeg()
                 if not ffmpeg_path or not os.path.exists(ffmpeg_path):
                     raise Exception("Failed to download FFmpeg")
@@ -1462,110 +1953,90 @@ def initialize_ffmpeg():
             ffprobe_path = str(Path(ffmpeg_path).parent / "ffprobe.exe")
         else:
             ffprobe_path = str(Path(ffmpeg_path).parent / "ffprobe")
-        print(f"Final ffmpeg_path: {ffmpeg_path}")
-        print(f"Final ffprobe_path: {ffprobe_path}")
+        dprint("Final ffmpeg_path: %s", ffmpeg_path)
+        dprint("Final ffprobe_path: %s", ffprobe_path)
         
         # Configure yt-dlp to use both FFmpeg and FFprobe
+        # No lock needed: this worker is the only writer, and it rebinds EXES to a
+        # fully built dict in one assignment, so a download reading it concurrently
+        # sees either the old mapping or the new one, never a half-updated one.
+        wait_for_yt_dlp()
         yt_dlp.postprocessor.ffmpeg.FFmpegPostProcessor.EXES = {
             'ffmpeg': ffmpeg_path,
             'ffprobe': ffprobe_path,
         }
         
         # Print the actual FFmpeg path that yt-dlp will use
-        print(f"yt-dlp FFmpeg path: {yt_dlp.postprocessor.ffmpeg.FFmpegPostProcessor.EXES.get('ffmpeg')}")
+        dprint("yt-dlp FFmpeg path: %s", yt_dlp.postprocessor.ffmpeg.FFmpegPostProcessor.EXES.get('ffmpeg'))
         
         # Verify installation
         if not verify_ffmpeg(ffmpeg_path, ffprobe_path):
             raise Exception("FFmpeg verification failed after initialization")
         
+        _save_ffmpeg_paths(ffmpeg_path, ffprobe_path)
+        _ffmpeg_present = True
+        
         # Verify output directories
         verify_output_directories()
         
         # Update status
         log("Initialization complete. Ready to download!")
-        status_label.config(text="Ready to download")
+        queue_ui(lambda: status_label.config(text="Ready to download"))
     except Exception as e:
         log(f"Error initializing FFmpeg: {str(e)}")
-        print(f"Error initializing FFmpeg: {str(e)}")
-        print(traceback.format_exc())
-        status_label.config(text="Error: FFmpeg initialization failed")
+        dprint(traceback.format_exc())
+        queue_ui(lambda: status_label.config(text="Error: FFmpeg initialization failed"))
+
+# Characters Windows rejects in path components (separators excluded)
+_INVALID_PATH_CHARS = str.maketrans('', '', '<>:"|?*')
+
+# Output directories already created and found writable
+_verified_dirs = set()
 
 def verify_output_directories():
     """Verify that output directories exist and create them if they don't."""
     try:
         log("Verifying output directories...")
-        print("\n=== VERIFYING OUTPUT DIRECTORIES ===")
+        dprint("\n=== VERIFYING OUTPUT DIRECTORIES ===")
         
-        # Check for invalid characters in paths (Windows restrictions)
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        for path in [downloads_path, video_output_dir, audio_output_dir, playlist_output_dir]:
+        output_dirs = (downloads_path, video_output_dir, audio_output_dir, playlist_output_dir)
+        for path in output_dirs:
+            # Directories already found writable on an earlier call are skipped
+            if path in _verified_dirs:
+                continue
             path_str = str(path)
-            print(f"Checking path: {path_str}")
+            dprint("Checking path: %s", path_str)
             
-            # Check for invalid characters in path
-            has_invalid = any(char in path_str for char in invalid_chars)
-            if has_invalid:
-                print(f"WARNING: Path contains invalid characters: {path_str}")
+            # Check for invalid characters in path (Windows restrictions); the
+            # drive prefix is skipped since "C:" legitimately contains a colon
+            tail = path_str[len(path.drive):]
+            if len(tail.translate(_INVALID_PATH_CHARS)) != len(tail):
+                dprint("WARNING: Path contains invalid characters: %s", path_str)
             
             # Check for long path issues (Windows MAX_PATH is 260 chars)
             if len(path_str) > 240:  # Leave some room for filenames
-                print(f"WARNING: Path is very long ({len(path_str)} chars): {path_str}")
-        
-        # Ensure the main download directory exists
-        if not downloads_path.exists():
-            log(f"Creating main download directory: {downloads_path}")
-            print(f"Creating main download directory: {downloads_path}")
-            downloads_path.mkdir(parents=True, exist_ok=True)
-        
-        # Ensure the video directory exists
-        if not video_output_dir.exists():
-            log(f"Creating video output directory: {video_output_dir}")
-            print(f"Creating video output directory: {video_output_dir}")
-            video_output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Ensure the audio directory exists
-        if not audio_output_dir.exists():
-            log(f"Creating audio output directory: {audio_output_dir}")
-            print(f"Creating audio output directory: {audio_output_dir}")
-            audio_output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Ensure the playlist directory exists
-        if not playlist_output_dir.exists():
-            log(f"Creating playlist output directory: {playlist_output_dir}")
-            print(f"Creating playlist output directory: {playlist_output_dir}")
-            playlist_output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Test write permissions
-        try:
-            print("Testing write permissions...")
-            test_files = []
-            for dir_path in [video_output_dir, audio_output_dir, playlist_output_dir]:
-                test_file = dir_path / "write_test.tmp"
-                test_files.append(test_file)
-                with open(test_file, 'w') as f:
-                    f.write("write test")
+                dprint("WARNING: Path is very long (%s chars): %s", len(path_str), path_str)
             
-            # Cleanup test files
-            for test_file in test_files:
-                if test_file.exists():
-                    test_file.unlink()
-            print("All directories are writable")
-        except Exception as e:
-            print(f"WARNING: Write permission test failed: {e}")
-            print(traceback.format_exc())
-            # Continue anyway, might still work
+            # mkdir(exist_ok=True) is idempotent, no need to stat first
+            path.mkdir(parents=True, exist_ok=True)
+            
+            # Check write permission without creating a test file
+            if os.access(path, os.W_OK):
+                _verified_dirs.add(path)
+            else:
+                # Continue anyway, might still work
+                dprint("WARNING: Directory is not writable: %s", path_str)
         
         log("Output directories verified and created if needed")
-        print("Output directory verification complete")
+        dprint("Output directory verification complete")
         return True
     except Exception as e:
         log(f"Error verifying output directories: {str(e)}")
-        print(f"Error verifying output directories: {str(e)}")
-        print(traceback.format_exc())
+        dprint(traceback.format_exc())
         return False
 
 # Start FFmpeg initialization in a separate thread
-threading.Thread(target=initialize_ffmpeg, daemon=True).start()
+initialize_ffmpeg()
 
 last_copied_url = ""
 tray_icon = None
@@ -1737,9 +2208,10 @@ def create_tray_icon():
             # Create a simple icon if the file doesn't exist
             icon_image = Image.new('RGB', (64, 64), THEME['primary'])
         
+        pystray = _get_pystray()
         menu = (
-            item('Show', lambda: show_window()),
-            item('Exit', lambda: root.quit())
+            pystray.MenuItem('Show', lambda: show_window()),
+            pystray.MenuItem('Exit', lambda: root.quit())
         )
         
         tray_icon = pystray.Icon(
@@ -1802,19 +2274,21 @@ def finish_progress():
 
 def process_queue():
     """Process the UI update queue."""
-    while not ui_queue.empty():
+    while ui_queue:
         try:
-            task = ui_queue.get_nowait()
-            task()
-        except queue.Empty:
+            task = ui_queue.popleft()
+        except IndexError:
             break
-    root.after(100, process_queue)
+        task()
+
+def poll_ui_queue():
+    """Safety net for tasks whose <<UIQueue>> event could not be generated."""
+    process_queue()
+    root.after(500, poll_ui_queue)
 
 def create_loading_icon():
-    """Create a loading GIF animation."""
-    global loading_gif, loading_label
+    """Create the frames of the loading spinner animation."""
     try:
-        # Create a simple loading animation
         frames = []
         for i in range(8):
             img = Image.new('RGBA', (16, 16), (0, 0, 0, 0))
@@ -1822,56 +2296,57 @@ def create_loading_icon():
             angle = i * 45
             draw.pieslice([0, 0, 16, 16], angle, angle + 180, fill=THEME['primary'])
             frames.append(img)
-        
-        # Save frames to memory
-        output = io.BytesIO()
-        frames[0].save(output, format='GIF', save_all=True, append_images=frames[1:], 
-                      duration=100, loop=0, transparency=0)
-        loading_gif = Image.open(output)
-        return loading_gif
+        return frames
     except:
         return None
 
+def build_loading_frames():
+    """Worker: render the spinner with PIL and hand the frames to the UI thread."""
+    frames = create_loading_icon()
+    if frames:
+        queue_ui(lambda: set_loading_frames(frames))
+
+def set_loading_frames(frames):
+    """Convert rendered frames to PhotoImages (Tk thread only) and start animating."""
+    global loading_frames
+    try:
+        loading_frames = [ImageTk.PhotoImage(frame) for frame in frames]
+    except:
+        return
+    update_loading_animation()
+
 def update_loading_animation():
-    """Update the loading animation."""
-    if loading_gif and loading_label:
+    """Advance the loading animation by one frame."""
+    global loading_frame_index
+    if loading_frames and loading_label:
         try:
-            frame = next(loading_gif.iter_frames())
-            photo = ImageTk.PhotoImage(frame)
-            loading_label.configure(image=photo)
-            loading_label.image = photo
-            root.after(100, update_loading_animation)
+            loading_frame_index = (loading_frame_index + 1) % len(loading_frames)
+            loading_label.configure(image=loading_frames[loading_frame_index])
+            # Keep a single animation chain running while the label is shown
+            if not getattr(loading_label, 'animating', False):
+                loading_label.animating = True
+                def tick(label=loading_label):
+                    label.animating = False
+                    if label is loading_label:
+                        update_loading_animation()
+                root.after(100, tick)
         except:
             pass
 
-# Add global variable for download cancellation and yt-dlp instance
-download_cancelled = False
-ydl_instance = None
+# The running download's worker thread and its cancellation event
 current_download_thread = None
+current_cancel_event = None
 
 def cancel_download():
     """Cancel the current download."""
-    global download_cancelled, ydl_instance, current_download_thread
-    download_cancelled = True
+    if current_cancel_event is None:
+        return
+    # The download's hooks check its event and stop it; its worker re-enables
+    # the buttons once it has actually finished
+    current_cancel_event.set()
     
     try:
-        # Cancel the yt-dlp instance by setting the download_cancelled flag
-        # The progress hook will check this flag and stop the download
-        if ydl_instance:
-            # Set the download_cancelled flag which is checked in the progress hook
-            ydl_instance = None
-        
-        # Force stop the download thread
-        if current_download_thread and current_download_thread.is_alive():
-            # Use a more aggressive approach to stop the thread
-            import ctypes
-            thread_id = ctypes.c_long(current_download_thread.ident)
-            ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, ctypes.py_object(SystemExit))
-            current_download_thread.join(timeout=1)
-        
-        # Reset progress and UI
-        ui_queue.put(lambda: update_progress(0, "Download cancelled"))
-        ui_queue.put(lambda: enable_buttons())
+        queue_ui(lambda: update_progress(0, "Cancelling download..."))
         log("Download cancelled by user")
         
         # Ensure window stays visible after cancellation
@@ -1881,16 +2356,70 @@ def cancel_download():
     except Exception as e:
         log(f"Error during cancellation: {str(e)}")
 
-def download_media(is_audio):
-    """Download media from the provided URL."""
-    global ffmpeg_path, ffprobe_path, download_cancelled, ydl_instance
-    download_cancelled = False  # Reset cancellation flag
-    ydl_instance = None  # Reset yt-dlp instance
+# Substrings that mark a playlist URL ('/sets/' handles SoundCloud sets)
+_PLAYLIST_MARKERS = ('playlist', 'list=', '/sets/')
+
+# Idle YoutubeDL instances keyed by their options, kept so the extractor
+# registry and HTTP connection pools survive between downloads. A download
+# checks one out for its sole use, so concurrent downloads never share an
+# instance or each other's progress hook.
+_YDL_INSTANCES = {}
+_YDL_POOL_SIZE = 8
+_YDL_POOL_LOCK = threading.Lock()
+
+@contextmanager
+def pooled_ydl(ydl_opts, progress_hook, postprocessor_hook):
+    """Check out a YoutubeDL for ydl_opts that reports to the given hooks."""
+    key = json.dumps(ydl_opts, sort_keys=True, default=str)
+    with _YDL_POOL_LOCK:
+        entry = _YDL_INSTANCES.pop(key, None)
+    if entry is None:
+        # The instance calls whatever hooks its current download put in here
+        hooks = {}
+        instance = yt_dlp.YoutubeDL({
+            **ydl_opts,
+            'progress_hooks': [lambda d: hooks['progress'](d)],
+            'postprocessor_hooks': [lambda d: hooks['postprocessor'](d)],
+        })
+        entry = (instance, hooks)
+    instance, hooks = entry
+    hooks['progress'] = progress_hook
+    hooks['postprocessor'] = postprocessor_hook
+    try:
+        yield instance
+    finally:
+        # Hand the instance back, closing whatever no longer fits in the pool
+        stale = []
+        with _YDL_POOL_LOCK:
+            if key in _YDL_INSTANCES:
+                stale.append(entry)
+            else:
+                if len(_YDL_INSTANCES) >= _YDL_POOL_SIZE:
+                    stale.append(_YDL_INSTANCES.pop(next(iter(_YDL_INSTANCES))))
+                _YDL_INSTANCES[key] = entry
+        for old_instance, _ in stale:
+            try:
+                old_instance.close()
+            except Exception:
+                pass
+
+def is_playlist_url(url):
+    """Return True if url looks like a playlist."""
+    url_lower = url.lower()
+    return any(marker in url_lower for marker in _PLAYLIST_MARKERS)
+
+def download_media(is_audio, is_playlist=None, cancel_event=None):
+    """Download media from the provided URL (is_playlist is inferred if not given)."""
+    global ffmpeg_path, ffprobe_path, _ffmpeg_present
+    if cancel_event is None:
+        cancel_event = threading.Event()
     
     try:
         show_loading()  # Show loading animation
         update_progress(0, "Starting download...")  # Initialize progress bar
         
+        wait_for_yt_dlp()
+        
         # Verify output directories exist
         if not verify_output_directories():
             messagebox.showerror("Error", "Failed to create output directories. Check permissions and disk space.")
@@ -1898,11 +2427,14 @@ def download_media(is_audio):
             update_progress(0, "Ready to download")
             return
             
-        # Verify FFmpeg is available
-        if not ffmpeg_path or not os.path.exists(ffmpeg_path):
+        # Verify FFmpeg is available (stat only until it has been found once)
+        if not _ffmpeg_present:
+            _ffmpeg_present = bool(ffmpeg_path and os.path.exists(ffmpeg_path))
+        if not _ffmpeg_present:
             log("FFmpeg not found. Attempting to download...")
             ffmpeg_path = download_ffmpeg()
-            if not ffmpeg_path or not os.path.exists(ffmpeg_path):
+            _ffmpeg_present = bool(ffmpeg_path and os.path.exists(ffmpeg_path))
+            if not _ffmpeg_present:
                 messagebox.showerror("Error", "FFmpeg is required but could not be installed automatically.")
                 hide_loading()
                 update_progress(0, "Ready to download")
@@ -1912,11 +2444,13 @@ def download_media(is_audio):
         current_video_quality = video_quality_var.get()
         current_audio_quality = audio_quality_var.get()
         current_format = format_var.get()
+        current_fragment_workers = fragment_workers_var.get()
         
         # Update quality settings dictionary
         quality_settings['video_quality'] = current_video_quality
         quality_settings['audio_quality'] = current_audio_quality
         quality_settings['format'] = current_format
+        quality_settings['fragment_workers'] = current_fragment_workers
         
         url = url_entry.get().strip()
         if not url:
@@ -1925,16 +2459,9 @@ def download_media(is_audio):
             update_progress(0, "Ready to download")
             return
 
-        # Check if URL is a playlist
-        is_playlist = ('playlist' in url.lower() or 
-                       'list=' in url.lower() or 
-                       '/sets/' in url.lower())  # Handle SoundCloud sets
-                       
-        if is_playlist and not download_playlist.get():
-            if not messagebox.askyesno("Playlist Detected", 
-                "This appears to be a playlist URL. Would you like to download the entire playlist?\n\n"
-                "If not, only the first video will be downloaded."):
-                is_playlist = False
+        # Check if URL is a playlist (normally already decided by threaded_download)
+        if is_playlist is None:
+            is_playlist = is_playlist_url(url)
 
         max_files = max_files_entry.get() or '100'
         try:
@@ -1944,14 +2471,11 @@ def download_media(is_audio):
 
         # Set the appropriate output directory
         if is_playlist:
-            output_path = playlist_output_dir
-            output_template = str(playlist_output_dir / '%(playlist_index)s_%(title)s.%(ext)s')
+            output_path, output_template = playlist_output_dir, OUTTMPL_PLAYLIST
         elif is_audio:
-            output_path = audio_output_dir
-            output_template = str(audio_output_dir / '%(title)s.%(ext)s')
+            output_path, output_template = audio_output_dir, OUTTMPL_AUDIO
         else:
-            output_path = video_output_dir
-            output_template = str(video_output_dir / '%(title)s.%(ext)s')
+            output_path, output_template = video_output_dir, OUTTMPL_VIDEO
 
         log(f"Output directory set to: {output_path}")
 
@@ -1983,18 +2507,17 @@ def download_media(is_audio):
 
         ydl_opts = {
             'format': format_code,
-            'progress_hooks': [create_progress_hook()],
             'restrictfilenames': True,
             'windowsfilenames': True,
-            'quiet': False,
-            'no_warnings': False,
+            'quiet': True,
+            'no_warnings': True,
             'nocheckcertificate': True,  # Avoid certificate issues
             'nooverwrites': True,
             'ignoreerrors': True,  # Don't stop on errors
             'continuedl': True,
             'ffmpeg_location': ffmpeg_path,
             'merge_output_format': current_format,
-            'verbose': True,
+            'verbose': False,
             'outtmpl': output_template,
             'playlist_items': f'1-{max_files}' if is_playlist else None,
             'noplaylist': not is_playlist,
@@ -2003,6 +2526,10 @@ def download_media(is_audio):
             'socket_timeout': 30,
             'retries': 10,
             'extractor_retries': 10,
+            # Fetch DASH/HLS fragments in parallel and request large HTTP chunks
+            'concurrent_fragment_downloads': quality_settings.get('fragment_workers', 4),
+            'http_chunk_size': 10 * 1024 * 1024,
+            'buffersize': 1 << 20,
             'http_headers': {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
@@ -2022,218 +2549,180 @@ def download_media(is_audio):
                 'preferedformat': current_format,
             }]
 
-        ydl_instance = yt_dlp.YoutubeDL(ydl_opts)
-        try:
-            log("Extracting video information...")
+        with pooled_ydl(ydl_opts, create_progress_hook(cancel_event),
+                        create_postprocessor_hook(cancel_event)) as ydl_instance:
             try:
-                info = ydl_instance.extract_info(url, download=False)
-                if not info:
-                    raise Exception("Failed to extract video information")
-            except Exception as extract_error:
-                log(f"Error extracting info: {str(extract_error)}")
-                messagebox.showerror("Error", f"Failed to extract video information: {str(extract_error)}")
-                hide_loading()
-                update_progress(0, "Ready to download")
-                return
+                # Only playlists need the metadata up front; download() extracts a
+                # single video itself and the progress hook logs its title
+                info = None
+                if cancel_event.is_set():
+                    return
+                if is_playlist:
+                    log("Extracting playlist information...")
+                    try:
+                        # process=False keeps the entries lazy instead of resolving each one
+                        info = ydl_instance.extract_info(url, download=False, process=False)
+                        if not info:
+                            raise Exception("Failed to extract video information")
+                    except Exception as extract_error:
+                        log(f"Error extracting info: {str(extract_error)}")
+                        messagebox.showerror("Error", f"Failed to extract video information: {str(extract_error)}")
+                        hide_loading()
+                        update_progress(0, "Ready to download")
+                        return
             
-            log(f"Download options: {ydl_opts}")
+                log(f"Download options: {ydl_opts}")
             
-            if is_playlist and 'entries' in info:
-                log(f"? Downloading playlist: {info.get('title', 'Untitled')}")
-                entries_count = len(list(info.get('entries', [])))
-                log(f"?? Number of items: {entries_count}")
-                log(f"?? Downloading first {max_files} items")
-            else:
-                log(f"? Downloading single video: {info.get('title', 'Untitled')}")
+                if info and 'entries' in info:
+                    log(f"? Downloading playlist: {info.get('title', 'Untitled')}")
+                    entries_count = info.get('playlist_count') or info.get('n_entries') or '?'
+                    log(f"?? Number of items: {entries_count}")
+                    log(f"?? Downloading first {max_files} items")
+                else:
+                    log("? Downloading single video")
                 
-            log(f"? Download will be saved to: {output_path}")
-            log(f"? Starting download: {url}")
-            log(f"? Using quality settings: Video={current_video_quality}, Audio={current_audio_quality}kbps, Format={current_format}")
+                log(f"? Download will be saved to: {output_path}")
+                log(f"? Starting download: {url}")
+                log(f"? Using quality settings: Video={current_video_quality}, Audio={current_audio_quality}kbps, Format={current_format}")
             
-            if download_cancelled:
-                return
+                if cancel_event.is_set():
+                    return
                 
-            # Start the actual download
-            log("Starting download process...")
-            try:
-                print("\n=== DOWNLOAD PROCESS STARTING ===")
-                print(f"URL: {url}")
-                print(f"Output path: {output_path}")
-                print(f"Format: {format_code}")
-                print(f"Is audio only: {is_audio}")
-                print(f"Is playlist: {is_playlist}")
-                print(f"FFmpeg path: {ffmpeg_path}")
-                print(f"Output template: {output_template}")
-                
-                # Check that output directory exists and is writable
-                print(f"Checking output directory...")
-                if not output_path.exists():
-                    print(f"Creating output directory: {output_path}")
-                    output_path.mkdir(parents=True, exist_ok=True)
-                
-                # Test write access to output directory
+                # Start the actual download
+                log("Starting download process...")
                 try:
-                    test_file = output_path / "test_write.tmp"
-                    with open(test_file, 'w') as f:
-                        f.write("test")
-                    test_file.unlink()
-                    print("Output directory is writable")
-                except Exception as e:
-                    print(f"Warning: Output directory may not be writable: {e}")
+                    # Make sure the output directory exists
+                    if not output_path.exists():
+                        output_path.mkdir(parents=True, exist_ok=True)
                 
-                print("Starting yt-dlp download...")
-                try:
-                    # First attempt - use the configured options
-                    ydl_instance.download([url])
-                    print("yt-dlp download function completed")
-                except Exception as primary_error:
-                    # If the primary method failed, try a fallback with simpler options
-                    print(f"\n=== PRIMARY DOWNLOAD FAILED, TRYING FALLBACK ===")
-                    print(f"Primary error: {str(primary_error)}")
+                    try:
+                        # First attempt - use the configured options
+                        ydl_instance.download([url])
+                    except yt_dlp.utils.DownloadCancelled:
+                        raise
+                    except Exception as primary_error:
+                        # If the primary method failed, try a fallback with simpler options
+                        dprint("\n=== PRIMARY DOWNLOAD FAILED, TRYING FALLBACK ===")
+                        dprint("Primary error: %s", primary_error)
                     
-                    # Create simpler fallback options
-                    fallback_opts = {
-                        'format': 'best' if not is_audio else 'bestaudio',
-                        'outtmpl': output_template,
-                        'nocheckcertificate': True,
-                        'ignoreerrors': True,
-                        'no_warnings': True,
-                        'quiet': False,
-                        'verbose': True,
-                        'progress_hooks': [create_progress_hook()]
-                    }
+                        # Create simpler fallback options
+                        fallback_opts = {
+                            'format': 'best' if not is_audio else 'bestaudio',
+                            'outtmpl': output_template,
+                            'nocheckcertificate': True,
+                            'ignoreerrors': True,
+                            'no_warnings': True,
+                            'quiet': True,
+                            'verbose': False,
+                            'progress_hooks': [create_progress_hook(cancel_event)],
+                            'postprocessor_hooks': [create_postprocessor_hook(cancel_event)],
+                        }
                     
-                    if is_audio:
-                        fallback_opts['postprocessors'] = [{
-                            'key': 'FFmpegExtractAudio',
-                            'preferredcodec': 'mp3',
-                            'preferredquality': current_audio_quality,
-                        }]
+                        if is_audio:
+                            fallback_opts['postprocessors'] = [{
+                                'key': 'FFmpegExtractAudio',
+                                'preferredcodec': 'mp3',
+                                'preferredquality': current_audio_quality,
+                            }]
                         
-                    print(f"Trying fallback with simplified options: {fallback_opts}")
-                    fallback_ydl = yt_dlp.YoutubeDL(fallback_opts)
-                    fallback_ydl.download([url])
-                    print("Fallback download completed")
-                
-            except yt_dlp.utils.DownloadError as download_error:
-                error_str = str(download_error)
-                print(f"\n=== DOWNLOAD ERROR DETAILS ===")
-                print(f"Error: {error_str}")
-                print(f"Error type: {type(download_error).__name__}")
-                
-                # Detailed error diagnosis
-                if "ffmpeg" in error_str.lower():
-                    print("This appears to be an FFmpeg error")
-                    log(f"FFmpeg error: {error_str}")
-                    messagebox.showerror("FFmpeg Error", 
-                        f"Error with FFmpeg: {error_str}\n\n"
-                        "Please check that FFmpeg is installed correctly.")
-                elif "HTTP Error 429" in error_str:
-                    print("This appears to be a rate limit error")
-                    log(f"Rate limit error: {error_str}")
-                    messagebox.showerror("Rate Limit Error", 
-                        "You are being rate limited by the server. Please try again later.")
-                elif "postprocessor" in error_str.lower():
-                    print("This appears to be a postprocessor error")
-                    log(f"Postprocessor error: {error_str}")
-                    messagebox.showerror("Processing Error", 
-                        f"Error processing the video: {error_str}\n\n"
-                        "Try downloading without conversion or in a different format.")
-                elif "copyright" in error_str.lower() or "not available" in error_str.lower():
-                    print("This appears to be a content availability error")
-                    log(f"Content availability error: {error_str}")
-                    messagebox.showerror("Content Error", 
-                        f"This content may not be available: {error_str}")
-                elif "network" in error_str.lower() or "connection" in error_str.lower():
-                    print("This appears to be a network error")
-                    log(f"Network error: {error_str}")
-                    messagebox.showerror("Network Error", 
-                        f"Network connection issue: {error_str}\n\n"
-                        "Check your internet connection and try again.")
-                else:
-                    print("This is an unclassified error")
-                    log(f"Download error: {error_str}")
-                    messagebox.showerror("Download Error", error_str)
+                        dprint("Trying fallback with simplified options: %s", fallback_opts)
+                        fallback_ydl = yt_dlp.YoutubeDL(fallback_opts)
+                        fallback_ydl.download([url])
                 
-                hide_loading()
-                update_progress(0, "Ready to download")
-                return
-            except Exception as e:
-                log(f"Unexpected download error: {str(e)}")
-                messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
-            finally:
-                ydl_instance = None
-
-            if download_cancelled:
-                log("Download cancelled")
-                return
-
-            # Success! Open the appropriate folder
-            if is_playlist:
-                log(f"? Playlist download completed!")
-                log(f"?? Saved to: {playlist_output_dir}")
+                except yt_dlp.utils.DownloadCancelled:
+                    pass  # Reported below via cancel_event
+                except yt_dlp.utils.DownloadError as download_error:
+                    error_str = str(download_error)
+                    error_lower = error_str.lower()
                 
-                # Ensure the folder exists and open it
-                if playlist_output_dir.exists():
-                    try:
-                        folder_path = str(playlist_output_dir.resolve())
-                        log(f"Opening folder: {folder_path}")
-                        if IS_WINDOWS:
-                            os.startfile(folder_path)
-                        elif IS_LINUX:
-                            subprocess.Popen(['xdg-open', folder_path])
-                        elif IS_MAC:
-                            subprocess.Popen(['open', folder_path])
-                        else:
-                            webbrowser.open(f"file://{folder_path}")
-                    except Exception as e:
-                        log(f"Error opening folder: {str(e)}")
-            else:
-                log("? Download completed!")
-                log(f"?? Saved to: {output_path}")
-                # Open the output folder
-                try:
-                    folder_path = str(output_path.resolve())
-                    if IS_WINDOWS:
-                        os.startfile(folder_path)
-                    elif IS_LINUX:
-                        subprocess.Popen(['xdg-open', folder_path])
-                    elif IS_MAC:
-                        subprocess.Popen(['open', folder_path])
+                    # Detailed error diagnosis
+                    if "ffmpeg" in error_lower:
+                        log(f"FFmpeg error: {error_str}")
+                        messagebox.showerror("FFmpeg Error", 
+                            f"Error with FFmpeg: {error_str}\n\n"
+                            "Please check that FFmpeg is installed correctly.")
+                    elif "HTTP Error 429" in error_str:
+                        log(f"Rate limit error: {error_str}")
+                        messagebox.showerror("Rate Limit Error", 
+                            "You are being rate limited by the server. Please try again later.")
+                    elif "postprocessor" in error_lower:
+                        log(f"Postprocessor error: {error_str}")
+                        messagebox.showerror("Processing Error", 
+                            f"Error processing the video: {error_str}\n\n"
+                            "Try downloading without conversion or in a different format.")
+                    elif "copyright" in error_lower or "not available" in error_lower:
+                        log(f"Content availability error: {error_str}")
+                        messagebox.showerror("Content Error", 
+                            f"This content may not be available: {error_str}")
+                    elif "network" in error_lower or "connection" in error_lower:
+                        log(f"Network error: {error_str}")
+                        messagebox.showerror("Network Error", 
+                            f"Network connection issue: {error_str}\n\n"
+                            "Check your internet connection and try again.")
                     else:
-                        webbrowser.open(f"file://{folder_path}")
+                        log(f"Download error: {error_str}")
+                        messagebox.showerror("Download Error", error_str)
+                
+                    hide_loading()
+                    update_progress(0, "Ready to download")
+                    return
                 except Exception as e:
-                    log(f"Error opening folder: {str(e)}")
-
-        except yt_dlp.utils.DownloadError as e:
-            # This block will only be reached for errors not caught in the inner try block
-            if not download_cancelled:  # Only show error if not cancelled
-                log(f"Uncaught download error: {str(e)}")
-                messagebox.showerror("Download Error", f"Download failed: {str(e)}")
-        except Exception as e:
-            if not download_cancelled:  # Only show error if not cancelled
-                log(f"Unexpected error: {str(e)}")
-                messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
-        finally:
-            ydl_instance = None
+                    log(f"Unexpected download error: {str(e)}")
+                    messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
+
+                if cancel_event.is_set():
+                    log("Download cancelled")
+                    return
+
+                # Success! Open the appropriate folder without waiting on the shell
+                if is_playlist:
+                    log(f"? Playlist download completed!")
+                    log(f"?? Saved to: {playlist_output_dir}")
+                    result_dir = playlist_output_dir
+                else:
+                    log("? Download completed!")
+                    log(f"?? Saved to: {output_path}")
+                    result_dir = output_path
+                threading.Thread(target=open_result_folder, args=(result_dir,), daemon=True).start()
+
+            except yt_dlp.utils.DownloadError as e:
+                # This block will only be reached for errors not caught in the inner try block
+                if not cancel_event.is_set():  # Only show error if not cancelled
+                    log(f"Uncaught download error: {str(e)}")
+                    messagebox.showerror("Download Error", f"Download failed: {str(e)}")
+            except Exception as e:
+                if not cancel_event.is_set():  # Only show error if not cancelled
+                    log(f"Unexpected error: {str(e)}")
+                    messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
 
     except Exception as e:
-        if not download_cancelled:  # Only show error if not cancelled
+        if not cancel_event.is_set():  # Only show error if not cancelled
             messagebox.showerror("Error", f"Error occurred:\n{e}")
     finally:
         hide_loading()  # Hide loading animation
-        if not download_cancelled:
-            ui_queue.put(lambda: enable_buttons())
-            ui_queue.put(lambda: update_progress(0, "Ready to download"))
+        if not cancel_event.is_set():
+            queue_ui(lambda: update_progress(0, "Ready to download"))
         # Ensure window stays visible after download
         root.deiconify()
         root.lift()
         root.focus_force()
 
 # Clipboard Monitoring Functions
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+def is_valid_url(url):
+    """Cheap URL check: one precompiled regex, then urlparse for a real host."""
+    if not _URL_RE.match(url):
+        return False
+    try:
+        return bool(urlparse(url).netloc)
+    except ValueError:
+        return False
+
+@lru_cache(maxsize=256)
 def is_supported_url(url):
     try:
-        return validators.url(url)
+        return is_valid_url(url)
     except:
         return False
 
@@ -2241,21 +2730,23 @@ def check_clipboard():
     global last_copied_url
     try:
         clipboard_content = pyperclip.paste().strip()
-        if validators.url(clipboard_content):
-            if clipboard_content != last_copied_url and is_supported_url(clipboard_content):
-                url_entry.delete(0, tk.END)
-                url_entry.insert(0, clipboard_content)
-                last_copied_url = clipboard_content
-                log(f"Auto-detected URL: {clipboard_content}")
+        # Unchanged clipboard: nothing to validate
+        if clipboard_content != last_copied_url and is_supported_url(clipboard_content):
+            url_entry.delete(0, tk.END)
+            url_entry.insert(0, clipboard_content)
+            last_copied_url = clipboard_content
+            log(f"Auto-detected URL: {clipboard_content}")
     except Exception as e:
-        print("Clipboard error:", e)
-    root.after(1000, check_clipboard)
+        dprint("Clipboard error: %s", e)
+    # Human clipboard changes don't need sub-second latency
+    root.after(2000, check_clipboard)
 
 # Start clipboard monitoring
 check_clipboard()
 
-# Start queue processing
-root.after(100, process_queue)
+# Start queue processing: workers wake the mainloop with <<UIQueue>>
+root.bind('<<UIQueue>>', lambda event: process_queue())
+root.after(500, poll_ui_queue)
 
 # Main loop
 if __name__ == "__main__":
@@ -2275,6 +2766,7 @@ if __name__ == "__main__":
         def check_updates_async():
             try:
                 # Small delay to ensure window is fully visible first
+                root.after(500, report_failed_update)
                 root.after(500, check_updates_on_startup)
             except Exception as e:
                 log(f"Error scheduling update check: {e}")
@@ -5,17 +5,23 @@ Works on Windows, Linux, and macOS
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font
-import subprocess
+from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import sys
 import os
 import platform
 import threading
+import time
 import queue
-import shlex
+from collections import deque, OrderedDict
+from itertools import islice
 from pathlib import Path
-import ctypes
-from datetime import datetime
+import io
+import codecs
+import locale
+import atexit
+# subprocess, selectors and ctypes are imported where they are first
+# needed so they stay off the startup path
 
 # Color scheme
 COLOR_BG = "#1e1e1e"
@@ -27,6 +33,48 @@ COLOR_WARNING = "#dcdcaa"
 COLOR_INFO = "#569cd6"
 COLOR_PROMPT = "#4ec9b0"
 
+HELP_TEXT = """
+Built-in Commands:
+  help              - Show this help message
+  exit / quit       - Exit the shell
+  clear / cls       - Clear the terminal
+  cd [directory]    - Change directory
+  pwd               - Print working directory
+  sudo [command]    - Execute command with elevated privileges
+  history           - Show command history
+  env               - Show environment variables
+  whoami            - Show current user
+
+System Commands:
+  All other commands are executed as system commands.
+  Use 'sudo' prefix for commands requiring admin privileges.
+"""
+
+# Number of commands kept in the history
+HISTORY_SIZE = 1000
+
+# Maximum queued output messages handled per Tk tick; the rest wait for the next one
+QUEUE_DRAIN_LIMIT = 5000
+
+# Lines kept in the output area; older ones are dropped from the top
+MAX_OUTPUT_LINES = 5000
+
+# Seconds a directory listing is reused for repeated Tab presses
+COMPLETION_CACHE_TTL = 2.0
+
+# Directories kept open for cd; chdir to an open fd skips the path lookup
+DIR_FD_CACHE_SIZE = 16
+DIR_FD_CHDIR = os.chdir in os.supports_fd and hasattr(os, "O_DIRECTORY")
+
+# Command output is read from the pipes in raw chunks of this size
+READ_CHUNK_SIZE = 65536
+OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+def new_output_decoder():
+    """Incremental decoder for raw pipe chunks (split characters, CRLF -> LF)."""
+    return io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(OUTPUT_ENCODING)("replace"), translate=True)
+
 class ShellGUI:
     def __init__(self, root):
         self.root = root
@@ -48,20 +96,55 @@ class ShellGUI:
         self.is_linux = self.platform == "linux"
         self.is_mac = self.platform == "darwin"
         
+        # Platform-specific command runners, chosen once
+        if self.is_windows:
+            self._spawn, self._elevate = self._spawn_windows, self._elevate_windows
+        else:
+            self._spawn = self._spawn_posix
+            self._elevate = self._elevate_linux if self.is_linux else self._elevate_mac
+        
+        # Built-in commands (name -> handler taking the rest of the line)
+        self._builtins = {
+            "exit": self._b_exit, "quit": self._b_exit,
+            "clear": self._b_clear, "cls": self._b_clear,
+            "cd": self._b_cd,
+            "pwd": self._b_pwd,
+            "help": self._b_help,
+            "history": self._b_history,
+            "env": self._b_env,
+            "whoami": self._b_whoami,
+            "sudo": self._b_sudo,
+        }
+        
+        # Cached output of the env builtin
+        self._env_text = None
+        
+        # Tab completion listings: directory -> (time scanned, [(name, is_dir)])
+        self._completion_cache = {}
+        
         # Current directory
         self.current_dir = os.getcwd()
+        self._cwd = Path(self.current_dir)
+        self._dir_fds = OrderedDict()  # path -> open directory fd, oldest first
+        atexit.register(self._close_dir_fds)
         
         # Admin/root status
         self.is_admin = self.check_admin_privileges()
+        self._prompt_symbol = "#" if self.is_admin else "$"
+        self._shown_dir = None  # Directory currently shown in dir_label
         
-        # Command history
-        self.history = []
+        # Command history (oldest entries drop off once HISTORY_SIZE is reached)
+        self.history = deque(maxlen=HISTORY_SIZE)
         self.history_index = -1
         
         # Process management
         self.current_process = None
         self.process_queue = queue.Queue()
         
+        # POSIX output reader, started with the first command
+        self._reader_thread = None
+        self._new_processes = queue.Queue()
+        
         # Setup UI
         self.setup_ui()
         
@@ -75,6 +158,7 @@ class ShellGUI:
         """Check if running with admin/root privileges."""
         if self.is_windows:
             try:
+                import ctypes
                 return ctypes.windll.shell32.IsUserAnAdmin() != 0
             except:
                 return False
@@ -84,6 +168,12 @@ class ShellGUI:
     
     def setup_ui(self):
         """Setup the GUI interface."""
+        # Shared fonts, so Tk parses each spec once and widgets share the metrics
+        self.mono_font = tkfont.Font(family="Consolas", size=11)
+        self.mono_bold = tkfont.Font(family="Consolas", size=11, weight="bold")
+        self.mono_small = tkfont.Font(family="Consolas", size=9)
+        self.mono_small_bold = tkfont.Font(family="Consolas", size=9, weight="bold")
+        
         # Main container
         main_frame = tk.Frame(self.root, bg=COLOR_BG)
         main_frame.pack(fill="both", expand=True, padx=5, pady=5)
@@ -104,7 +194,7 @@ class ShellGUI:
             text=platform_text,
             bg=COLOR_BG,
             fg=COLOR_INFO if self.is_admin else COLOR_WARNING,
-            font=("Consolas", 9, "bold"),
+            font=self.mono_small_bold,
             anchor="w",
             padx=10,
             pady=5
@@ -117,7 +207,7 @@ class ShellGUI:
             text=f"📁 {self.current_dir}",
             bg=COLOR_BG,
             fg=COLOR_FG,
-            font=("Consolas", 9),
+            font=self.mono_small,
             anchor="e",
             padx=10,
             pady=5
@@ -128,20 +218,26 @@ class ShellGUI:
         output_frame = tk.Frame(main_frame, bg=COLOR_BG)
         output_frame.pack(fill="both", expand=True)
         
-        # Text widget with custom styling
-        self.output_text = scrolledtext.ScrolledText(
+        # Text widget with custom styling; output is never edited, so no undo stack
+        self.output_text = tk.Text(
             output_frame,
             bg=COLOR_BG,
             fg=COLOR_FG,
             insertbackground=COLOR_FG,
-            font=("Consolas", 11),
-            wrap=tk.WORD,
+            font=self.mono_font,
+            wrap="char",
+            undo=False,
+            maxundo=0,
+            autoseparators=False,
             relief="flat",
             borderwidth=0,
             selectbackground=COLOR_SELECTION,
             selectforeground="white"
         )
-        self.output_text.pack(fill="both", expand=True)
+        output_scrollbar = ttk.Scrollbar(output_frame, command=self.output_text.yview)
+        self.output_text.configure(yscrollcommand=output_scrollbar.set)
+        output_scrollbar.pack(side="right", fill="y")
+        self.output_text.pack(side="left", fill="both", expand=True)
         
         # Configure tags for colored output
         self.output_text.tag_config("error", foreground=COLOR_ERROR)
@@ -155,13 +251,12 @@ class ShellGUI:
         input_frame.pack(fill="x", pady=(5, 0))
         
         # Prompt label
-        prompt_symbol = "#" if self.is_admin else "$"
         self.prompt_label = tk.Label(
             input_frame,
-            text=f"{prompt_symbol} ",
+            text=f"{self._prompt_symbol} ",
             bg=COLOR_BG,
             fg=COLOR_PROMPT,
-            font=("Consolas", 11, "bold"),
+            font=self.mono_bold,
             anchor="w"
         )
         self.prompt_label.pack(side="left", padx=(0, 5))
@@ -172,7 +267,7 @@ class ShellGUI:
             bg="#2d2d2d",
             fg=COLOR_FG,
             insertbackground=COLOR_FG,
-            font=("Consolas", 11),
+            font=self.mono_font,
             relief="flat",
             borderwidth=1,
             highlightthickness=1,
@@ -180,10 +275,14 @@ class ShellGUI:
             highlightcolor=COLOR_INFO
         )
         self.command_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        self.command_entry.bind("<Return>", self.execute_command)
-        self.command_entry.bind("<Up>", self.history_up)
-        self.command_entry.bind("<Down>", self.history_down)
-        self.command_entry.bind("<Tab>", self.auto_complete)
+        # One binding for every key; the handled ones are looked up by keysym
+        self._entry_keys = {
+            "Return": self.execute_command,
+            "Up": self.history_up,
+            "Down": self.history_down,
+            "Tab": self.auto_complete,
+        }
+        self.command_entry.bind("<KeyPress>", self._on_entry_key)
         
         # Execute button
         execute_btn = tk.Button(
@@ -192,7 +291,7 @@ class ShellGUI:
             command=self.execute_command,
             bg=COLOR_INFO,
             fg="white",
-            font=("Consolas", 9, "bold"),
+            font=self.mono_small_bold,
             relief="flat",
             padx=15,
             pady=5,
@@ -207,7 +306,7 @@ class ShellGUI:
             command=self.clear_output,
             bg="#5a5a5a",
             fg="white",
-            font=("Consolas", 9),
+            font=self.mono_small,
             relief="flat",
             padx=10,
             pady=5,
@@ -223,7 +322,7 @@ class ShellGUI:
                 command=self.elevate_privileges,
                 bg=COLOR_WARNING,
                 fg="black",
-                font=("Consolas", 9, "bold"),
+                font=self.mono_small_bold,
                 relief="flat",
                 padx=10,
                 pady=5,
@@ -254,15 +353,22 @@ Type 'help' for available commands or 'exit' to close.
     
     def update_prompt(self):
         """Update the prompt display."""
-        prompt_symbol = "#" if self.is_admin else "$"
-        self.prompt_label.config(text=f"{prompt_symbol} ")
-        self.dir_label.config(text=f"📁 {self.current_dir}")
+        # The prompt symbol is fixed for the session; only the directory changes
+        if self.current_dir != self._shown_dir:
+            self._shown_dir = self.current_dir
+            self.dir_label.config(text=f"📁 {self.current_dir}")
     
     def append_output(self, text, tag=None):
-        """Append text to output area."""
+        """Append text to output area with one insert and one scroll; pass multi-line blocks whole."""
         self.output_text.insert(tk.END, text, tag)
         self.output_text.see(tk.END)
-        self.root.update_idletasks()
+    
+    def trim_output(self):
+        """Drop the oldest lines once the output area grows past MAX_OUTPUT_LINES."""
+        excess = int(self.output_text.index("end-1c").split(".")[0]) - MAX_OUTPUT_LINES
+        if excess > 0:
+            # One delete; tags on the removed text go with it
+            self.output_text.delete("1.0", f"{excess + 1}.0")
     
     def clear_output(self):
         """Clear the output area."""
@@ -284,8 +390,7 @@ Type 'help' for available commands or 'exit' to close.
         self.command_entry.delete(0, tk.END)
         
         # Display command
-        prompt_symbol = "#" if self.is_admin else "$"
-        self.append_output(f"{prompt_symbol} {command}\n", "prompt")
+        self.append_output(f"{self._prompt_symbol} {command}\n", "prompt")
         
         # Handle built-in commands
         if self.handle_builtin_commands(command):
@@ -296,221 +401,346 @@ Type 'help' for available commands or 'exit' to close.
     
     def handle_builtin_commands(self, command):
         """Handle built-in shell commands."""
-        parts = command.split()
-        cmd = parts[0].lower()
-        
-        if cmd == "exit" or cmd == "quit":
-            self.root.destroy()
-            return True
-        
-        elif cmd == "clear" or cmd == "cls":
-            self.clear_output()
-            return True
-        
-        elif cmd == "cd":
-            try:
-                if len(parts) > 1:
-                    new_dir = parts[1]
-                    # Handle ~ for home directory
-                    if new_dir == "~" or new_dir.startswith("~/"):
-                        new_dir = os.path.expanduser(new_dir)
-                    # Handle relative paths
-                    if not os.path.isabs(new_dir):
-                        new_dir = os.path.join(self.current_dir, new_dir)
-                    new_dir = os.path.normpath(new_dir)
-                    if os.path.isdir(new_dir):
-                        self.current_dir = new_dir
-                        os.chdir(new_dir)
-                        self.append_output(f"Changed directory to: {self.current_dir}\n", "success")
-                        self.update_prompt()
-                    else:
-                        self.append_output(f"Error: Directory not found: {new_dir}\n", "error")
+        cmd, _, rest = command.partition(" ")
+        handler = self._builtins.get(cmd.lower())
+        if handler is None:
+            return False
+        handler(rest.strip())
+        return True
+    
+    def _b_exit(self, rest):
+        self.root.destroy()
+    
+    def _b_clear(self, rest):
+        self.clear_output()
+    
+    def _b_cd(self, rest):
+        try:
+            if rest:
+                # Joining onto the cached cwd keeps absolute paths as they are
+                new_dir = Path(os.path.normpath(self._cwd / Path(rest).expanduser()))
+                try:
+                    # chdir checks the directory itself, no separate isdir call
+                    self._chdir(new_dir)
+                except (FileNotFoundError, NotADirectoryError):
+                    self.append_output(f"Error: Directory not found: {new_dir}\n", "error")
                 else:
-                    # Show current directory
-                    self.append_output(f"{self.current_dir}\n", "info")
-            except Exception as e:
-                self.append_output(f"Error: {str(e)}\n", "error")
-            return True
-        
-        elif cmd == "pwd":
-            self.append_output(f"{self.current_dir}\n", "info")
-            return True
-        
-        elif cmd == "help":
-            help_text = """
-Built-in Commands:
-  help              - Show this help message
-  exit / quit       - Exit the shell
-  clear / cls       - Clear the terminal
-  cd [directory]    - Change directory
-  pwd               - Print working directory
-  sudo [command]    - Execute command with elevated privileges
-  history           - Show command history
-  env               - Show environment variables
-  whoami            - Show current user
-
-System Commands:
-  All other commands are executed as system commands.
-  Use 'sudo' prefix for commands requiring admin privileges.
-"""
-            self.append_output(help_text, "info")
-            return True
-        
-        elif cmd == "history":
-            for i, hist_cmd in enumerate(self.history[-20:], 1):
-                self.append_output(f"{i:4d}  {hist_cmd}\n", "info")
-            return True
-        
-        elif cmd == "env":
-            for key, value in os.environ.items():
-                self.append_output(f"{key}={value}\n", "info")
-            return True
-        
-        elif cmd == "whoami":
-            username = os.getenv("USER") or os.getenv("USERNAME") or "unknown"
-            self.append_output(f"{username}\n", "info")
-            return True
-        
-        elif cmd == "sudo":
-            # Handle sudo command
-            if len(parts) > 1:
-                sudo_command = " ".join(parts[1:])
-                self.run_command_with_elevation(sudo_command)
+                    self._cwd = new_dir
+                    self.current_dir = str(new_dir)
+                    self.append_output(f"Changed directory to: {self.current_dir}\n", "success")
+                    self.update_prompt()
             else:
-                self.append_output("Usage: sudo <command>\n", "error")
-            return True
-        
-        return False
+                # Show current directory
+                self.append_output(f"{self.current_dir}\n", "info")
+        except Exception as e:
+            self.append_output(f"Error: {str(e)}\n", "error")
+    
+    def _chdir(self, path):
+        """chdir to path, through a cached directory fd where the platform allows it."""
+        if not DIR_FD_CHDIR:
+            os.chdir(path)
+            return
+        key = str(path)
+        fd = self._dir_fds.get(key)
+        if fd is not None and not self._dir_fd_current(key, fd):
+            # Deleted or recreated since it was cached: drop the stale fd
+            del self._dir_fds[key]
+            os.close(fd)
+            fd = None
+        if fd is None:
+            fd = os.open(key, os.O_RDONLY | os.O_DIRECTORY)
+            self._dir_fds[key] = fd
+            if len(self._dir_fds) > DIR_FD_CACHE_SIZE:
+                os.close(self._dir_fds.popitem(last=False)[1])
+        else:
+            self._dir_fds.move_to_end(key)
+        os.chdir(fd)
+    
+    @staticmethod
+    def _dir_fd_current(path, fd):
+        """Whether the cached fd still refers to the directory at path."""
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        fst = os.fstat(fd)
+        return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
+    
+    def _close_dir_fds(self):
+        """Close the directory fds kept open for cd."""
+        while self._dir_fds:
+            try:
+                os.close(self._dir_fds.popitem()[1])
+            except OSError:
+                pass
+    
+    def _b_pwd(self, rest):
+        self.append_output(f"{self.current_dir}\n", "info")
+    
+    def _b_help(self, rest):
+        self.append_output(HELP_TEXT, "info")
+    
+    def _b_history(self, rest):
+        recent = islice(self.history, max(0, len(self.history) - 20), None)
+        self.append_output("".join(f"{i:4d}  {hist_cmd}\n" for i, hist_cmd in enumerate(recent, 1)), "info")
+    
+    def _b_env(self, rest):
+        # No builtin changes the environment, so the dump is built once per session
+        if self._env_text is None:
+            self._env_text = "".join(f"{key}={value}\n" for key, value in os.environ.items())
+        self.append_output(self._env_text, "info")
+    
+    def _b_whoami(self, rest):
+        username = os.getenv("USER") or os.getenv("USERNAME") or "unknown"
+        self.append_output(f"{username}\n", "info")
+    
+    def _b_sudo(self, rest):
+        if rest:
+            self.run_command_with_elevation(rest)
+        else:
+            self.append_output("Usage: sudo <command>\n", "error")
+    
+    def _spawn_windows(self, command):
+        """Start command through cmd.exe without flashing a console window."""
+        import subprocess
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            cwd=self.current_dir,
+            shell=True,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+            bufsize=0
+        )
+    
+    def _spawn_posix(self, command):
+        """Start command through /bin/sh."""
+        import subprocess
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            cwd=self.current_dir,
+            shell=True,
+            # Our own fds are non-inheritable already, so skip the close() sweep;
+            # a new session keeps terminal signals for the GUI away from children
+            close_fds=False,
+            start_new_session=True,
+            bufsize=0
+        )
     
     def run_command(self, command):
         """Run a system command."""
         try:
-            # Parse command
-            if self.is_windows:
-                # Windows - use cmd.exe
-                shell_cmd = ["cmd.exe", "/c", command]
-                use_shell = False
-            else:
-                # Linux/Mac - use sh
-                shell_cmd = shlex.split(command)
-                use_shell = True
-            
-            # Start process
-            process = subprocess.Popen(
-                shell_cmd if not self.is_windows else command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                cwd=self.current_dir,
-                shell=use_shell if not self.is_windows else True,
-                text=True,
-                bufsize=1
-            )
+            # Start process (self._spawn is picked for the platform in __init__)
+            process = self._spawn(command)
             
             self.current_process = process
             
-            # Read output in thread
-            def read_output():
-                try:
-                    # Read stdout
-                    for line in iter(process.stdout.readline, ''):
-                        if line:
-                            self.process_queue.put(("stdout", line))
-                    
-                    # Read stderr
-                    for line in iter(process.stderr.readline, ''):
-                        if line:
-                            self.process_queue.put(("stderr", line))
-                    
-                    # Wait for process to complete
-                    process.wait()
-                    self.process_queue.put(("exit", process.returncode))
-                except Exception as e:
-                    self.process_queue.put(("error", str(e)))
-            
-            threading.Thread(target=read_output, daemon=True).start()
+            if self.is_windows:
+                # select() does not work on Windows pipes: one reader per
+                # stream so neither pipe can fill up
+                stderr_reader = threading.Thread(
+                    target=self._read_stream, args=("stderr", process.stderr), daemon=True)
+                stderr_reader.start()
+                threading.Thread(
+                    target=self._read_windows, args=(process, stderr_reader), daemon=True).start()
+            else:
+                # POSIX: hand the pipes to the persistent reader thread
+                if self._reader_thread is None:
+                    self._wake_r, self._wake_w = os.pipe()
+                    self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+                    self._reader_thread.start()
+                self._new_processes.put(process)
+                os.write(self._wake_w, b"\0")
             
         except Exception as e:
             self.append_output(f"Error executing command: {str(e)}\n", "error")
     
+    def _read_stream(self, msg_type, stream):
+        """Read one pipe in large raw chunks: one queue item per chunk instead of one per line."""
+        try:
+            decoder = new_output_decoder()
+            fd = stream.fileno()
+            while True:
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+                text = decoder.decode(chunk, final=not chunk)
+                if text:
+                    self.process_queue.put((msg_type, text))
+                if not chunk:
+                    break
+        except Exception as e:
+            self.process_queue.put(("error", str(e)))
+    
+    def _read_windows(self, process, stderr_reader):
+        """Read stdout on this thread, then report the exit code once both pipes are done."""
+        try:
+            self._read_stream("stdout", process.stdout)
+            stderr_reader.join()
+            process.wait()
+            self.process_queue.put(("exit", process.returncode))
+        except Exception as e:
+            self.process_queue.put(("error", str(e)))
+    
+    def _reader_loop(self):
+        """POSIX: one selector (epoll/kqueue) drains the pipes of every running command."""
+        import selectors
+        waiting = []  # Processes whose pipes are closed but that have not exited yet
+        with selectors.DefaultSelector() as sel:
+            sel.register(self._wake_r, selectors.EVENT_READ, None)
+            while True:
+                for key, _ in sel.select(0.1 if waiting else None):
+                    if key.data is None:
+                        # run_command queued new processes
+                        os.read(self._wake_r, 4096)
+                        while True:
+                            try:
+                                process = self._new_processes.get_nowait()
+                            except queue.Empty:
+                                break
+                            pending = [process, 2]
+                            sel.register(process.stdout, selectors.EVENT_READ,
+                                         ("stdout", new_output_decoder(), pending))
+                            sel.register(process.stderr, selectors.EVENT_READ,
+                                         ("stderr", new_output_decoder(), pending))
+                        continue
+                    
+                    msg_type, decoder, pending = key.data
+                    try:
+                        chunk = os.read(key.fd, READ_CHUNK_SIZE)
+                    except OSError as e:
+                        self.process_queue.put(("error", str(e)))
+                        chunk = b""
+                    text = decoder.decode(chunk, final=not chunk)
+                    if text:
+                        self.process_queue.put((msg_type, text))
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        pending[1] -= 1
+                        if not pending[1]:
+                            waiting.append(pending[0])
+                
+                # Report exits without blocking the other commands on wait()
+                for process in [p for p in waiting if p.poll() is not None]:
+                    waiting.remove(process)
+                    self.process_queue.put(("exit", process.returncode))
+    
     def run_command_with_elevation(self, command):
         """Run a command with elevated privileges."""
         if self.is_admin:
             # Already admin, just run the command
             self.run_command(command)
             return
-        
-        if self.is_windows:
-            # Windows - use runas
-            self.append_output("Requesting administrator privileges...\n", "warning")
+        # self._elevate is picked for the platform in __init__
+        self._elevate(command)
+    
+    def _elevate_windows(self, command):
+        """Run command in an elevated console via PowerShell's RunAs."""
+        import subprocess
+        self.append_output("Requesting administrator privileges...\n", "warning")
+        try:
+            # Use PowerShell to elevate
+            ps_command = f'Start-Process cmd -ArgumentList "/c {command}" -Verb RunAs'
+            subprocess.Popen(
+                ["powershell", "-Command", ps_command],
+                creationflags=subprocess.CREATE_NEW_CONSOLE
+            )
+            self.append_output("Elevated command window opened.\n", "info")
+        except Exception as e:
+            self.append_output(f"Error elevating privileges: {str(e)}\n", "error")
+    
+    def _elevate_linux(self, command):
+        """Run command as root via pkexec, falling back to sudo."""
+        import subprocess
+        self.append_output("Requesting root privileges...\n", "warning")
+        try:
+            # Try pkexec first, fallback to sudo
             try:
-                # Use PowerShell to elevate
-                ps_command = f'Start-Process cmd -ArgumentList "/c {command}" -Verb RunAs'
                 subprocess.Popen(
-                    ["powershell", "-Command", ps_command],
-                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                    ["pkexec", "sh", "-c", command],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
-                self.append_output("Elevated command window opened.\n", "info")
-            except Exception as e:
-                self.append_output(f"Error elevating privileges: {str(e)}\n", "error")
-        else:
-            # Linux/Mac - use sudo
-            self.append_output("Requesting root privileges...\n", "warning")
-            try:
-                # Use pkexec (Linux) or osascript (Mac) for GUI elevation
-                if self.is_linux:
-                    # Try pkexec first, fallback to sudo
-                    try:
-                        subprocess.Popen(
-                            ["pkexec", "sh", "-c", command],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE
-                        )
-                    except:
-                        # Fallback to sudo (will prompt in terminal)
-                        self.append_output("Please enter your password in the terminal.\n", "warning")
-                        subprocess.Popen(
-                            ["sudo", "sh", "-c", command],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE
-                        )
-                else:
-                    # macOS - use osascript for GUI elevation
-                    osascript_cmd = f'''
-                        do shell script "{command}" with administrator privileges
-                    '''
-                    subprocess.Popen(
-                        ["osascript", "-e", osascript_cmd],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE
-                    )
-                self.append_output("Elevated command executed.\n", "info")
-            except Exception as e:
-                self.append_output(f"Error elevating privileges: {str(e)}\n", "error")
+            except:
+                # Fallback to sudo (will prompt in terminal)
+                self.append_output("Please enter your password in the terminal.\n", "warning")
+                subprocess.Popen(
+                    ["sudo", "sh", "-c", command],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            self.append_output("Elevated command executed.\n", "info")
+        except Exception as e:
+            self.append_output(f"Error elevating privileges: {str(e)}\n", "error")
+    
+    def _elevate_mac(self, command):
+        """Run command with administrator privileges via osascript."""
+        import subprocess
+        self.append_output("Requesting root privileges...\n", "warning")
+        try:
+            # macOS - use osascript for GUI elevation
+            osascript_cmd = f'''
+                do shell script "{command}" with administrator privileges
+            '''
+            subprocess.Popen(
+                ["osascript", "-e", osascript_cmd],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            self.append_output("Elevated command executed.\n", "info")
+        except Exception as e:
+            self.append_output(f"Error elevating privileges: {str(e)}\n", "error")
     
     def process_queue_messages(self):
         """Process messages from the command execution queue."""
+        # Collect output into runs of the same tag so each run is one insert
+        runs = []
+        
+        def add(text, tag):
+            if runs and runs[-1][0] == tag:
+                runs[-1][1].append(text)
+            else:
+                runs.append((tag, [text]))
+        
+        handled = 0
         try:
-            while True:
+            while handled < QUEUE_DRAIN_LIMIT:
                 msg_type, content = self.process_queue.get_nowait()
+                handled += 1
                 
                 if msg_type == "stdout":
-                    self.append_output(content, "success")
+                    add(content, "success")
                 elif msg_type == "stderr":
-                    self.append_output(content, "error")
+                    add(content, "error")
                 elif msg_type == "exit":
                     if content != 0:
-                        self.append_output(f"\n[Process exited with code {content}]\n", "warning")
+                        add(f"\n[Process exited with code {content}]\n", "warning")
                     else:
-                        self.append_output("\n[Process completed successfully]\n", "success")
+                        add("\n[Process completed successfully]\n", "success")
                     self.current_process = None
                 elif msg_type == "error":
-                    self.append_output(f"Error: {content}\n", "error")
+                    add(f"Error: {content}\n", "error")
         except queue.Empty:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.process_queue_messages)
+        if runs:
+            for tag, texts in runs:
+                self.output_text.insert(tk.END, "".join(texts), tag)
+            self.trim_output()
+            self.output_text.see(tk.END)
+        
+        # Schedule next check; come back right away if output is still pending
+        self.root.after(1 if handled >= QUEUE_DRAIN_LIMIT else 100, self.process_queue_messages)
+    
+    def _on_entry_key(self, event):
+        """Dispatch Return/Up/Down/Tab; other keys fall through to the Entry."""
+        handler = self._entry_keys.get(event.keysym)
+        if handler is None:
+            return None
+        handler(event)
+        return "break"
     
     def history_up(self, event):
         """Navigate command history up."""
@@ -532,13 +762,44 @@ System Commands:
                 self.command_entry.delete(0, tk.END)
         return "break"
     
+    def _list_dir(self, directory):
+        """Return (name, is_dir) pairs for directory, reusing a recent scan."""
+        now = time.monotonic()
+        cached = self._completion_cache.get(directory)
+        if cached and now - cached[0] < COMPLETION_CACHE_TTL:
+            return cached[1]
+        try:
+            with os.scandir(directory) as it:
+                # DirEntry.is_dir() uses the type from the listing, no extra stat
+                entries = [(entry.name, entry.is_dir()) for entry in it]
+        except OSError:
+            entries = []
+        self._completion_cache[directory] = (now, entries)
+        return entries
+    
     def auto_complete(self, event):
-        """Basic tab completion for file/directory names."""
-        # Simple implementation - can be enhanced
+        """Tab completion for file/directory names."""
+        text = self.command_entry.get()
+        head, sep, token = text.rpartition(" ")
+        folder, name = os.path.split(token)
+        directory = self._cwd / Path(folder).expanduser() if folder else self._cwd
+        
+        matches = [(n, d) for n, d in self._list_dir(str(directory)) if n.startswith(name)]
+        if not matches:
+            return "break"
+        if len(matches) == 1:
+            match, is_dir = matches[0]
+            completion = match + (os.sep if is_dir else "")
+        else:
+            completion = os.path.commonprefix([n for n, _ in matches])
+            self.append_output("  ".join(sorted(n for n, _ in matches)) + "\n", "info")
+        self.command_entry.delete(0, tk.END)
+        self.command_entry.insert(0, head + sep + os.path.join(folder, completion))
         return "break"
     
     def elevate_privileges(self):
         """Attempt to restart with elevated privileges."""
+        import subprocess
         if self.is_admin:
             messagebox.showinfo("Already Admin", "You are already running with administrator privileges.")
             return
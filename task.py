@@ -2,10 +2,12 @@ import tkinter as tk
 from tkinter import messagebox, filedialog, ttk, simpledialog
 import webbrowser, sqlite3, time
 from datetime import datetime, timedelta
-import pytz, os
+import os
+from zoneinfo import ZoneInfo
 import sys
 import json
-import re
+from collections import namedtuple
+from functools import lru_cache
 import shutil
 from pathlib import Path
 import urllib.request
@@ -15,6 +17,8 @@ import uuid
 import subprocess  # For MP3 playback
 from playsound import playsound
 import threading
+import queue
+import atexit
 import ftplib
 from urllib.parse import urlparse
 import math  # For analog clock calculations
@@ -196,6 +200,7 @@ def sync_ftp() -> str:
         return "FTP sync: missing host or username"
     
     remote_file = f"{remote_path}/taskmask.db"
+    checkpoint_db()
     local_exists = os.path.exists(DB_NAME)
     local_mtime = os.path.getmtime(DB_NAME) if local_exists else 0
     local_sha = sha256_file(DB_NAME) if local_exists else ""
@@ -254,7 +259,9 @@ def sync_ftp() -> str:
         direction = "upload" if local_mtime >= server_mtime else "download"
         
         if direction == "download":
-            os.replace(tmp_remote, DB_NAME)
+            with _DB_LOCK:
+                close_db()
+                os.replace(tmp_remote, DB_NAME)
             ftp.quit()
             init_db()
             return "FTP sync: downloaded server DB"
@@ -286,6 +293,7 @@ def sync_s3() -> str:
     if not bucket or not access_key or not secret_key:
         return "S3 sync: missing bucket, access key, or secret key"
     
+    checkpoint_db()
     local_exists = os.path.exists(DB_NAME)
     local_mtime = os.path.getmtime(DB_NAME) if local_exists else 0
     local_sha = sha256_file(DB_NAME) if local_exists else ""
@@ -333,7 +341,9 @@ def sync_s3() -> str:
         direction = "upload" if local_mtime >= server_mtime else "download"
         
         if direction == "download":
-            os.replace(tmp_remote, DB_NAME)
+            with _DB_LOCK:
+                close_db()
+                os.replace(tmp_remote, DB_NAME)
             init_db()
             return "S3 sync: downloaded server DB"
         else:
@@ -364,6 +374,7 @@ def sync_http() -> str:
     meta_url = _join_url(server, "/api/meta", {"user": user})
     db_url = _join_url(server, "/api/db", {"user": user})
 
+    checkpoint_db()
     local_exists = os.path.exists(DB_NAME)
     local_mtime = os.path.getmtime(DB_NAME) if local_exists else 0
     local_sha = sha256_file(DB_NAME) if local_exists else ""
@@ -400,7 +411,9 @@ def sync_http() -> str:
         tmp = DB_NAME + ".tmp"
         with open(tmp, "wb") as f:
             f.write(data)
-        os.replace(tmp, DB_NAME)
+        with _DB_LOCK:
+            close_db()
+            os.replace(tmp, DB_NAME)
         init_db()
         return "HTTP sync: downloaded server DB"
     else:
@@ -502,15 +515,15 @@ def get_db_path() -> str:
 
     return new_db
 
-DB_NAME = get_db_path()
-os.makedirs(os.path.dirname(DB_NAME), exist_ok=True)
+DB_NAME = get_db_path()  # get_db_path() has already created its folder
 
 # Global set to track overdue tasks that have already played sound
 overdue_sound_played = set()
 
-# Global variables for blinking effect
-blinking_tasks = set()  # Track which tasks are currently blinking
-blink_state = True  # Toggle for blinking effect
+# What update_timers last showed per todo row (uuid -> key), to skip unchanged rows
+_timer_row_keys: dict[str, tuple] = {}
+# Open todos with a deadline: the only rows update_timers has to look at
+_timed_todos: set[str] = set()
 
 # In-memory todo model (uuid -> row), rendered in a Treeview (table)
 todo_data: dict[str, dict] = {}  # uuid -> {task, done, deadline, done_at, created_at}
@@ -518,43 +531,63 @@ todo_data: dict[str, dict] = {}  # uuid -> {task, done, deadline, done_at, creat
 # Global icon path
 ICON_PATH = resource_path("icon.ico")
 
+# Overdue alert sound, resolved once instead of on every timer tick
+OVERDUE_SOUND = resource_path("assets", "overdue.mp3")
+HAS_OVERDUE_SOUND = os.path.exists(OVERDUE_SOUND)
+# Optional WAV copy: on Windows winsound plays it straight from memory
+OVERDUE_WAV = None
+if winsound:
+    try:
+        with open(resource_path("assets", "overdue.wav"), "rb") as f:
+            OVERDUE_WAV = f.read()
+    except OSError:
+        pass
+
 # Import shared icon utility
 from icon_utils import set_window_icon as set_icon_shared
 
-# ----------- TASK LISTBOX FORMATTING -----------
+# ----------- TASK FORMATTING -----------
 DEADLINE_RAW_FMT = "%Y-%m-%d %H:%M"
 DEADLINE_DISPLAY_FMT = "%d %B %y, %I:%M %p"
-_DEADLINE_RAW_RE = re.compile(r"⏰\s*\[(?P<raw>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\]")
 
 TS_FMT = "%Y-%m-%d %H:%M:%S"
 CREATED_DISPLAY_FMT = "%d %b %Y, %I:%M %p"  # e.g. 15 Feb 2025, 10:00 PM
-_CREATED_SUFFIX_RE = re.compile(r"\s*\(\d{2}\s+[A-Za-z]{3}\s+\d{4},\s+\d{2}:\d{2}\s+(?:AM|PM)\)\s*$")
+
+# Status column markers; done state itself lives in todo_data, never parsed back from text
+TODO_DONE_MARK = "✅"
+TODO_OPEN_MARK = "☐"
 
 def now_ts() -> str:
     return datetime.now().strftime(TS_FMT)
 
-def parse_todo_listbox_item(item: str) -> tuple[str, bool, str]:
-    """Return (task_text, done, deadline_raw_or_empty)."""
-    done = item.startswith("✅")
-    base = item[2:].strip() if len(item) >= 2 else item.strip()
-    task_part = base.split("⏰")[0].strip()
-    # Remove created-at suffix displayed as "(15 Feb 2025, 10:00 PM)"
-    task_part = _CREATED_SUFFIX_RE.sub("", task_part).strip()
-
-    m = _DEADLINE_RAW_RE.search(item)
-    deadline_raw = m.group("raw") if m else ""
-    return task_part, done, deadline_raw
+@lru_cache(maxsize=512)
+def _parse_deadline(deadline_raw: str) -> datetime | None:
+    """Parse a stored deadline once; update_timers asks for every row on each tick."""
+    try:
+        # DEADLINE_RAW_FMT is ISO 8601 with a space, which fromisoformat reads without strptime's format parsing
+        dt = datetime.fromisoformat(deadline_raw)
+        if dt.tzinfo is not None:
+            # An explicit offset ("+06:00"): deadlines are compared with naive local
+            # datetime.now(), so convert to local time and drop the tzinfo
+            dt = dt.astimezone().replace(tzinfo=None)
+        return dt
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(deadline_raw, DEADLINE_RAW_FMT)  # e.g. unpadded "2025-2-5 9:00"
+    except ValueError:
+        return None
 
 def _deadline_status(deadline_raw: str) -> tuple[datetime | None, timedelta | None, bool]:
     if not deadline_raw:
         return None, None, False
-    try:
-        dt = datetime.strptime(deadline_raw, DEADLINE_RAW_FMT)
-    except ValueError:
+    dt = _parse_deadline(deadline_raw)
+    if dt is None:
         return None, None, False
     delta = dt - datetime.now()
     return dt, delta, delta.total_seconds() <= 0
 
+@lru_cache(maxsize=512)
 def _format_created_display(created_at: str) -> str:
     try:
         dt = datetime.strptime(created_at, TS_FMT)
@@ -562,43 +595,15 @@ def _format_created_display(created_at: str) -> str:
     except Exception:
         return ""
 
-def format_todo_listbox_item(task_text: str, done: bool, deadline_raw: str, created_at: str | None = None) -> str:
-    checkbox = "✅" if done else "☐"
-    task_text = task_text.strip()
-    created_disp = _format_created_display(created_at or "")
-    created_suffix = f" ({created_disp})" if created_disp else ""
-
-    if not deadline_raw:
-        return f"{checkbox} {task_text}{created_suffix}"
-
-    dt, delta, is_overdue = _deadline_status(deadline_raw)
-    if not dt or not delta:
-        return f"{checkbox} {task_text}{created_suffix} ⏰ [{deadline_raw}]"
-
-    pretty = dt.strftime(DEADLINE_DISPLAY_FMT)
-    if is_overdue:
-        return f"{checkbox} {task_text}{created_suffix} ⏰ [{deadline_raw}] {pretty} (OVERDUE!)"
-
-    days = delta.days
-    hours = delta.seconds // 3600
-    minutes = (delta.seconds % 3600) // 60
-    if days > 0:
-        left = f"{days} days left"
-    elif hours > 0:
-        left = f"{hours} hours left"
-    else:
-        left = f"{minutes} min left"
-    return f"{checkbox} {task_text}{created_suffix} ⏰ [{deadline_raw}] {pretty} ({left})"
-
 # ----------- TODO TREEVIEW (TABLE) -----------
+@lru_cache(maxsize=512)
 def _format_deadline_display(deadline_raw: str) -> str:
     if not deadline_raw:
         return ""
-    try:
-        dt = datetime.strptime(deadline_raw, DEADLINE_RAW_FMT)
-        return dt.strftime(DEADLINE_DISPLAY_FMT)
-    except Exception:
+    dt = _parse_deadline(deadline_raw)
+    if dt is None:
         return deadline_raw
+    return dt.strftime(DEADLINE_DISPLAY_FMT)
 
 def _format_time_left(deadline_raw: str, done: bool) -> tuple[str, str]:
     """
@@ -624,16 +629,17 @@ def _format_time_left(deadline_raw: str, done: bool) -> tuple[str, str]:
         return (f"{hours}h {minutes}m left", tag)
     return (f"{minutes}m left", "soon")
 
-def todo_tree_row_values(uuid_val: str) -> tuple[str, str, str, str, str]:
+def todo_tree_row(uuid_val: str) -> tuple[tuple[str, str, str, str, str], str]:
+    """(values, color tag) for one todo row, from a single time-left computation."""
     row = todo_data.get(uuid_val, {})
     done = bool(row.get("done"))
     task = str(row.get("task") or "")
     created = _format_created_display(str(row.get("created_at") or ""))
     deadline_raw = str(row.get("deadline") or "")
     deadline = _format_deadline_display(deadline_raw)
-    left, _tag = _format_time_left(deadline_raw, done)
-    status = "✅" if done else "☐"
-    return (status, task, created, deadline, left)
+    left, tag = _format_time_left(deadline_raw, done)
+    status = TODO_DONE_MARK if done else TODO_OPEN_MARK
+    return (status, task, created, deadline, left), tag
 
 def refresh_todo_tree(selection_uuid: str | None = None):
     """Rebuild the todo Treeview from todo_data and keep selection if possible."""
@@ -642,14 +648,12 @@ def refresh_todo_tree(selection_uuid: str | None = None):
     # Preserve order by order_index
     ordered = sorted(todo_data.items(), key=lambda kv: kv[1].get("order_index", 0))
     todo_tree.delete(*todo_tree.get_children())
+    _timed_todos.clear()
     for idx, (uuid_val, row) in enumerate(ordered):
         row["order_index"] = idx
-        todo_data[uuid_val] = row
-        values = todo_tree_row_values(uuid_val)
-        deadline_raw = str(row.get("deadline") or "")
-        left, tag = _format_time_left(deadline_raw, bool(row.get("done")))
+        values, tag = todo_tree_row(uuid_val)
         todo_tree.insert("", "end", iid=uuid_val, values=values, tags=(tag,))
-    _configure_todo_tree_tags()
+        _track_timed_todo(uuid_val, row)
     if selection_uuid and selection_uuid in todo_data:
         try:
             todo_tree.selection_set(selection_uuid)
@@ -657,6 +661,26 @@ def refresh_todo_tree(selection_uuid: str | None = None):
         except Exception:
             pass
 
+def refresh_todo_row(uuid_val: str):
+    """Update one todo row in place; selection and scroll position are kept."""
+    row = todo_data.get(uuid_val)
+    if row is None or "todo_tree" not in globals():
+        return
+    values, tag = todo_tree_row(uuid_val)
+    try:
+        todo_tree.item(uuid_val, values=values, tags=(tag,))
+    except tk.TclError:
+        refresh_todo_tree(selection_uuid=uuid_val)
+        return
+    _track_timed_todo(uuid_val, row)
+
+def _track_timed_todo(uuid_val: str, row: dict):
+    """Keep _timed_todos in step with a row just drawn: only open rows with a deadline tick."""
+    if row.get("deadline") and not row.get("done"):
+        _timed_todos.add(uuid_val)
+    else:
+        _timed_todos.discard(uuid_val)
+
 def _configure_todo_tree_tags():
     try:
         todo_tree.tag_configure("done", foreground="#1e7e34")
@@ -674,13 +698,6 @@ def get_selected_todo_uuid() -> str | None:
     sel = todo_tree.selection()
     return sel[0] if sel else None
 
-def apply_todo_item_style(index: int, done: bool, deadline_raw: str):
-    """Set listbox item fg/bg based on done + deadline urgency (keeps selected highlight handled elsewhere)."""
-    # Legacy listbox styling (todo UI is now a Treeview table). Keep safe no-op.
-    # This function is deprecated as we now use Treeview instead of Listbox
-    # Styling is handled directly in refresh_todo_tree()
-    pass
-
 def set_window_icon(window):
     """Set icon for a window if icon file exists - uses shared icon utility"""
     set_icon_shared(window)
@@ -741,95 +758,244 @@ def add_placeholder(entry, placeholder):
     entry.bind('<FocusOut>', on_focus_out)
 
 # ----------- DATABASE SETUP -----------
+# One connection for the whole app, shared with the sync thread under _DB_LOCK
+_CONN = None
+_DB_LOCK = threading.RLock()
+
+# Hot statements, kept as one string each so they always hit the connection's statement cache
+SQL_LIST_TODOS = "SELECT uuid, task, done, deadline, done_at, created_at, order_index FROM todos ORDER BY order_index ASC, created_at ASC"
+SQL_INSERT_TODO = ("INSERT INTO todos (uuid, task, done, deadline, done_at, created_at, order_index) "
+                   "VALUES (?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(order_index), -1) + 1 FROM todos))")
+SQL_UPDATE_TODO = "UPDATE todos SET task = ?, done = ?, deadline = ?, done_at = ? WHERE uuid = ?"
+SQL_DELETE_TODO = "DELETE FROM todos WHERE uuid = ?"
+# Move Up/Down: swap two rows' order_index. The SUM subquery is uncorrelated, so SQLite
+# evaluates it once, before either row changes
+SQL_SWAP_TODO_ORDER = ("UPDATE todos SET order_index = (SELECT SUM(order_index) FROM todos WHERE uuid IN (?, ?)) "
+                       "- order_index WHERE uuid IN (?, ?)")
+SQL_UPSERT_TODO = ("INSERT INTO todos (uuid, task, done, deadline, done_at, created_at, order_index) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(uuid) DO UPDATE SET "
+                   "task = excluded.task, done = excluded.done, deadline = excluded.deadline, "
+                   "done_at = excluded.done_at, created_at = excluded.created_at, order_index = excluded.order_index")
+SQL_LIST_NOTES = "SELECT id, title, content, created_at, order_index FROM notes ORDER BY order_index ASC"
+SQL_INSERT_NOTE = "INSERT INTO notes (title, content, order_index) VALUES (?, ?, (SELECT COALESCE(MAX(order_index), 0) + 1 FROM notes))"
+SQL_DELETE_NOTE = "DELETE FROM notes WHERE id = ?"
+SQL_SWAP_NOTE_ORDER = ("UPDATE notes SET order_index = (SELECT SUM(order_index) FROM notes WHERE id IN (?, ?)) "
+                       "- order_index WHERE id IN (?, ?)")
+SQL_GET_NOTE = "SELECT id, title, content, created_at, order_index FROM notes WHERE id = ?"
+SQL_LIST_LINKS = "SELECT id, name, url, order_index FROM links ORDER BY order_index ASC"
+SQL_INSERT_LINK = "INSERT INTO links (name, url, order_index) VALUES (?, ?, (SELECT COALESCE(MAX(order_index), 0) + 1 FROM links))"
+SQL_DELETE_LINK = "DELETE FROM links WHERE id = ?"
+SQL_SWAP_LINK_ORDER = ("UPDATE links SET order_index = (SELECT SUM(order_index) FROM links WHERE id IN (?, ?)) "
+                       "- order_index WHERE id IN (?, ?)")
+# INSERT ... RETURNING hands back the new row so the caches can take it without a re-SELECT
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+SQL_INSERT_NOTE_RETURNING = SQL_INSERT_NOTE + " RETURNING id, title, content, created_at, order_index"
+SQL_INSERT_LINK_RETURNING = SQL_INSERT_LINK + " RETURNING id, name, url, order_index"
+
+def get_db() -> sqlite3.Connection:
+    """Return the shared connection to DB_NAME, opening it on first use."""
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_NAME, check_same_thread=False, cached_statements=64)
+        # WAL: a save is one fsync and readers never wait on it. synchronous is
+        # per connection, so these are applied whenever the connection (re)opens.
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CONN.execute("PRAGMA temp_store=MEMORY")
+        _CONN.execute("PRAGMA cache_size=-8000")
+    return _CONN
+
+def checkpoint_db():
+    """Fold the WAL back into DB_NAME so the file itself is complete (before copying/hashing it)."""
+    db_flush()
+    with _DB_LOCK:
+        if _CONN is not None:
+            _CONN.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+def close_db():
+    """Close the shared connection; call (holding _DB_LOCK) before DB_NAME is replaced on disk."""
+    global _CONN
+    with _DB_LOCK:
+        if _CONN is not None:
+            _CONN.close()
+            _CONN = None
+        # The file may be about to change underneath us
+        invalidate_links_cache()
+        invalidate_notes_cache()
+
+atexit.register(close_db)
+
+# Todo row writes are queued to one writer thread so the Tk thread never waits on commit/fsync
+_db_jobs = queue.Queue()
+DB_WRITE_COALESCE_SEC = 0.25
+_db_writer = None
+
+def db_write_async(sql: str, params, many: bool = False):
+    """Queue one write statement (params snapshotted by the caller) for the writer thread."""
+    global _db_writer
+    if _db_writer is None:
+        _db_writer = threading.Thread(target=_db_writer_loop, daemon=True)
+        _db_writer.start()
+    _db_jobs.put((sql, params, many))
+
+def _db_writer_loop():
+    while True:
+        jobs = [_db_jobs.get()]
+        # Let a burst of edits (toggles, Move Up/Down clicks) queue up, then commit it once
+        time.sleep(DB_WRITE_COALESCE_SEC)
+        while True:
+            try:
+                jobs.append(_db_jobs.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with _DB_LOCK, get_db() as conn:
+                for sql, params, many in jobs:
+                    # A failed statement is rolled back on its own; the rest still commit
+                    try:
+                        if many:
+                            conn.executemany(sql, params)
+                        else:
+                            conn.execute(sql, params)
+                    except sqlite3.Error as e:
+                        print(f"DB write error: {e}")
+        except Exception as e:
+            print(f"DB write error: {e}")
+        finally:
+            for _ in jobs:
+                _db_jobs.task_done()
+
+def db_flush():
+    """Wait for queued writes to land; call before reading todos back or touching the DB file.
+    Never call it while holding _DB_LOCK (the writer needs it)."""
+    _db_jobs.join()
+
+# Registered after close_db, so it runs first at exit
+atexit.register(db_flush)
+
+# Bump whenever init_db gains a table, column or index
+SCHEMA_VERSION = 3
+
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    
-    # Create todos table with new schema
-    c.execute('''CREATE TABLE IF NOT EXISTS todos 
-                 (id INTEGER PRIMARY KEY, 
-                  uuid TEXT,
-                  task TEXT, 
-                  done INTEGER,
-                  deadline TEXT,
-                  done_at TEXT,
-                  order_index INTEGER DEFAULT 0,
-                  created_at TEXT)''')
-    
-    # Check if deadline column exists, if not add it
-    c.execute("PRAGMA table_info(todos)")
-    columns = [column[1] for column in c.fetchall()]
-    
-    if 'deadline' not in columns:
-        c.execute("ALTER TABLE todos ADD COLUMN deadline TEXT")
-
-    if 'uuid' not in columns:
-        c.execute("ALTER TABLE todos ADD COLUMN uuid TEXT")
-    if 'done_at' not in columns:
-        c.execute("ALTER TABLE todos ADD COLUMN done_at TEXT")
-    if 'order_index' not in columns:
-        c.execute("ALTER TABLE todos ADD COLUMN order_index INTEGER DEFAULT 0")
-    
-    if 'created_at' not in columns:
-        c.execute("ALTER TABLE todos ADD COLUMN created_at TEXT")
-        # Update existing rows with current timestamp
-        c.execute("UPDATE todos SET created_at = datetime('now') WHERE created_at IS NULL")
-
-    # Archive table for completed tasks (auto-moved after 12h)
-    c.execute('''CREATE TABLE IF NOT EXISTS archive_todos
-                 (id INTEGER PRIMARY KEY,
-                  uuid TEXT UNIQUE,
-                  task TEXT,
-                  done_at TEXT,
-                  deadline TEXT,
-                  created_at TEXT,
-                  archived_at TEXT)''')
-    
-    # Create notes table with new schema
-    c.execute('''CREATE TABLE IF NOT EXISTS notes 
-                 (id INTEGER PRIMARY KEY,
-                  title TEXT NOT NULL,
-                  content TEXT NOT NULL,
-                  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                  order_index INTEGER DEFAULT 0)''')
-    
-    # Check if order_index column exists, if not add it
-    c.execute("PRAGMA table_info(notes)")
-    note_columns = [column[1] for column in c.fetchall()]
-    
-    if 'order_index' not in note_columns:
-        c.execute("ALTER TABLE notes ADD COLUMN order_index INTEGER DEFAULT 0")
-    
-    # Create links table with new schema
-    c.execute('''CREATE TABLE IF NOT EXISTS links 
-                 (id INTEGER PRIMARY KEY, 
-                  name TEXT, 
-                  url TEXT,
-                  order_index INTEGER DEFAULT 0)''')
-    
-    # Check if order_index column exists, if not add it
-    c.execute("PRAGMA table_info(links)")
-    link_columns = [column[1] for column in c.fetchall()]
-    
-    if 'order_index' not in link_columns:
-        c.execute("ALTER TABLE links ADD COLUMN order_index INTEGER DEFAULT 0")
-    
-    conn.commit()
-    conn.close()
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        # Already migrated by this version: skip the table_info checks
+        if c.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        # sqlite3 only opens a transaction before DML, so the DDL below would each
+        # commit on their own; run the whole migration as one transaction instead
+        if not conn.in_transaction:
+            c.execute("BEGIN")
+
+        # Create todos table with new schema
+        c.execute('''CREATE TABLE IF NOT EXISTS todos 
+                     (id INTEGER PRIMARY KEY, 
+                      uuid TEXT,
+                      task TEXT, 
+                      done INTEGER,
+                      deadline TEXT,
+                      done_at TEXT,
+                      order_index INTEGER DEFAULT 0,
+                      created_at TEXT)''')
+        
+        # Check if deadline column exists, if not add it
+        c.execute("PRAGMA table_info(todos)")
+        columns = [column[1] for column in c.fetchall()]
+        
+        if 'deadline' not in columns:
+            c.execute("ALTER TABLE todos ADD COLUMN deadline TEXT")
+
+        if 'uuid' not in columns:
+            c.execute("ALTER TABLE todos ADD COLUMN uuid TEXT")
+        if 'done_at' not in columns:
+            c.execute("ALTER TABLE todos ADD COLUMN done_at TEXT")
+        if 'order_index' not in columns:
+            c.execute("ALTER TABLE todos ADD COLUMN order_index INTEGER DEFAULT 0")
+        
+        if 'created_at' not in columns:
+            c.execute("ALTER TABLE todos ADD COLUMN created_at TEXT")
+            # Update existing rows with current timestamp
+            c.execute("UPDATE todos SET created_at = datetime('now') WHERE created_at IS NULL")
+        # persist_todos_to_db upserts on uuid; keep the first row of any duplicate
+        c.execute("DELETE FROM todos WHERE uuid IS NOT NULL AND id NOT IN "
+                  "(SELECT MIN(id) FROM todos WHERE uuid IS NOT NULL GROUP BY uuid)")
+        c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_todos_uuid ON todos(uuid)")
+        # SQL_INSERT_TODO's MAX(order_index) and load_todos() sort read this
+        c.execute("CREATE INDEX IF NOT EXISTS idx_todos_order ON todos(order_index)")
+
+        # Archive table for completed tasks (auto-moved after 12h)
+        c.execute('''CREATE TABLE IF NOT EXISTS archive_todos
+                     (id INTEGER PRIMARY KEY,
+                      uuid TEXT UNIQUE,
+                      task TEXT,
+                      done_at TEXT,
+                      deadline TEXT,
+                      created_at TEXT,
+                      archived_at TEXT)''')
+        
+        # Create notes table with new schema
+        c.execute('''CREATE TABLE IF NOT EXISTS notes 
+                     (id INTEGER PRIMARY KEY,
+                      title TEXT NOT NULL,
+                      content TEXT NOT NULL,
+                      created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                      order_index INTEGER DEFAULT 0)''')
+        
+        # Check if order_index column exists, if not add it
+        c.execute("PRAGMA table_info(notes)")
+        note_columns = [column[1] for column in c.fetchall()]
+        
+        if 'order_index' not in note_columns:
+            c.execute("ALTER TABLE notes ADD COLUMN order_index INTEGER DEFAULT 0")
+        # get_all_notes() sorts by order_index
+        c.execute("CREATE INDEX IF NOT EXISTS idx_notes_order ON notes(order_index)")
+        
+        # Create links table with new schema
+        c.execute('''CREATE TABLE IF NOT EXISTS links 
+                     (id INTEGER PRIMARY KEY, 
+                      name TEXT, 
+                      url TEXT,
+                      order_index INTEGER DEFAULT 0)''')
+        
+        # Check if order_index column exists, if not add it
+        c.execute("PRAGMA table_info(links)")
+        link_columns = [column[1] for column in c.fetchall()]
+        
+        if 'order_index' not in link_columns:
+            c.execute("ALTER TABLE links ADD COLUMN order_index INTEGER DEFAULT 0")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_links_order ON links(order_index)")
+
+        # Move Up/Down swap order_index values, which needs them distinct; rows
+        # from before order_index existed all share the default 0
+        for table, order_by in (("todos", "order_index, created_at, id"),
+                                ("notes", "order_index, id"),
+                                ("links", "order_index, id")):
+            c.execute(f"SELECT 1 FROM {table} GROUP BY order_index HAVING COUNT(*) > 1 LIMIT 1")
+            if c.fetchone():
+                c.execute(f"SELECT id FROM {table} ORDER BY {order_by}")
+                c.executemany(f"UPDATE {table} SET order_index = ? WHERE id = ?",
+                              [(idx, row_id) for idx, (row_id,) in enumerate(c.fetchall())])
+        c.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
 def load_todos():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT uuid, task, done, deadline, done_at, created_at, order_index FROM todos ORDER BY order_index ASC, created_at ASC")
-    todos = c.fetchall()
-    conn.close()
+    db_flush()
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        c.execute(SQL_LIST_TODOS)
+        todos = c.fetchall()
     return todos
 
-def load_todo_data_from_db():
-    """Populate in-memory todo_data from DB rows (used at startup / after restore/sync)."""
+def load_todo_data_from_db(rows=None):
+    """Populate in-memory todo_data from DB rows (used at startup / after restore/sync).
+    rows: already-fetched load_todos() result; read from the DB when omitted."""
+    if rows is None:
+        rows = load_todos()
     todo_data.clear()
-    for uuid_val, task, done, deadline, done_at, created_at, order_index in load_todos():
-        uuid_val = uuid_val or str(uuid.uuid4())
+    missing_uuid = False
+    for uuid_val, task, done, deadline, done_at, created_at, order_index in rows:
+        if not uuid_val:
+            missing_uuid = True
+            uuid_val = str(uuid.uuid4())
         todo_data[uuid_val] = {
             "task": task or "",
             "done": bool(done),
@@ -838,30 +1004,72 @@ def load_todo_data_from_db():
             "created_at": created_at or now_ts(),
             "order_index": int(order_index or 0),
         }
+    # Row writes below go by uuid, so give legacy rows theirs in the DB too
+    if missing_uuid:
+        persist_todos_to_db(sorted(todo_data, key=lambda u: todo_data[u]["order_index"]))
 
 def persist_todos_to_db(todo_order: list[str]):
-    """Persist all todos in the given order_index order (simple & reliable)."""
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("DELETE FROM todos")
+    """Upsert all todos in the given order_index order and drop rows no longer in it."""
+    rows = []
     for idx, uuid_val in enumerate(todo_order):
         row = todo_data.get(uuid_val)
         if not row:
             continue
-        c.execute(
-            "INSERT INTO todos (uuid, task, done, deadline, done_at, created_at, order_index) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                uuid_val,
-                row.get("task", ""),
-                1 if row.get("done") else 0,
-                row.get("deadline", ""),
-                row.get("done_at", ""),
-                row.get("created_at", now_ts()),
-                idx,
-            ),
-        )
-    conn.commit()
-    conn.close()
+        rows.append((
+            uuid_val,
+            row.get("task", ""),
+            1 if row.get("done") else 0,
+            row.get("deadline", ""),
+            row.get("done_at", ""),
+            row.get("created_at", now_ts()),
+            idx,
+        ))
+    keep = {r[0] for r in rows}
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        c.execute("SELECT uuid FROM todos")
+        stale = [(u,) for (u,) in c.fetchall() if u and u not in keep]
+        c.execute("DELETE FROM todos WHERE uuid IS NULL OR uuid = ''")
+        c.executemany(SQL_DELETE_TODO, stale)
+        c.executemany(SQL_UPSERT_TODO, rows)
+
+def insert_todo_row(uuid_val: str):
+    """Queue an insert of one todo from todo_data at the end of the saved order."""
+    row = todo_data[uuid_val]
+    db_write_async(
+        SQL_INSERT_TODO,
+        (
+            uuid_val,
+            row.get("task", ""),
+            1 if row.get("done") else 0,
+            row.get("deadline", ""),
+            row.get("done_at", ""),
+            row.get("created_at", now_ts()),
+        ),
+    )
+
+def update_todo_row(uuid_val: str):
+    """Queue a write of one todo's task/done/deadline/done_at from todo_data."""
+    row = todo_data[uuid_val]
+    db_write_async(
+        SQL_UPDATE_TODO,
+        (
+            row.get("task", ""),
+            1 if row.get("done") else 0,
+            row.get("deadline", ""),
+            row.get("done_at", ""),
+            uuid_val,
+        ),
+    )
+
+def delete_todo_row(uuid_val: str):
+    db_write_async(SQL_DELETE_TODO, (uuid_val,))
+
+def swap_todo_order(uuid_a: str, uuid_b: str):
+    """Swap two todos' order_index in todo_data and queue the same swap for the DB."""
+    row_a, row_b = todo_data[uuid_a], todo_data[uuid_b]
+    row_a["order_index"], row_b["order_index"] = row_b.get("order_index", 0), row_a.get("order_index", 0)
+    db_write_async(SQL_SWAP_TODO_ORDER, (uuid_a, uuid_b, uuid_a, uuid_b))
 
 def archive_completed_tasks():
     """Move completed tasks to archive if they've been done for more than threshold hours."""
@@ -870,44 +1078,42 @@ def archive_completed_tasks():
         threshold_seconds = threshold_hours * 3600
         current_time = datetime.now()
         
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        
-        # Get all completed tasks that haven't been archived yet
-        c.execute("SELECT uuid, task, done, deadline, done_at, created_at FROM todos WHERE done = 1 AND done_at IS NOT NULL AND done_at != ''")
-        completed_tasks = c.fetchall()
-        
-        archived_count = 0
-        for uuid_val, task, done, deadline, done_at, created_at in completed_tasks:
-            if not done_at:
-                continue
+        db_flush()
+        with _DB_LOCK, get_db() as conn:
+            c = conn.cursor()
             
-            try:
-                # Parse done_at timestamp
-                done_time = datetime.strptime(done_at, TS_FMT)
-                time_since_done = (current_time - done_time).total_seconds()
+            # Get all completed tasks that haven't been archived yet
+            c.execute("SELECT uuid, task, done, deadline, done_at, created_at FROM todos WHERE done = 1 AND done_at IS NOT NULL AND done_at != ''")
+            completed_tasks = c.fetchall()
+            
+            archived_count = 0
+            for uuid_val, task, done, deadline, done_at, created_at in completed_tasks:
+                if not done_at:
+                    continue
                 
-                # If task has been done for more than threshold, archive it
-                if time_since_done >= threshold_seconds:
-                    # Check if already archived
-                    c.execute("SELECT id FROM archive_todos WHERE uuid = ?", (uuid_val,))
-                    if c.fetchone():
-                        # Already archived, just remove from todos
-                        c.execute("DELETE FROM todos WHERE uuid = ?", (uuid_val,))
-                    else:
-                        # Move to archive
-                        c.execute("""
-                            INSERT INTO archive_todos (uuid, task, done_at, deadline, created_at, archived_at)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                        """, (uuid_val, task, done_at, deadline or "", created_at or now_ts(), now_ts()))
-                        c.execute("DELETE FROM todos WHERE uuid = ?", (uuid_val,))
-                        archived_count += 1
-            except ValueError:
-                # Invalid timestamp format, skip
-                continue
-        
-        conn.commit()
-        conn.close()
+                try:
+                    # Parse done_at timestamp
+                    done_time = datetime.strptime(done_at, TS_FMT)
+                    time_since_done = (current_time - done_time).total_seconds()
+                    
+                    # If task has been done for more than threshold, archive it
+                    if time_since_done >= threshold_seconds:
+                        # Check if already archived
+                        c.execute("SELECT id FROM archive_todos WHERE uuid = ?", (uuid_val,))
+                        if c.fetchone():
+                            # Already archived, just remove from todos
+                            c.execute("DELETE FROM todos WHERE uuid = ?", (uuid_val,))
+                        else:
+                            # Move to archive
+                            c.execute("""
+                                INSERT INTO archive_todos (uuid, task, done_at, deadline, created_at, archived_at)
+                                VALUES (?, ?, ?, ?, ?, ?)
+                            """, (uuid_val, task, done_at, deadline or "", created_at or now_ts(), now_ts()))
+                            c.execute("DELETE FROM todos WHERE uuid = ?", (uuid_val,))
+                            archived_count += 1
+                except ValueError:
+                    # Invalid timestamp format, skip
+                    continue
         
         # Refresh UI if any tasks were archived
         if archived_count > 0:
@@ -922,127 +1128,153 @@ def archive_completed_tasks():
 
 def load_archived_todos():
     """Load archived tasks from database."""
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT uuid, task, done_at, deadline, created_at, archived_at FROM archive_todos ORDER BY archived_at DESC")
-    archived = c.fetchall()
-    conn.close()
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        c.execute("SELECT uuid, task, done_at, deadline, created_at, archived_at FROM archive_todos ORDER BY archived_at DESC")
+        archived = c.fetchall()
     return archived
 
-def save_todos(todo_listbox):
-    # Backward-compatible stub (todo_listbox no longer the primary UI).
-    # If old code paths call this, keep DB consistent by reloading UI from DB later.
-    try:
-        # Best effort: persist current in-memory model in its current order.
-        if "todo_tree" in globals():
-            order = list(todo_tree.get_children())
-        else:
-            order = sorted(todo_data.keys(), key=lambda u: todo_data[u].get("order_index", 0))
-        persist_todos_to_db(order)
-    except Exception as e:
-        print(f"save_todos warning: {e}")
+# Named rows for links and notes (plain tuples underneath, so unpacking still works)
+Link = namedtuple("Link", "id name url order_index")
+Note = namedtuple("Note", "id title content created_at order_index")
+
+def _rows(row_type, sql: str, params=()):
+    """Run a query on the shared connection with its rows built as row_type."""
+    cur = get_db().cursor()
+    cur.row_factory = lambda _cur, row: row_type._make(row)
+    return cur.execute(sql, params)
+
+# Links and notes as last read from the DB; every write (and close_db) drops them
+_links_cache: list | None = None
+_notes_cache: list | None = None
+_notes_by_id: dict = {}
+# Set on every change to the data; refresh_links / refresh_notes skip their rebuild while clear
+_links_dirty = True
+_notes_dirty = True
+
+def invalidate_links_cache():
+    global _links_cache, _links_dirty
+    _links_cache = None
+    _links_dirty = True
+
+def invalidate_notes_cache():
+    global _notes_cache, _notes_dirty
+    _notes_cache = None
+    _notes_dirty = True
 
 def load_links():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT id, name, url, order_index FROM links ORDER BY order_index ASC")
-    links = c.fetchall()
-    conn.close()
-    return links
+    global _links_cache
+    with _DB_LOCK:
+        if _links_cache is None:
+            _links_cache = _rows(Link, SQL_LIST_LINKS).fetchall()
+        return _links_cache
 
 def save_link(name, url):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT MAX(order_index) FROM links")
-    max_order = c.fetchone()[0] or 0
-    c.execute("INSERT INTO links (name, url, order_index) VALUES (?, ?, ?)", (name, url, max_order + 1))
-    conn.commit()
-    conn.close()
+    global _links_dirty
+    with _DB_LOCK, get_db() as conn:
+        if HAS_RETURNING:
+            _links_dirty = True
+            # fetchall() finishes the statement before the commit
+            link = _rows(Link, SQL_INSERT_LINK_RETURNING, (name, url)).fetchall()[0]
+            if _links_cache is not None:
+                _links_cache.append(link)  # MAX(order_index) + 1 sorts last
+            return link.id
+        c = conn.cursor()
+        c.execute(SQL_INSERT_LINK, (name, url))
+        invalidate_links_cache()
+        return c.lastrowid
 
 def delete_link(link_id):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("DELETE FROM links WHERE id = ?", (link_id,))
-    conn.commit()
-    conn.close()
-
-def update_link_order(link_id, new_order):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("UPDATE links SET order_index = ? WHERE id = ?", (new_order, link_id))
-    conn.commit()
-    conn.close()
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        c.execute(SQL_DELETE_LINK, (link_id,))
+        invalidate_links_cache()
+
+def swap_link_order(link_a, link_b):
+    with _DB_LOCK, get_db() as conn:
+        conn.execute(SQL_SWAP_LINK_ORDER, (link_a, link_b, link_a, link_b))
+        invalidate_links_cache()
 
 def save_note(title, content):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT MAX(order_index) FROM notes")
-    max_order = c.fetchone()[0] or 0
-    c.execute("INSERT INTO notes (title, content, order_index) VALUES (?, ?, ?)", (title, content, max_order + 1))
-    conn.commit()
-    conn.close()
+    global _notes_dirty
+    with _DB_LOCK, get_db() as conn:
+        if HAS_RETURNING:
+            _notes_dirty = True
+            note = _rows(Note, SQL_INSERT_NOTE_RETURNING, (title, content)).fetchall()[0]
+            if _notes_cache is not None:
+                _notes_cache.append(note)
+                _notes_by_id[note.id] = note
+            return note.id
+        c = conn.cursor()
+        c.execute(SQL_INSERT_NOTE, (title, content))
+        invalidate_notes_cache()
+        return c.lastrowid
 
 def delete_note(note_id):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-    conn.commit()
-    conn.close()
-
-def update_note_order(note_id, new_order):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("UPDATE notes SET order_index = ? WHERE id = ?", (new_order, note_id))
-    conn.commit()
-    conn.close()
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        c.execute(SQL_DELETE_NOTE, (note_id,))
+        invalidate_notes_cache()
+
+def swap_note_order(note_a, note_b):
+    with _DB_LOCK, get_db() as conn:
+        conn.execute(SQL_SWAP_NOTE_ORDER, (note_a, note_b, note_a, note_b))
+        invalidate_notes_cache()
 
 def update_note(note_id, title, content):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("UPDATE notes SET title = ?, content = ? WHERE id = ?", (title, content, note_id))
-    conn.commit()
-    conn.close()
+    with _DB_LOCK, get_db() as conn:
+        c = conn.cursor()
+        c.execute("UPDATE notes SET title = ?, content = ? WHERE id = ?", (title, content, note_id))
+        invalidate_notes_cache()
 
 def get_all_notes():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT id, title, content, created_at, order_index FROM notes ORDER BY order_index ASC")
-    notes = c.fetchall()
-    conn.close()
-    return notes
+    global _notes_cache, _notes_by_id
+    with _DB_LOCK:
+        if _notes_cache is None:
+            _notes_cache = _rows(Note, SQL_LIST_NOTES).fetchall()
+            _notes_by_id = {note.id: note for note in _notes_cache}
+        return _notes_cache
+
+def get_note(note_id):
+    """One note row by id, or None; a keyed SELECT when the notes cache is cold."""
+    with _DB_LOCK:
+        if _notes_cache is None:
+            return _rows(Note, SQL_GET_NOTE, (note_id,)).fetchone()
+        return _notes_by_id.get(note_id)
 
 # ----------- REORDERING FUNCTIONS -----------
-def move_up(listbox, save_func, update_order_func, items_data):
+def _move_row(listbox, step, row_id, swap_order, rows=None):
+    """Move the selected row one place and swap its order_index with the neighbour's.
+    row_id maps a listbox index to its row's DB id; swap_order(id_a, id_b) persists the swap.
+    rows, if given, is a list kept parallel to the listbox and is reordered with it."""
     selection = listbox.curselection()
-    if selection and selection[0] > 0:
-        index = selection[0]
-        text = listbox.get(index)
-        listbox.delete(index)
-        listbox.insert(index - 1, text)
-        listbox.selection_set(index - 1)
-        
-        # Update order in database
-        if items_data:
-            item_id = items_data[index][0]  # Assuming first element is ID
-            update_order_func(item_id, index)
-        save_func(listbox)
-
-def move_down(listbox, save_func, update_order_func, items_data):
-    selection = listbox.curselection()
-    if selection and selection[0] < listbox.size() - 1:
-        index = selection[0]
-        text = listbox.get(index)
-        listbox.delete(index)
-        listbox.insert(index + 1, text)
-        listbox.selection_set(index + 1)
-        
-        # Update order in database
-        if items_data:
-            item_id = items_data[index][0]  # Assuming first element is ID
-            update_order_func(item_id, index + 2)
-        save_func(listbox)
+    if not selection:
+        return
+    index = selection[0]
+    other = index + step
+    if not 0 <= other < listbox.size():
+        return
+    item_id, other_id = row_id(index), row_id(other)
+    text = listbox.get(index)
+    listbox.delete(index)
+    listbox.insert(other, text)
+    listbox.selection_set(other)
+    if rows is not None:
+        rows[index], rows[other] = rows[other], rows[index]
+    if item_id is not None and other_id is not None and item_id != other_id:
+        swap_order(item_id, other_id)
+
+def move_up(listbox, row_id, swap_order, rows=None):
+    _move_row(listbox, -1, row_id, swap_order, rows)
+
+def move_down(listbox, row_id, swap_order, rows=None):
+    _move_row(listbox, 1, row_id, swap_order, rows)
 
 # ----------- TIMER FUNCTIONS -----------
+# Quick-pick buttons in the Set Deadline dialog: (label, hour, AM/PM)
+TIMER_QUICK_TIMES = (("9:00 AM", 9, "AM"), ("12:00 PM", 12, "PM"),
+                     ("3:00 PM", 3, "PM"), ("6:00 PM", 6, "PM"))
+
 def add_timer_window(selected_uuid: str | None = None):
     selected_uuid = selected_uuid or get_selected_todo_uuid()
     if not selected_uuid or selected_uuid not in todo_data:
@@ -1175,15 +1407,9 @@ def add_timer_window(selected_uuid: str | None = None):
     def set_quick_time(hour, ampm):
         hour_var.set(str(hour))
         minute_var.set("00")
-        ampm_var.set(ampm)
-        update_ampm_style()
-    
-    quick_times = [
-        ("9:00 AM", 9, "AM"), ("12:00 PM", 12, "PM"), 
-        ("3:00 PM", 3, "PM"), ("6:00 PM", 6, "PM")
-    ]
+        ampm_var.set(ampm)  # the ampm_var trace restyles the AM/PM buttons
     
-    for i, (label, h, a) in enumerate(quick_times):
+    for i, (label, h, a) in enumerate(TIMER_QUICK_TIMES):
         btn = tk.Button(quick_buttons_frame, text=label,
                        command=lambda hour=h, ampm=a: set_quick_time(hour, ampm),
                        font=("Segoe UI", 9), bg="white", fg="#007bff",
@@ -1191,7 +1417,7 @@ def add_timer_window(selected_uuid: str | None = None):
                        highlightbackground="#ddd", highlightcolor="#007bff",
                        padx=12, pady=5, cursor="hand2",
                        activebackground="#f0f7ff", activeforeground="#0056b3")
-        btn.pack(side="left", padx=(0, 8) if i < len(quick_times) - 1 else (0, 0))
+        btn.pack(side="left", padx=(0, 8) if i < len(TIMER_QUICK_TIMES) - 1 else (0, 0))
     
     # Status label (hidden initially)
     status_label = tk.Label(container, text="", bg="#f5f7fa", font=("Segoe UI", 10))
@@ -1225,7 +1451,7 @@ def add_timer_window(selected_uuid: str | None = None):
             if selected_uuid in todo_data:
                 todo_data[selected_uuid]["deadline"] = deadline_raw
                 refresh_todo_tree(selection_uuid=selected_uuid)
-                persist_todos_to_db(list(todo_tree.get_children()))
+                update_todo_row(selected_uuid)
                 update_status_bar()
                 timer_window.destroy()
             else:
@@ -1265,52 +1491,72 @@ def add_timer_window(selected_uuid: str | None = None):
     date_entry.focus_set()
     date_entry.select_range(0, tk.END)
 
+# One player thread for alerts; a queue of one so a burst of overdue rows plays once
+_sound_jobs = queue.Queue(maxsize=1)
+_sound_player = None
+
+def _play_overdue_async():
+    """Ask the player thread for the overdue sound; dropped if one is already pending."""
+    global _sound_player
+    if _sound_player is None:
+        _sound_player = threading.Thread(target=_sound_player_loop, daemon=True)
+        _sound_player.start()
+    try:
+        _sound_jobs.put_nowait(None)
+    except queue.Full:
+        pass
+
+def _sound_player_loop():
+    while True:
+        _sound_jobs.get()
+        try:
+            if OVERDUE_WAV:
+                winsound.PlaySound(OVERDUE_WAV, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+            elif HAS_OVERDUE_SOUND:
+                playsound(OVERDUE_SOUND, block=True)
+            elif winsound:
+                winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
+        except Exception:
+            try:
+                if winsound:
+                    winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
+            except Exception:
+                pass
+
 def update_timers():
     """Update timer displays and check for overdue tasks"""
-    global blink_state
     # Update table rows (time-left column + color tags) and beep on first overdue
+    shown = {}
     if "todo_tree" in globals():
-        for uuid_val in list(todo_tree.get_children()):
+        # Done rows and rows without a deadline never change on their own
+        for uuid_val in list(_timed_todos):
             row = todo_data.get(uuid_val)
             if not row:
+                _timed_todos.discard(uuid_val)  # deleted since the last redraw
                 continue
             deadline_raw = str(row.get("deadline") or "")
             done_bool = bool(row.get("done"))
             left, tag = _format_time_left(deadline_raw, done_bool)
 
-            # Update row values if needed (keeps time left fresh)
-            values = list(todo_tree.item(uuid_val, "values"))
-            # values = [status, task, created, deadline, left]
-            if len(values) == 5:
-                values[0] = "✅" if done_bool else "☐"
-                values[1] = str(row.get("task") or "")
-                values[2] = _format_created_display(str(row.get("created_at") or ""))
-                values[3] = _format_deadline_display(deadline_raw)
-                values[4] = left
-                todo_tree.item(uuid_val, values=values, tags=(tag,))
+            # Only touch the row when something it shows has changed (a
+            # deadline days away only moves once an hour)
+            key = (left, tag, done_bool, row.get("task"), deadline_raw, row.get("created_at"))
+            if _timer_row_keys.get(uuid_val) != key:
+                todo_tree.item(uuid_val, values=todo_tree_row(uuid_val)[0], tags=(tag,))
+            shown[uuid_val] = key
 
             # Sound on overdue (once per uuid)
             if tag == "overdue" and not done_bool:
                 if uuid_val not in overdue_sound_played:
-                    try:
-                        sound_file = resource_path("assets", "overdue.mp3")
-                        if os.path.exists(sound_file):
-                            threading.Thread(target=lambda: playsound(sound_file, block=False), daemon=True).start()
-                        elif winsound:
-                            winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
-                    except Exception:
-                        try:
-                            if winsound:
-                                winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
-                        except Exception:
-                            pass
+                    _play_overdue_async()
                     overdue_sound_played.add(uuid_val)
     
-    # Toggle blink state for next update
-    blink_state = not blink_state
-    
-    # Schedule next update in 1 second for blinking effect and 30 seconds for timer updates
-    root.after(1000, update_timers)
+    _timer_row_keys.clear()
+    _timer_row_keys.update(shown)
+
+    # Deadlines are minute-precise and time left is shown in whole minutes, so
+    # nothing changes between minute boundaries: run just after the next one
+    root.after(60050 - int(time.time() * 1000) % 60000, update_timers)
 
 # ----------- MAIN FUNCTIONS -----------
 def open_website(url):
@@ -1334,7 +1580,7 @@ def add_todo():
             "order_index": len(todo_data),
         }
         refresh_todo_tree(selection_uuid=uuid_val)
-        persist_todos_to_db(list(todo_tree.get_children()))
+        insert_todo_row(uuid_val)
         todo_entry.delete(0, tk.END)
         update_status_bar()
         try:
@@ -1350,8 +1596,8 @@ def toggle_task(event=None, selected_uuid=None):
         row["done"] = not bool(row.get("done"))
         row["done_at"] = now_ts() if row["done"] else ""
         todo_data[uuid_val] = row
-        refresh_todo_tree(selection_uuid=uuid_val)
-        persist_todos_to_db(list(todo_tree.get_children()))
+        refresh_todo_row(uuid_val)
+        update_todo_row(uuid_val)
         update_status_bar()
 
 def delete_task(selected_uuid=None):
@@ -1362,7 +1608,7 @@ def delete_task(selected_uuid=None):
             todo_tree.delete(uuid_val)
         except Exception:
             pass
-        persist_todos_to_db(list(todo_tree.get_children()))
+        delete_todo_row(uuid_val)
         update_status_bar()
     else:
         messagebox.showinfo("No Selection", "Please select a task to delete.")
@@ -1371,34 +1617,50 @@ def on_todo_select(event):
     """Treeview handles selection highlighting; keep for compatibility."""
     return
 
+def _select_adjacent_todo(step: int):
+    """Select the row above (-1) or below (1) the selected one; prev/next avoid listing every row."""
+    sel = get_selected_todo_uuid()
+    if not sel:
+        return
+    target = todo_tree.prev(sel) if step < 0 else todo_tree.next(sel)
+    if target:
+        todo_tree.selection_set(target)
+        todo_tree.see(target)
+
+_TODO_KEYS = {
+    'Return': add_todo,
+    'Delete': delete_task,
+    'space': toggle_task,
+    'Up': lambda: _select_adjacent_todo(-1),
+    'Down': lambda: _select_adjacent_todo(1),
+}
+
 def on_todo_key(event):
     """Handle keyboard shortcuts for todo list"""
-    if event.keysym == 'Return':
-        add_todo()
-    elif event.keysym == 'Delete':
-        delete_task()
-    elif event.keysym == 'space':
-        toggle_task()
-    elif event.keysym == 'Up':
-        if "todo_tree" in globals():
-            sel = get_selected_todo_uuid()
-            children = list(todo_tree.get_children())
-            if sel in children:
-                idx = children.index(sel)
-                if idx > 0:
-                    todo_tree.selection_set(children[idx - 1])
-                    todo_tree.see(children[idx - 1])
-    elif event.keysym == 'Down':
-        if "todo_tree" in globals():
-            sel = get_selected_todo_uuid()
-            children = list(todo_tree.get_children())
-            if sel in children:
-                idx = children.index(sel)
-                if idx < len(children) - 1:
-                    todo_tree.selection_set(children[idx + 1])
-                    todo_tree.see(children[idx + 1])
+    action = _TODO_KEYS.get(event.keysym)
+    if action:
+        action()
+
+# Add Link / Add Note dialogs are built once, then withdrawn and re-shown: (window, reset)
+_link_dialog = None
+_note_dialog = None
+
+def _show_cached_dialog(dialog, width, height) -> bool:
+    """Re-show a cached dialog with its fields reset; False if it has to be built first."""
+    if dialog is None or not dialog[0].winfo_exists():
+        return False
+    window, reset = dialog
+    reset()
+    center_window_relative_to_parent(window, width, height)
+    window.deiconify()
+    window.lift()
+    window.grab_set()
+    return True
 
 def add_link_window():
+    global _link_dialog
+    if _show_cached_dialog(_link_dialog, 480, 450):
+        return
     link_window = tk.Toplevel(root)
     # Create hidden first to avoid visible "jump" animation, then center and show
     link_window.withdraw()
@@ -1483,7 +1745,7 @@ def add_link_window():
         try:
             save_link(name, url)
             refresh_links()
-            link_window.destroy()
+            close()
         except Exception as e:
             status_label.config(text=f"❌ Error: {str(e)}", fg="#dc3545", bg="#f5f7fa")
             status_label.pack(pady=(0, 15))
@@ -1492,7 +1754,7 @@ def add_link_window():
     button_frame = tk.Frame(container, bg="#f5f7fa")
     button_frame.pack(fill="x", pady=(15, 0))
     
-    cancel_btn = tk.Button(button_frame, text="Cancel", command=link_window.destroy,
+    cancel_btn = tk.Button(button_frame, text="Cancel", command=lambda: close(),
               bg="white", fg="#666", font=("Segoe UI", 10),
               relief="flat", bd=1, highlightthickness=1,
               highlightbackground="#ddd", padx=16, pady=8,
@@ -1508,30 +1770,58 @@ def add_link_window():
     # Bind Enter key to save
     link_window.bind('<Return>', lambda e: save())
     
+    def close():
+        link_window.grab_release()
+        link_window.withdraw()
+    
+    def reset():
+        for entry, placeholder in ((name_entry, "Enter link name..."), (url_entry, "Enter URL...")):
+            entry.delete(0, tk.END)
+            entry.insert(0, placeholder)
+            entry.config(fg="#aaa")
+        status_label.config(text="")
+        name_entry.focus_set()
+    
+    link_window.protocol("WM_DELETE_WINDOW", close)
+    _link_dialog = (link_window, reset)
+    
     # Focus on name entry
     name_entry.focus_set()
 
+# Link rows in listbox order, rebuilt by refresh_links and reordered by Move Up/Down.
+# Rows are looked up by index because several links can share a display name.
+_link_rows: list = []
+
 def refresh_links():
-    links_listbox.delete(0, tk.END)
-    links = load_links()
-    for link_id, name, url, order_index in links:
-        links_listbox.insert(tk.END, f"🌐 {name}")
-        
-        # Bind click event to open URL
-        def open_link(event, url=url):
-            open_website(url)
-        
-        # Bind double-click to open link
-        links_listbox.bind("<Double-Button-1>", lambda e, url=url: open_website(url))
-        
-        # Add right-click menu for delete
-        def create_popup(link_id):
-            popup = tk.Menu(links_listbox, tearoff=0)
-            popup.add_command(label="Delete", command=lambda: delete_and_refresh_link(link_id))
-            return popup
-        
-        popup = create_popup(link_id)
-        links_listbox.bind("<Button-3>", lambda e, p=popup: p.tk_popup(e.x_root, e.y_root))
+    """Refill the links listbox through its listvariable; the click bindings are set up once.
+    A no-op when no link changed since the last refill (e.g. an auto-sync that downloaded nothing)."""
+    global _link_rows, _links_dirty
+    if not _links_dirty:
+        return
+    # Cleared before reading, so a change that lands meanwhile marks it again
+    _links_dirty = False
+    _link_rows = list(load_links())
+    links_items.set(tuple(f"🌐 {link.name}" for link in _link_rows))
+
+def _link_row_id(index):
+    return _link_rows[index].id if 0 <= index < len(_link_rows) else None
+
+def _link_under_mouse(event):
+    if not links_listbox.size():
+        return None
+    index = links_listbox.nearest(event.y)
+    return _link_rows[index] if 0 <= index < len(_link_rows) else None
+
+def on_link_double_click(event):
+    link = _link_under_mouse(event)
+    if link:
+        open_website(link.url)
+
+def on_link_right_click(event):
+    link = _link_under_mouse(event)
+    if link:
+        links_popup.entryconfigure(0, command=lambda: delete_and_refresh_link(link.id))
+        links_popup.tk_popup(event.x_root, event.y_root)
 
 def delete_and_refresh_link(link_id):
     if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this link?"):
@@ -1539,6 +1829,9 @@ def delete_and_refresh_link(link_id):
         refresh_links()
 
 def add_note_window():
+    global _note_dialog
+    if _show_cached_dialog(_note_dialog, 600, 500):
+        return
     note_window = tk.Toplevel(root)
     # Create hidden first to avoid visible "jump" animation, then center and show
     note_window.withdraw()
@@ -1582,25 +1875,32 @@ def add_note_window():
         title = title_entry.get().strip()
         content = content_text.get("1.0", tk.END).strip()
         if title and content:
-            save_note(title, content)
-            refresh_notes()
-            note_window.destroy()
+            show_note_row(save_note(title, content), title)
+            close()
     
     save_btn = tk.Button(btn_frame, text="Save Note",
                         command=save, bg="#28a745", fg="white",
                         font=("Segoe UI", 9, "bold"),
                         padx=14, pady=6)
     save_btn.pack(side="right")
+    
+    def close():
+        note_window.grab_release()
+        note_window.withdraw()
+    
+    def reset():
+        title_entry.delete(0, tk.END)
+        title_entry.insert(0, "Enter note title...")
+        title_entry.config(fg="#aaa")
+        content_text.delete("1.0", tk.END)
+        content_text.insert("1.0", "Enter your note content...")
+    
+    note_window.protocol("WM_DELETE_WINDOW", close)
+    _note_dialog = (note_window, reset)
 
 def edit_note_window(note_id):
     """Open edit window for an existing note"""
-    notes = get_all_notes()
-    note_data = None
-    for note in notes:
-        if note[0] == note_id:
-            note_data = note
-            break
-    
+    note_data = get_note(note_id)
     if not note_data:
         messagebox.showerror("Error", "Note not found.")
         return
@@ -1633,14 +1933,11 @@ def edit_note_window(note_id):
     
     scrollable_frame.bind("<Configure>", on_frame_configure)
     
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
     
     def on_canvas_configure(event):
-        canvas_width = event.width
-        canvas_window = canvas.find_all()
-        if canvas_window:
-            canvas.itemconfig(canvas_window[0], width=canvas_width)
+        canvas.itemconfig(canvas_window, width=event.width)
     
     canvas.bind("<Configure>", on_canvas_configure)
     
@@ -1684,7 +1981,7 @@ def edit_note_window(note_id):
                           insertbackground="#333", highlightthickness=1,
                           highlightbackground="#ddd", highlightcolor="#007bff")
     title_entry.pack(fill="x", ipady=12)
-    title_entry.insert(0, note_data[1])  # note_data[1] is the title
+    title_entry.insert(0, note_data.title)
     
     # Content section
     content_section = tk.Frame(container, bg="#f5f7fa")
@@ -1709,7 +2006,7 @@ def edit_note_window(note_id):
     content_text.config(yscrollcommand=text_scrollbar.set)
     
     # Insert current note content
-    content_text.insert("1.0", note_data[2])  # note_data[2] is the content
+    content_text.insert("1.0", note_data.content)
     
     # Status label (for errors)
     status_label = tk.Label(container, text="", bg="#f5f7fa", font=("Segoe UI", 10))
@@ -1731,7 +2028,7 @@ def edit_note_window(note_id):
         
         try:
             update_note(note_id, title, content)
-            refresh_notes()
+            show_note_row(note_id, title)
             edit_window.destroy()
         except Exception as e:
             status_label.config(text=f"❌ Error: {str(e)}", fg="#dc3545", bg="#f5f7fa")
@@ -1773,105 +2070,148 @@ def edit_note_window(note_id):
     title_entry.select_range(0, tk.END)
 
 def refresh_notes():
-    notes_listbox.delete(0, tk.END)
-    notes = get_all_notes()
-    for note in notes:
-        note_frame = tk.Frame(notes_listbox, bg="#f8f9fa")
-        notes_listbox.insert(tk.END, f"{note[0]} - {note[1]}")
-        
-        # Add right-click menu for edit and delete
-        def create_popup(note_id):
-            popup = tk.Menu(notes_listbox, tearoff=0)
-            popup.add_command(label="Edit", command=lambda: edit_note_window(note_id))
-            popup.add_separator()
-            popup.add_command(label="Delete", command=lambda: delete_and_refresh_note(note_id))
-            return popup
-        
-        popup = create_popup(note[0])
-        notes_listbox.bind("<Button-3>", lambda e, p=popup: p.tk_popup(e.x_root, e.y_root))
+    """Refill the notes listbox through its listvariable; the right-click menu is set up once.
+    A no-op when no note changed since the last refill."""
+    global _notes_dirty
+    if not _notes_dirty:
+        return
+    _notes_dirty = False
+    notes_items.set(tuple(f"{note.id} - {note.title}" for note in get_all_notes()))
+
+def _note_row_index(note_id):
+    """Listbox index of a note's row, or None. Rows are found by their "<id> - " prefix,
+    so this stays right after Move Up/Down reorder the listbox."""
+    prefix = f"{note_id} - "
+    for idx, text in enumerate(notes_listbox.get(0, tk.END)):
+        if text.startswith(prefix):
+            return idx
+    return None
+
+def _note_row_id(text):
+    """Note id from a row's "<id> - " prefix."""
+    try:
+        return int(text.partition(" - ")[0])
+    except ValueError:
+        return None
+
+def show_note_row(note_id, title):
+    """Update one note's row in place, or append it (new notes sort last)."""
+    idx = _note_row_index(note_id)
+    if idx is None:
+        notes_listbox.insert(tk.END, f"{note_id} - {title}")
+    else:
+        notes_listbox.delete(idx)
+        notes_listbox.insert(idx, f"{note_id} - {title}")
+
+def remove_note_row(note_id):
+    idx = _note_row_index(note_id)
+    if idx is not None:
+        notes_listbox.delete(idx)
+
+def on_note_right_click(event):
+    if not notes_listbox.size():
+        return
+    note_id = _note_row_id(notes_listbox.get(notes_listbox.nearest(event.y)))
+    if note_id is None:
+        return
+    notes_popup.entryconfigure(0, command=lambda: edit_note_window(note_id))
+    notes_popup.entryconfigure(2, command=lambda: delete_and_refresh_note(note_id))
+    notes_popup.tk_popup(event.x_root, event.y_root)
 
 def delete_and_refresh_note(note_id):
     if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this note?"):
         delete_note(note_id)
-        refresh_notes()
+        remove_note_row(note_id)
 
 def view_note(event):
     selection = notes_listbox.curselection()
     if selection:
-        note_id = int(notes_listbox.get(selection[0]).split(" - ")[0])
-        notes = get_all_notes()
-        for note in notes:
-            if note[0] == note_id:
-                view_window = tk.Toplevel(root)
-                # Create hidden first to avoid visible "jump" animation, then center and show
-                view_window.withdraw()
-                view_window.title(note[1])
-                view_window.config(bg="white")
-                view_window.resizable(False, False)
-                
-                # Set icon for view window
-                set_window_icon(view_window)
-                
-                # Center window relative to main window
-                center_window_relative_to_parent(view_window, 600, 400)
-                view_window.deiconify()
-                
-                # Make modal
-                view_window.transient(root)
-                view_window.grab_set()
-                
-                # Add a container frame
-                container = tk.Frame(view_window, bg="white", padx=20, pady=10)
-                container.pack(fill="both", expand=True)
-                
-                # Title display
-                title_label = tk.Label(container, text=note[1], 
-                                     font=("Segoe UI", 16, "bold"),
-                                     bg="white", fg="#333")
-                title_label.pack(anchor="w", pady=(0, 10))
-                
-                # Content display
-                text_frame = tk.Frame(container, bg="white")
-                text_frame.pack(fill="both", expand=True)
-                
-                text = tk.Text(text_frame, wrap=tk.WORD, font=("Segoe UI", 11),
-                              padx=10, pady=10, relief="flat", bg="#f8f9fa")
-                text.pack(fill="both", expand=True)
-                text.insert("1.0", note[2])
-                text.config(state="disabled")
-                
-                # Button frame
-                btn_frame = tk.Frame(container, bg="white")
-                btn_frame.pack(fill="x", pady=(10, 0))
-                
-                def edit_current_note():
+        note_id = _note_row_id(notes_listbox.get(selection[0]))
+        note = get_note(note_id)
+        if note:
+            view_window = tk.Toplevel(root)
+            # Create hidden first to avoid visible "jump" animation, then center and show
+            view_window.withdraw()
+            view_window.title(note.title)
+            view_window.config(bg="white")
+            view_window.resizable(False, False)
+            
+            # Set icon for view window
+            set_window_icon(view_window)
+            
+            # Center window relative to main window
+            center_window_relative_to_parent(view_window, 600, 400)
+            view_window.deiconify()
+            
+            # Make modal
+            view_window.transient(root)
+            view_window.grab_set()
+            
+            # Add a container frame
+            container = tk.Frame(view_window, bg="white", padx=20, pady=10)
+            container.pack(fill="both", expand=True)
+            
+            # Title display
+            title_label = tk.Label(container, text=note.title, 
+                                 font=("Segoe UI", 16, "bold"),
+                                 bg="white", fg="#333")
+            title_label.pack(anchor="w", pady=(0, 10))
+            
+            # Content display
+            text_frame = tk.Frame(container, bg="white")
+            text_frame.pack(fill="both", expand=True)
+            
+            text = tk.Text(text_frame, wrap=tk.WORD, font=("Segoe UI", 11),
+                          padx=10, pady=10, relief="flat", bg="#f8f9fa")
+            text.pack(fill="both", expand=True)
+            text.insert("1.0", note.content)
+            text.config(state="disabled")
+            
+            # Button frame
+            btn_frame = tk.Frame(container, bg="white")
+            btn_frame.pack(fill="x", pady=(10, 0))
+            
+            def edit_current_note():
+                view_window.destroy()
+                edit_note_window(note_id)
+            
+            def delete_current_note():
+                if messagebox.askyesno("Confirm Delete", 
+                                     "Are you sure you want to delete this note?"):
+                    delete_note(note_id)
+                    remove_note_row(note_id)
                     view_window.destroy()
-                    edit_note_window(note_id)
-                
-                def delete_current_note():
-                    if messagebox.askyesno("Confirm Delete", 
-                                         "Are you sure you want to delete this note?"):
-                        delete_note(note_id)
-                        refresh_notes()
-                        view_window.destroy()
-                
-                edit_btn = tk.Button(btn_frame, text="Edit Note", 
-                                    command=edit_current_note,
-                                    bg="#007bff", fg="white",
-                                    font=("Segoe UI", 9),
-                                    padx=12, pady=4)
-                edit_btn.pack(side="left", padx=(0, 10))
-                
-                delete_btn = tk.Button(btn_frame, text="Delete Note", 
-                                     command=delete_current_note,
-                                     bg="#dc3545", fg="white",
-                                     font=("Segoe UI", 9),
-                                     padx=12, pady=4)
-                delete_btn.pack(side="right")
-                break
+            
+            edit_btn = tk.Button(btn_frame, text="Edit Note", 
+                                command=edit_current_note,
+                                bg="#007bff", fg="white",
+                                font=("Segoe UI", 9),
+                                padx=12, pady=4)
+            edit_btn.pack(side="left", padx=(0, 10))
+            
+            delete_btn = tk.Button(btn_frame, text="Delete Note", 
+                                 command=delete_current_note,
+                                 bg="#dc3545", fg="white",
+                                 font=("Segoe UI", 9),
+                                 padx=12, pady=4)
+            delete_btn.pack(side="right")
 
 # ----------- GUI SETUP -----------
-init_db()
+# Schema checks and the first todo read run while the widgets below are built
+_startup_todos = None
+_db_ready = threading.Event()
+
+def _startup_db():
+    global _startup_todos
+    try:
+        init_db()
+        _startup_todos = load_todos()
+    except Exception as e:
+        print(f"Startup DB error: {e}")
+    finally:
+        _db_ready.set()
+
+threading.Thread(target=_startup_db, daemon=True).start()
 settings = load_settings()
 root = tk.Tk()
 
@@ -1970,6 +2310,7 @@ def backup_database():
         )
         if not path:
             return
+        checkpoint_db()
         shutil.copy2(DB_NAME, path)
         messagebox.showinfo("Backup Complete", f"Database backup saved to:\n{path}")
     except Exception as e:
@@ -1988,7 +2329,10 @@ def restore_database():
     ):
         return
     try:
-        shutil.copy2(path, DB_NAME)
+        db_flush()
+        with _DB_LOCK:
+            close_db()
+            shutil.copy2(path, DB_NAME)
         init_db()
         load_todo_data_from_db()
         # Reload views
@@ -2026,14 +2370,11 @@ def open_settings_window():
     
     scrollable_frame.bind("<Configure>", on_frame_configure)
     
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
     
     def on_canvas_configure(event):
-        canvas_width = event.width
-        canvas_window = canvas.find_all()
-        if canvas_window:
-            canvas.itemconfig(canvas_window[0], width=canvas_width)
+        canvas.itemconfig(canvas_window, width=event.width)
     
     canvas.bind("<Configure>", on_canvas_configure)
     
@@ -2784,7 +3125,7 @@ def open_archive_window():
             deadline_display = _format_deadline_display(deadline or "")
             
             archive_tree.insert("", "end", iid=uuid_val, values=(
-                "✅", task or "", created_display, deadline_display, done_at_display, archived_at_display
+                TODO_DONE_MARK, task or "", created_display, deadline_display, done_at_display, archived_at_display
             ), tags=("done",))
         
         # Update count
@@ -2855,7 +3196,6 @@ def open_archive_window():
                     "deadline": deadline or "",
                     "done_at": "",
                     "created_at": created_at or now_ts(),
-                    "order_index": len(todo_data),
                 }
                 break
         
@@ -2864,21 +3204,15 @@ def open_archive_window():
             return
         
         if messagebox.askyesno("Restore Task", f"Restore task '{task_data['task']}' to active list?"):
-            conn = sqlite3.connect(DB_NAME)
-            c = conn.cursor()
-            
-            # Add back to todos
-            c.execute("""
-                INSERT INTO todos (uuid, task, done, deadline, done_at, created_at, order_index)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (uuid_val, task_data["task"], 0, task_data["deadline"], "", 
-                  task_data["created_at"], task_data["order_index"]))
-            
-            # Remove from archive
-            c.execute("DELETE FROM archive_todos WHERE uuid = ?", (uuid_val,))
-            
-            conn.commit()
-            conn.close()
+            with _DB_LOCK, get_db() as conn:
+                c = conn.cursor()
+                
+                # Add back to the end of todos (MAX(order_index) + 1, like any new task)
+                c.execute(SQL_INSERT_TODO, (uuid_val, task_data["task"], 0, task_data["deadline"], "",
+                                            task_data["created_at"]))
+                
+                # Remove from archive
+                c.execute("DELETE FROM archive_todos WHERE uuid = ?", (uuid_val,))
             
             # Refresh both lists
             load_todo_data_from_db()
@@ -2897,11 +3231,9 @@ def open_archive_window():
         uuid_val = selection[0]
         
         if messagebox.askyesno("Confirm Delete", "Permanently delete this archived task?"):
-            conn = sqlite3.connect(DB_NAME)
-            c = conn.cursor()
-            c.execute("DELETE FROM archive_todos WHERE uuid = ?", (uuid_val,))
-            conn.commit()
-            conn.close()
+            with _DB_LOCK, get_db() as conn:
+                c = conn.cursor()
+                c.execute("DELETE FROM archive_todos WHERE uuid = ?", (uuid_val,))
             refresh_archive()
             messagebox.showinfo("Success", "Task deleted permanently")
     
@@ -2992,16 +3324,32 @@ scrollbar = tk.Scrollbar(outer_frame, orient="vertical", command=main_canvas.yvi
 scrollable_frame = tk.Frame(main_canvas, bg="#eaf4fc")
 
 # Configure scrolling
+# The frame is the canvas' only item, so its size is the scroll region (no bbox query)
 scrollable_frame.bind(
     "<Configure>",
-    lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
+    lambda e: main_canvas.configure(scrollregion=(0, 0, e.width, e.height))
 )
 
-# Make canvas expand with window
+canvas_window = main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+
+# Make canvas expand with window. A drag-resize sends a burst of Configure events;
+# only the latest width is applied, once per idle pass, and height-only changes skip it
+_canvas_width = None  # width last applied to the frame
+_canvas_width_pending = None
+
+def _apply_canvas_width():
+    global _canvas_width, _canvas_width_pending
+    if _canvas_width_pending != _canvas_width:
+        _canvas_width = _canvas_width_pending
+        main_canvas.itemconfig(canvas_window, width=_canvas_width)
+    _canvas_width_pending = None
+
 def on_canvas_configure(e):
-    main_canvas.itemconfig(canvas_window, width=e.width)
+    global _canvas_width_pending
+    if _canvas_width_pending is None:
+        root.after_idle(_apply_canvas_width)
+    _canvas_width_pending = e.width
 main_canvas.bind('<Configure>', on_canvas_configure)
-canvas_window = main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
 
 # Pack scrollbar and canvas
 scrollbar.pack(side="right", fill="y")
@@ -3013,7 +3361,7 @@ class AnalogClock(tk.Canvas):
         self.size = size
         self.timezone_name = timezone_name
         self.timezone_str = timezone_str
-        self.timezone = pytz.timezone(timezone_str)
+        self.timezone = ZoneInfo(timezone_str)
         self.current_time = None
         self.tooltip = None
         
@@ -3279,20 +3627,30 @@ def update_datetime_visibility():
 # Initialize date/time visibility
 update_datetime_visibility()
 
+BD_TZ = ZoneInfo('Asia/Dhaka')
+_shown_day = _shown_time = None  # Date on date_label, string on time_label
+_AM_PM = ("AM", "PM")
+
 def update_datetime():
+    global _shown_day, _shown_time
     # Get Bangladesh time
-    bd_timezone = pytz.timezone('Asia/Dhaka')
-    bd_time = datetime.now(bd_timezone)
-    
-    # Update date in format: "Tuesday, July 29, 2025"
-    date_label.config(text=bd_time.strftime("%A, %B %d, %Y"))
+    bd_time = datetime.now(BD_TZ)
     
-    # Update time in 12-hour format: "11:30:45"
-    time_label.config(text=bd_time.strftime("%I:%M:%S %p"))
+    # Update date in format: "Tuesday, July 29, 2025" (formatted only when the day changes)
+    day = bd_time.date()
+    if day != _shown_day:
+        _shown_day = day
+        date_label.config(text=bd_time.strftime("%A, %B %d, %Y"))
     
+    # Update time in 12-hour format: "11:30:45 AM" (f-string, no strftime parse every second)
+    hour = bd_time.hour
+    time_str = f"{(hour - 1) % 12 + 1:02d}:{bd_time.minute:02d}:{bd_time.second:02d} {_AM_PM[hour >= 12]}"
+    if time_str != _shown_time:
+        _shown_time = time_str
+        time_label.config(text=time_str)
     
-    # Schedule the next update in 1000ms (1 second)
-    root.after(1000, update_datetime)
+    # Schedule the next update just after the next wall-clock second
+    root.after(max(50, 1000 - datetime.now().microsecond // 1000), update_datetime)
 
 # Main content frame
 main_frame = tk.Frame(scrollable_frame, bg="#eaf4fc")
@@ -3315,23 +3673,30 @@ tk.Button(links_title_frame, text="➕ Add New Link", command=add_link_window,
           padx=10, pady=4).pack(side="right")
 
 # Create links listbox for reordering
+# Listbox contents live in a Tcl list variable: a refresh replaces them in one set()
+links_items = tk.Variable(root, value=())
 links_listbox = create_scrolled_listbox(left_frame, 
+                          listvariable=links_items,
                           font=("Segoe UI", 13),
                           height=8, selectbackground="#007bff",
                           selectforeground="white", relief="flat",
                           bg="#f8f9fa",
                           padx=15, pady=(0,15))
+links_popup = tk.Menu(links_listbox, tearoff=0)
+links_popup.add_command(label="Delete")
+links_listbox.bind("<Double-Button-1>", on_link_double_click)
+links_listbox.bind("<Button-3>", on_link_right_click)
 
 # Add reorder buttons for links
 links_button_frame = tk.Frame(left_frame, bg="white")
 links_button_frame.pack(pady=(0, 10))
 
 tk.Button(links_button_frame, text="⬆️ Move Up", 
-          command=lambda: move_up(links_listbox, lambda x: None, update_link_order, []),
+          command=lambda: move_up(links_listbox, _link_row_id, swap_link_order, _link_rows),
           font=("Segoe UI", 9), bg="#6c757d", fg="white",
           padx=8, pady=4).pack(side="left", padx=5)
 tk.Button(links_button_frame, text="⬇️ Move Down", 
-          command=lambda: move_down(links_listbox, lambda x: None, update_link_order, []),
+          command=lambda: move_down(links_listbox, _link_row_id, swap_link_order, _link_rows),
           font=("Segoe UI", 9), bg="#6c757d", fg="white",
           padx=8, pady=4).pack(side="left", padx=5)
 
@@ -3429,6 +3794,7 @@ todo_tree.column("task", width=300, anchor="w", stretch=True)
 todo_tree.column("created", width=200, anchor="center", stretch=False)
 todo_tree.column("deadline", width=220, anchor="center", stretch=False)
 todo_tree.column("left", width=140, anchor="center", stretch=False)
+_configure_todo_tree_tags()  # tag colors persist, so set them once
 
 # Configure Treeview font to be larger
 style = ttk.Style()
@@ -3518,14 +3884,11 @@ def edit_selected_task(selected_uuid=None):
     
     scrollable_frame.bind("<Configure>", on_frame_configure)
     
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
     
     def on_canvas_configure(event):
-        canvas_width = event.width
-        canvas_window = canvas.find_all()
-        if canvas_window:
-            canvas.itemconfig(canvas_window[0], width=canvas_width)
+        canvas.itemconfig(canvas_window, width=event.width)
     
     canvas.bind("<Configure>", on_canvas_configure)
     
@@ -3811,7 +4174,7 @@ def edit_selected_task(selected_uuid=None):
             # Save to data structure
             todo_data[uuid_val] = row
             refresh_todo_tree(selection_uuid=uuid_val)
-            persist_todos_to_db(list(todo_tree.get_children()))
+            update_todo_row(uuid_val)
             update_status_bar()
             edit_window.destroy()
         except Exception as e:
@@ -3870,7 +4233,7 @@ def clear_selected_timer(selected_uuid=None):
     row["deadline"] = ""
     todo_data[uuid_val] = row
     refresh_todo_tree(selection_uuid=uuid_val)
-    persist_todos_to_db(list(todo_tree.get_children()))
+    update_todo_row(uuid_val)
 
 todo_menu.add_command(label="Toggle Done", command=toggle_task)
 todo_menu.add_command(label="Set Timer...", command=add_timer_with_check)
@@ -3974,7 +4337,7 @@ def move_todo_up():
         idx = children.index(sel)
         if idx > 0:
             todo_tree.move(sel, "", idx - 1)
-            persist_todos_to_db(list(todo_tree.get_children()))
+            swap_todo_order(sel, children[idx - 1])
 
 def move_todo_down():
     sel = get_selected_todo_uuid()
@@ -3985,7 +4348,7 @@ def move_todo_down():
         idx = children.index(sel)
         if idx < len(children) - 1:
             todo_tree.move(sel, "", idx + 1)
-            persist_todos_to_db(list(todo_tree.get_children()))
+            swap_todo_order(sel, children[idx + 1])
 
 tk.Button(button_frame, text="⬆️ Move Up", 
           command=move_todo_up,
@@ -4015,41 +4378,50 @@ tk.Button(title_frame, text="➕ Add New Note", command=add_note_window,
           bg="#007bff", fg="white", font=("Segoe UI", 9),
           padx=10, pady=4).pack(side="right")
 
+notes_items = tk.Variable(root, value=())
 notes_listbox = create_scrolled_listbox(notes_frame, 
+                          listvariable=notes_items,
                           font=("Segoe UI", 13),
                           height=8, selectbackground="#007bff",
                           selectforeground="white", relief="flat",
                           bg="#f8f9fa",
                           padx=15, pady=(0,15))
 notes_listbox.bind("<Double-Button-1>", view_note)
+notes_popup = tk.Menu(notes_listbox, tearoff=0)
+notes_popup.add_command(label="Edit")
+notes_popup.add_separator()
+notes_popup.add_command(label="Delete")
+notes_listbox.bind("<Button-3>", on_note_right_click)
 
 # Add reorder buttons for notes
 notes_button_frame = tk.Frame(notes_frame, bg="white")
 notes_button_frame.pack(pady=(0, 10))
 
 tk.Button(notes_button_frame, text="⬆️ Move Up", 
-          command=lambda: move_up(notes_listbox, lambda x: None, update_note_order, []),
+          command=lambda: move_up(notes_listbox, lambda i: _note_row_id(notes_listbox.get(i)), swap_note_order),
           font=("Segoe UI", 9), bg="#6c757d", fg="white",
           padx=8, pady=4).pack(side="left", padx=5)
 tk.Button(notes_button_frame, text="⬇️ Move Down", 
-          command=lambda: move_down(notes_listbox, lambda x: None, update_note_order, []),
+          command=lambda: move_down(notes_listbox, lambda i: _note_row_id(notes_listbox.get(i)), swap_note_order),
           font=("Segoe UI", 9), bg="#6c757d", fg="white",
           padx=8, pady=4).pack(side="left", padx=5)
 
-# Start timer updates immediately and then every 30 seconds
+# Start timer updates immediately and then at every minute boundary
 def start_timer_updates():
-    update_timers()  # Run immediately
-    # The update_timers function now schedules itself every 1 second for blinking
-
-# Load saved todos into the table
-load_todo_data_from_db()
+    update_timers()  # Run immediately; it reschedules itself
+
+# Load saved todos into the table (normally read already by _startup_db)
+_db_ready.wait()
+if _startup_todos is None:
+    # Background start failed: redo it here so any error surfaces as before
+    init_db()
+    load_todo_data_from_db()
+else:
+    load_todo_data_from_db(_startup_todos)
 refresh_todo_tree()
 
 update_status_bar()
 
-# Run initial timer update to format existing deadlines
-root.after(1000, update_timers)
-
 # Auto-select first task if available
 try:
     children = list(todo_tree.get_children())
@@ -4059,8 +4431,9 @@ try:
 except Exception:
     pass
 
-refresh_links()
-refresh_notes()
+# Links and notes are filled in once the window has painted
+root.after_idle(refresh_links)
+root.after_idle(refresh_notes)
 
 # Start timer updates
 start_timer_updates()
@@ -4107,46 +4480,12 @@ credit_link.bind("<Leave>", lambda e: credit_link.config(fg="#007bff"))
 
 # Test sound function for debugging
 def play_sound_background():
-    """Test function to debug sound playback"""
-    try:
-        sound_file = resource_path("assets", "overdue.mp3")
-        if os.path.exists(sound_file):
-            print(f"Testing sound playback: {sound_file}")  # Debug print
-            full_path = os.path.abspath(sound_file)
-            print(f"Full path: {full_path}")
-            
-            # Use threading to play sound in background
-            def play_sound_thread():
-                try:
-                    # Method 1: Try using playsound in background
-                    playsound(sound_file, block=False)
-                    print("Test: Sound should have played using playsound in background")
-                except Exception as e:
-                    print(f"Test: Playsound failed: {e}")
-                    try:
-                        # Method 2: Try using subprocess with start command
-                        subprocess.Popen(['start', full_path], shell=True, 
-                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        print("Test: Sound should have played using 'start' command")
-                    except Exception as e:
-                        print(f"Test: Start command failed: {e}")
-                        try:
-                            # Method 3: Fallback to system sound (Windows only)
-                            if winsound:
-                                winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
-                                print("Test: Sound should have played using winsound")
-                            else:
-                                print("Test: winsound not available on this platform")
-                        except Exception as e:
-                            print(f"Test: Winsound failed: {e}")
-                            pass
-            
-            # Start sound in background thread
-            threading.Thread(target=play_sound_thread, daemon=True).start()
-        else:
-            print(f"Test: Sound file not found: {sound_file}")
-    except Exception as e:
-        print(f"Test: Sound test error: {e}")
+    """Test function to debug sound playback: goes through the same player thread as overdue alerts"""
+    if HAS_OVERDUE_SOUND:
+        print(f"Testing sound playback: {OVERDUE_SOUND}")  # Debug print
+    else:
+        print(f"Test: Sound file not found: {OVERDUE_SOUND} (system alert instead)")
+    _play_overdue_async()
 
 # Add a test button for sound (temporary, for debugging)
 test_frame = tk.Frame(scrollable_frame, bg="#eaf4fc")